@@ -1,28 +1,42 @@
 /**
  * Claude Code SDK agent runner
  * Real implementation using @anthropic-ai/claude-agent-sdk
+ *
+ * Scaffold files shown in the prompt are read once per process.
  */
 
 import { query } from '@anthropic-ai/claude-agent-sdk';
-import { get_encoding } from 'tiktoken';
 import { MCPConfig, ScenarioSpec } from './types.js';
 import { Logger, appendJsonl } from './logger.js';
 import { resolveMcpConfig, validateMcpEnv } from './mcp-resolver.js';
 import { PATHS } from './constants.js';
+import { McpCallRecorder, MCPStats } from './mcp-recorder.js';
 import path from 'path';
-import fs from 'fs-extra';
 import { readFile } from 'fs/promises';
 
 export interface AgentStats {
   turns: number;
   tool_calls: number;
   elapsed_ms: number;
-  mcp_stats?: {
-    total_calls: number;
-    total_elapsed_ms: number;
-    total_input_tokens: number;
-    total_output_tokens: number;
-  };
+  input_tokens?: number;                 // Uncached input tokens
+  output_tokens?: number;
+  cache_creation_input_tokens?: number;  // Input tokens written to the prompt cache
+  cache_read_input_tokens?: number;      // Input tokens served from the prompt cache
+  mcp_stats?: MCPStats;
+}
+
+const scaffoldFiles: Map<string, Promise<string | null>> = new Map();
+
+/**
+ * Read a scaffold template file once per process; null if it doesn't exist
+ */
+function readScaffoldFile(relativePath: string): Promise<string | null> {
+  let content = scaffoldFiles.get(relativePath);
+  if (!content) {
+    content = readFile(path.join(PATHS.SCAFFOLD_TEMPLATE_DIR, relativePath), 'utf-8').catch(() => null);
+    scaffoldFiles.set(relativePath, content);
+  }
+  return content;
 }
 
 /**
@@ -47,16 +61,6 @@ export async function runAgent(
     throw new Error('CLAUDE_CODE_OAUTH_TOKEN environment variable not set');
   }
 
-  // Track MCP calls if MCP servers are configured
-  const mcpCalls: Array<{
-    timestamp: string;
-    tool: string;
-    tool_use_id: string;
-    input: any;
-    output?: any;
-    error?: string;
-    duration_ms?: number;
-  }> = [];
   const hasMcpServers = Object.keys(config.mcp_servers).length > 0;
 
   // Validate and resolve MCP configuration
@@ -79,6 +83,9 @@ export async function runAgent(
   let turnCount = 0;
   let toolCallCount = 0;
 
+  // Track MCP calls if MCP servers are configured; each is saved as it completes
+  const mcpRecorder = hasMcpServers ? new McpCallRecorder(workspaceDir, config, logger) : undefined;
+
   try {
     // Build MCP-specific instructions if MCP servers are configured
     const mcpServerNames = Object.keys(resolvedConfig.mcp_servers);
@@ -129,34 +136,23 @@ DO NOT rely on your own knowledge or make assumptions:
     projectContext += `\n**TypeScript**: ES2022 target, strict mode enabled\n`;
     projectContext += `**Build**: Run \`npm run build\` (uses tsc) to compile TypeScript\n`;
 
-    // Read scaffold files to show Agent the initial state
-    const fs = await import('fs-extra');
-    const scaffoldDir = await import('./constants.js').then(m => m.PATHS.SCAFFOLD_TEMPLATE_DIR);
-
+    // Show the scaffold files so the agent knows the initial state
     projectContext += `\n\n## Initial File Contents\n\n`;
 
-    // Show package.json
-    try {
-      const packageJson = await readFile(`${scaffoldDir}/package.json`, 'utf-8');
+    const [packageJson, logicTs, mainTs] = await Promise.all([
+      readScaffoldFile('package.json'),
+      readScaffoldFile('app/logic.ts'),
+      readScaffoldFile('app/main.ts'),
+    ]);
+    if (packageJson !== null) {
       projectContext += `### package.json (initial)\n\`\`\`json\n${packageJson}\n\`\`\`\n\n`;
-    } catch (e) {
-      // File doesn't exist, skip
     }
-
-    // Show app/logic.ts
-    try {
-      const logicTs = await readFile(`${scaffoldDir}/app/logic.ts`, 'utf-8');
+    if (logicTs !== null) {
       projectContext += `### app/logic.ts (template - implement the execute function)\n\`\`\`typescript\n${logicTs}\n\`\`\`\n\n`;
-    } catch (e) {
-      // File doesn't exist, skip
     }
-
-    // Show app/main.ts (read-only, for reference)
-    try {
-      const mainTs = await readFile(`${scaffoldDir}/app/main.ts`, 'utf-8');
+    if (mainTs !== null) {
+      // app/main.ts is read-only, for reference
       projectContext += `### app/main.ts (DO NOT EDIT - for reference only)\n\`\`\`typescript\n${mainTs}\n\`\`\`\n\n`;
-    } catch (e) {
-      // File doesn't exist, skip
     }
 
     // Read the full scenario YAML file
@@ -236,27 +232,13 @@ DO NOT rely on your own knowledge or make assumptions:
           logger.marker('>>>>> Agent Thinking');
 
           // Check for tool results in user messages
-          if (hasMcpServers && message.message?.content) {
+          if (mcpRecorder && message.message?.content) {
             for (const block of message.message.content) {
               // Type guard for tool_result blocks
-              if (typeof block !== 'string' && 'type' in block && block.type === 'tool_result') {
-                const mcpCall = mcpCalls.find(call =>
-                  'tool_use_id' in block && call.tool_use_id === block.tool_use_id
-                );
-                if (mcpCall && !mcpCall.output && !mcpCall.error) {
-                  const isError = 'is_error' in block && block.is_error;
-                  const content = 'content' in block ? block.content : undefined;
-
-                  if (isError) {
-                    mcpCall.error = typeof content === 'string'
-                      ? content
-                      : JSON.stringify(content);
-                  } else {
-                    mcpCall.output = content;
-                  }
-                  const callStart = new Date(mcpCall.timestamp).getTime();
-                  mcpCall.duration_ms = Date.now() - callStart;
-                }
+              if (typeof block !== 'string' && 'type' in block && block.type === 'tool_result' && 'tool_use_id' in block) {
+                const isError = 'is_error' in block && !!block.is_error;
+                const content = 'content' in block ? block.content : undefined;
+                mcpRecorder.complete(block.tool_use_id, content, isError);
               }
             }
           }
@@ -271,13 +253,8 @@ DO NOT rely on your own knowledge or make assumptions:
                 logger.marker(`>>>>> Agent Tool Use: ${block.name}`);
 
                 // Track MCP tool calls
-                if (hasMcpServers && block.name.startsWith('mcp__')) {
-                  mcpCalls.push({
-                    timestamp: new Date().toISOString(),
-                    tool: block.name,
-                    tool_use_id: block.id,
-                    input: block.input,
-                  });
+                if (mcpRecorder && block.name.startsWith('mcp__')) {
+                  mcpRecorder.start(block.id, block.name, block.input);
                 }
 
                 // Log tool use with more context
@@ -315,24 +292,28 @@ DO NOT rely on your own knowledge or make assumptions:
             logger.info(`Duration: ${(message.duration_ms / 1000).toFixed(1)}s`);
             logger.info(`API duration: ${(message.duration_api_ms / 1000).toFixed(1)}s`);
             logger.info(`Cost: $${message.total_cost_usd.toFixed(4)}`);
-            logger.info(`Input tokens: ${message.usage.input_tokens}`);
-            logger.info(`Output tokens: ${message.usage.output_tokens}`);
-
-            if (message.usage.cache_read_input_tokens) {
-              logger.info(`Cache read tokens: ${message.usage.cache_read_input_tokens}`);
-            }
-
-            // Calculate MCP statistics and save results if MCP was used
+            const usage = message.usage;
+            const cacheRead = usage.cache_read_input_tokens ?? 0;
+            const cacheCreation = usage.cache_creation_input_tokens ?? 0;
+            const totalInput = usage.input_tokens + cacheRead + cacheCreation;
+            logger.info(`Input tokens: ${usage.input_tokens}`);
+            logger.info(`Output tokens: ${usage.output_tokens}`);
+            logger.info(`Cache read tokens: ${cacheRead}, cache write tokens: ${cacheCreation} (${totalInput > 0 ? ((cacheRead / totalInput) * 100).toFixed(1) : '0.0'}% of input from cache)`);
+
+            // Wait for queued MCP writes and token counts, then write the summaries
             let mcpStats = undefined;
-            if (hasMcpServers && mcpCalls.length > 0) {
-              mcpStats = calculateMcpStats(mcpCalls, logger);
-              await saveMcpResults(workspaceDir, mcpCalls, config, logger);
+            if (mcpRecorder && mcpRecorder.size > 0) {
+              mcpStats = await mcpRecorder.finish();
             }
 
             return {
               turns: message.num_turns,
               tool_calls: toolCallCount,
               elapsed_ms: elapsed,
+              input_tokens: usage.input_tokens,
+              output_tokens: usage.output_tokens,
+              cache_creation_input_tokens: cacheCreation,
+              cache_read_input_tokens: cacheRead,
               mcp_stats: mcpStats,
             };
           } else {
@@ -356,224 +337,13 @@ DO NOT rely on your own knowledge or make assumptions:
     logger.error(`Error: ${error.message}`);
     logger.error(error.stack || '');
 
-    throw error;
-  }
-}
-
-/**
- * Count tokens in MCP data using tiktoken
- */
-function countMcpTokens(
-  data: any,
-  logger: Logger
-): number {
-  try {
-    // Extract text content from MCP data
-    let textContent = '';
-
-    if (Array.isArray(data)) {
-      // MCP returns array of content blocks
-      for (const block of data) {
-        if (block.type === 'text' && block.text) {
-          textContent += block.text;
-        }
-      }
-    } else if (typeof data === 'string') {
-      textContent = data;
-    } else if (data && typeof data === 'object') {
-      textContent = JSON.stringify(data);
-    }
-
-    if (!textContent) {
-      return 0;
-    }
-
-    // Use tiktoken with cl100k_base encoding (used by GPT-4 and Claude)
-    const encoding = get_encoding('cl100k_base');
-    const tokens = encoding.encode(textContent);
-    const tokenCount = tokens.length;
-    encoding.free(); // Free memory
-
-    return tokenCount;
-  } catch (error: any) {
-    logger.warn(`Failed to count MCP tokens: ${error.message}`);
-    return 0;
-  }
-}
-
-/**
- * Calculate MCP statistics from MCP calls
- */
-function calculateMcpStats(
-  mcpCalls: Array<{
-    timestamp: string;
-    tool: string;
-    tool_use_id: string;
-    input: any;
-    output?: any;
-    error?: string;
-    duration_ms?: number;
-  }>,
-  logger: Logger
-): { total_calls: number; total_elapsed_ms: number; total_input_tokens: number; total_output_tokens: number } {
-  const total_calls = mcpCalls.length;
-  const total_elapsed_ms = mcpCalls.reduce((sum, call) => sum + (call.duration_ms || 0), 0);
-
-  // Count tokens for all MCP inputs and outputs
-  let total_input_tokens = 0;
-  let total_output_tokens = 0;
-
-  for (const call of mcpCalls) {
-    // Count input tokens
-    if (call.input) {
-      const inputTokens = countMcpTokens(call.input, logger);
-      total_input_tokens += inputTokens;
-    }
-
-    // Count output tokens
-    if (call.output) {
-      const outputTokens = countMcpTokens(call.output, logger);
-      total_output_tokens += outputTokens;
-    }
-  }
-
-  logger.info(`MCP Stats: ${total_calls} calls, ${total_elapsed_ms}ms total, ${total_input_tokens} input tokens, ${total_output_tokens} output tokens`);
-
-  return {
-    total_calls,
-    total_elapsed_ms,
-    total_input_tokens,
-    total_output_tokens
-  };
-}
-
-/**
- * Save MCP call results to workspace
- */
-async function saveMcpResults(
-  workspaceDir: string,
-  mcpCalls: Array<{
-    timestamp: string;
-    tool: string;
-    tool_use_id: string;
-    input: any;
-    output?: any;
-    error?: string;
-    duration_ms?: number;
-  }>,
-  config: MCPConfig,
-  logger: Logger
-): Promise<void> {
-  const mcpDir = path.join(workspaceDir, 'mcp_results');
-  await fs.ensureDir(mcpDir);
-
-  // Create summary markdown
-  let summary = `# MCP Tool Calls Summary\n\n`;
-  summary += `**Configuration**: ${config.config_name}\n`;
-  summary += `**MCP Servers**: ${Object.keys(config.mcp_servers).join(', ')}\n`;
-  summary += `**Total Calls**: ${mcpCalls.length}\n`;
-  summary += `**Generated**: ${new Date().toISOString()}\n\n`;
-
-  summary += `---\n\n`;
-
-  // Group calls by tool
-  const callsByTool = mcpCalls.reduce((acc, call) => {
-    if (!acc[call.tool]) acc[call.tool] = [];
-    acc[call.tool].push(call);
-    return acc;
-  }, {} as Record<string, typeof mcpCalls>);
-
-  // Write summary
-  summary += `## Calls by Tool\n\n`;
-  for (const [tool, calls] of Object.entries(callsByTool)) {
-    summary += `### ${tool} (${calls.length} calls)\n\n`;
-
-    calls.forEach((call, idx) => {
-      summary += `#### Call ${idx + 1}\n\n`;
-      summary += `**Timestamp**: ${call.timestamp}\n`;
-      if (call.duration_ms) {
-        summary += `**Duration**: ${call.duration_ms}ms\n`;
-      }
-      summary += `\n**Input**:\n\`\`\`json\n${JSON.stringify(call.input, null, 2)}\n\`\`\`\n\n`;
-
-      if (call.error) {
-        summary += `**Error**:\n\`\`\`\n${call.error}\n\`\`\`\n\n`;
-      } else if (call.output) {
-        const outputStr = typeof call.output === 'string'
-          ? call.output
-          : JSON.stringify(call.output, null, 2);
-        summary += `**Output**:\n\`\`\`\n${outputStr}\n\`\`\`\n\n`;
-      } else {
-        summary += `**Output**: _(No response captured)_\n\n`;
-      }
-
-      summary += `---\n\n`;
-    });
-  }
-
-  // Write summary file
-  const summaryPath = path.join(mcpDir, 'summary.md');
-  await fs.writeFile(summaryPath, summary);
-  logger.info(`MCP results saved to ${mcpDir}/summary.md`);
-
-  // Write JSON for programmatic analysis
-  const jsonPath = path.join(mcpDir, 'calls.json');
-  await fs.writeJson(jsonPath, {
-    config: config.config_name,
-    servers: Object.keys(config.mcp_servers),
-    total_calls: mcpCalls.length,
-    calls: mcpCalls,
-    generated_at: new Date().toISOString()
-  }, { spaces: 2 });
-  logger.info(`MCP calls JSON saved to ${mcpDir}/calls.json`);
-
-  // Write individual markdown files for each call
-  for (let i = 0; i < mcpCalls.length; i++) {
-    const call = mcpCalls[i];
-    const callNum = i + 1;
-    const callFilePath = path.join(mcpDir, `call_${callNum}.md`);
-
-    let callMd = `# MCP Call ${callNum}\n\n`;
-    callMd += `**Tool**: ${call.tool}\n`;
-    callMd += `**Timestamp**: ${call.timestamp}\n`;
-    callMd += `**Tool Use ID**: ${call.tool_use_id}\n`;
-    if (call.duration_ms) {
-      callMd += `**Duration**: ${call.duration_ms}ms\n`;
-    }
-    callMd += `\n---\n\n`;
-
-    callMd += `## Input\n\n\`\`\`json\n${JSON.stringify(call.input, null, 2)}\n\`\`\`\n\n`;
-
-    callMd += `## Output\n\n`;
-
-    if (call.error) {
-      callMd += `**Error occurred:**\n\n\`\`\`\n${call.error}\n\`\`\`\n`;
-    } else if (call.output) {
-      // Extract text from output if it's an array with text blocks
-      let outputText = '';
-
-      if (Array.isArray(call.output)) {
-        // Output is an array of blocks with type and text
-        for (const block of call.output) {
-          if (block.type === 'text' && block.text) {
-            outputText += block.text + '\n\n';
-          }
-        }
-      } else if (typeof call.output === 'string') {
-        outputText = call.output;
-      } else if (typeof call.output === 'object' && call.output.text) {
-        outputText = call.output.text;
-      } else {
-        // Fallback: stringify the whole output
-        outputText = JSON.stringify(call.output, null, 2);
-      }
-
-      callMd += outputText.trim() + '\n';
-    } else {
-      callMd += `_(No response captured)_\n`;
+    // Keep the MCP calls made before the failure
+    if (mcpRecorder && mcpRecorder.size > 0) {
+      await mcpRecorder.finish().catch((saveError: any) => {
+        logger.error(`Failed to save MCP results: ${saveError.message}`);
+      });
     }
 
-    await fs.writeFile(callFilePath, callMd);
-    logger.info(`MCP call ${callNum} saved to ${mcpDir}/call_${callNum}.md`);
+    throw error;
   }
 }
@@ -0,0 +1,199 @@
+/**
+ * Content-addressed on-disk cache
+ * Entries live under .cache/<namespace>/<aa>/<sha256>.json and are keyed by a
+ * hash of the canonical JSON of their key parts. Expired entries are dropped on
+ * read; the namespace is trimmed to a byte budget by evicting least recently
+ * used entries (mtime is bumped on every hit).
+ */
+
+import crypto from 'crypto';
+import path from 'path';
+import fs from 'fs-extra';
+import { DEFAULTS, PATHS } from './constants.js';
+
+/**
+ * read  - serve hits from the cache, store misses
+ * write - always call through and refresh the cache
+ * off   - bypass the cache entirely
+ */
+export type CacheMode = 'read' | 'write' | 'off';
+
+export const CACHE_MODES: CacheMode[] = ['read', 'write', 'off'];
+
+export interface DiskCacheOptions {
+  namespace: string;
+  ttlMs?: number;
+  maxBytes?: number;
+  rootDir?: string;
+}
+
+interface CacheEntry<T> {
+  key: string;
+  created_at: number;
+  value: T;
+}
+
+/**
+ * Parse a --cache-mode style flag value
+ */
+export function parseCacheMode(value: string | undefined, flag: string = '--cache-mode'): CacheMode {
+  const mode = (value || 'off') as CacheMode;
+  if (!CACHE_MODES.includes(mode)) {
+    throw new Error(`Invalid ${flag} "${value}". Must be one of: ${CACHE_MODES.join(', ')}`);
+  }
+  return mode;
+}
+
+/**
+ * Stable JSON serialization (object keys sorted recursively)
+ */
+export function canonicalJson(value: unknown): string {
+  if (Array.isArray(value)) {
+    return `[${value.map(v => canonicalJson(v === undefined ? null : v)).join(',')}]`;
+  }
+  if (value && typeof value === 'object') {
+    const entries = Object.keys(value as Record<string, unknown>)
+      .filter(k => (value as Record<string, unknown>)[k] !== undefined)
+      .sort()
+      .map(k => `${JSON.stringify(k)}:${canonicalJson((value as Record<string, unknown>)[k])}`);
+    return `{${entries.join(',')}}`;
+  }
+  return JSON.stringify(value);
+}
+
+/**
+ * sha256 hex digest of a string or of the canonical JSON of a value
+ */
+export function hashContent(value: unknown): string {
+  const text = typeof value === 'string' ? value : canonicalJson(value);
+  return crypto.createHash('sha256').update(text).digest('hex');
+}
+
+export class DiskCache<T> {
+  private readonly dir: string;
+  private readonly ttlMs: number;
+  private readonly maxBytes: number;
+  private bytesSinceEviction = 0;
+  private eviction: Promise<void> | null = null;
+
+  constructor(options: DiskCacheOptions) {
+    this.dir = path.join(options.rootDir || PATHS.CACHE_DIR, options.namespace);
+    this.ttlMs = options.ttlMs ?? DEFAULTS.CACHE_TTL_HOURS * 60 * 60 * 1000;
+    this.maxBytes = options.maxBytes ?? DEFAULTS.CACHE_MAX_MB * 1024 * 1024;
+  }
+
+  /**
+   * Build a cache key from arbitrary key parts
+   */
+  static key(parts: unknown): string {
+    return hashContent(parts);
+  }
+
+  private entryPath(key: string): string {
+    return path.join(this.dir, key.substring(0, 2), `${key}.json`);
+  }
+
+  /**
+   * Look up an entry; returns undefined on miss, expiry or a corrupt file
+   */
+  async get(key: string): Promise<T | undefined> {
+    const file = this.entryPath(key);
+
+    let entry: CacheEntry<T>;
+    try {
+      entry = await fs.readJson(file);
+    } catch {
+      return undefined;
+    }
+
+    if (entry.key !== key || Date.now() - entry.created_at > this.ttlMs) {
+      await fs.remove(file).catch(() => {});
+      return undefined;
+    }
+
+    // Bump mtime so LRU eviction sees this entry as recently used
+    const now = new Date();
+    await fs.utimes(file, now, now).catch(() => {});
+    return entry.value;
+  }
+
+  /**
+   * Store an entry (atomic write so concurrent workers never see partial files)
+   */
+  async set(key: string, value: T): Promise<void> {
+    const file = this.entryPath(key);
+    const entry: CacheEntry<T> = { key, created_at: Date.now(), value };
+    const data = JSON.stringify(entry);
+
+    await fs.ensureDir(path.dirname(file));
+    const tmpFile = `${file}.${process.pid}.${crypto.randomBytes(4).toString('hex')}.tmp`;
+    await fs.writeFile(tmpFile, data);
+    await fs.rename(tmpFile, file);
+
+    // Only rescan the namespace once a meaningful share of the budget was written
+    this.bytesSinceEviction += data.length;
+    if (this.bytesSinceEviction > this.maxBytes / 10) {
+      this.bytesSinceEviction = 0;
+      await this.evict();
+    }
+  }
+
+  /**
+   * Drop expired entries, then least recently used ones until under maxBytes
+   */
+  async evict(): Promise<void> {
+    if (this.eviction) {
+      return this.eviction;
+    }
+
+    this.eviction = (async () => {
+      if (!await fs.pathExists(this.dir)) {
+        return;
+      }
+
+      const files: { file: string; size: number; mtimeMs: number }[] = [];
+      for (const shard of await fs.readdir(this.dir)) {
+        const shardDir = path.join(this.dir, shard);
+        let names: string[];
+        try {
+          names = await fs.readdir(shardDir);
+        } catch {
+          continue;
+        }
+        for (const name of names) {
+          if (!name.endsWith('.json')) continue;
+          const file = path.join(shardDir, name);
+          try {
+            const stat = await fs.stat(file);
+            files.push({ file, size: stat.size, mtimeMs: stat.mtimeMs });
+          } catch {
+            // Removed by a concurrent eviction
+          }
+        }
+      }
+
+      const now = Date.now();
+      let totalBytes = 0;
+      const live: typeof files = [];
+      for (const entry of files) {
+        if (now - entry.mtimeMs > this.ttlMs) {
+          await fs.remove(entry.file).catch(() => {});
+        } else {
+          live.push(entry);
+          totalBytes += entry.size;
+        }
+      }
+
+      live.sort((a, b) => a.mtimeMs - b.mtimeMs);
+      for (const entry of live) {
+        if (totalBytes <= this.maxBytes) break;
+        await fs.remove(entry.file).catch(() => {});
+        totalBytes -= entry.size;
+      }
+    })().finally(() => {
+      this.eviction = null;
+    });
+
+    return this.eviction;
+  }
+}
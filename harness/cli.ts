@@ -8,15 +8,27 @@ import chalk from 'chalk';
 import dotenv from 'dotenv';
 import path from 'path';
 import fs from 'fs-extra';
-import { CLIOptions, RunContext, ExecutionMode } from './types.js';
+import { CLIOptions, RunContext, ExecutionMode, WorkspaceMode, SummaryReport } from './types.js';
 import { EXIT_CODES, DEFAULTS } from './constants.js';
-import { loadScenario, listScenarios, getScenarioIds, listPackages, loadPackage, getPackageIds, getPackageScenarios } from './scenario-loader.js';
-import { loadConfig, listConfigs, getConfigNames } from './config-loader.js';
-import { runScenario } from './run-scenario.js';
-import { generateSummaryReport, saveSummaryReport, printSummaryReport, saveBenchmarkSummaryMarkdown, saveConfigSummaryMarkdown } from './report.js';
+import { loadScenario, listScenarios, getScenarioIds, listPackages, loadPackage, getPackageIds, getPackageScenarios, validateCatalog } from './scenario-loader.js';
+import { loadConfig, listConfigs } from './config-loader.js';
+import { runScenario, setReportUpdateListener } from './run-scenario.js';
+import { SummaryAggregator, saveSummaryReport, printSummaryReport, saveBenchmarkSummaryMarkdown, saveConfigSummaryMarkdown } from './report.js';
 import { runParallel, createRunContexts, printParallelSummary } from './parallel-runner.js';
 import Dockerode from 'dockerode';
-import { PortManager } from './port-manager.js';
+import { PortManager, parsePortRange } from './port-manager.js';
+import { setBuildParallelism } from './docker-service.js';
+import { ScheduleOrder, parseScheduleOrder, parsePoolLimits, setPoolLimits } from './scheduler.js';
+import { setTestConcurrency } from './test-runner.js';
+import { ContainerPool } from './container-pool.js';
+import { parseCacheMode, CacheMode } from './cache.js';
+import { ModelScheduler } from './model-scheduler.js';
+import { StageTimings, STAGE_TIMINGS_FILE, TRACE_FILE } from './tracing.js';
+import { waitForPendingEvaluations } from './evaluator.js';
+import { flushLogs, parseLogLevel, setLogLevel } from './logger.js';
+import { parseWorkspaceMode } from './workspace.js';
+import { RunManifest, ManifestEntry, getManifestPath } from './run-manifest.js';
+import { Shard, parseShard, inShard, shardTag, shardFileName, runShardWorkers } from './sharding.js';
 
 // Load environment variables
 dotenv.config();
@@ -39,12 +51,33 @@ program
   .option('--mode <type>', 'Execution mode: oneshot or agent (default: agent)', 'agent')
   .option('--config <name>', 'Configuration to use (baseline, context7, nia, deepcon)')
   .option('--all-configs', 'Run with all available configurations')
+  .option('--offline', 'With --all-configs, run the offline replay configs instead of the live ones')
   .option('--all-packages', 'Run all packages')
   .option('--run-id <id>', 'Unique identifier for this run (required)', generateRunId())
+  .option('--resume <runId>', 'Continue an interrupted run, skipping scenarios it already finished')
+  .option('--only-changed <runId>', 'Only run scenarios whose query, oracle or config changed since this run')
   .option('--max-workers <n>', 'Parallel execution limit', '1')
   .option('--timeout <seconds>', 'Timeout per scenario in seconds', DEFAULTS.TIMEOUT_SEC.toString())
   .option('--verbose', 'Detailed logging to stdout')
+  .option('--log-level <level>', 'Minimum level written to log files: debug, info, warn or error (default: LOG_LEVEL or debug)')
   .option('--output-dir <dir>', 'Custom reports directory', 'reports')
+  .option('--cache-mode <mode>', 'MCP tool result cache for oneshot mode: read, write or off', 'off')
+  .option('--eval-cache-mode <mode>', 'Evaluation verdict cache: read, write or off', 'off')
+  .option('--eval-concurrency <n>', 'Max in-flight evaluator calls per model', DEFAULTS.EVAL_CONCURRENCY.toString())
+  .option('--eval-rpm <n>', 'Max evaluator requests per minute per model', DEFAULTS.EVAL_REQUESTS_PER_MINUTE.toString())
+  .option('--eval-batch-size <n>', 'Scenarios packed into one evaluator request (1 = no batching)', '1')
+  .option('--eval-early-exit', 'Decide pass/fail as soon as the judge majority is reached (stragglers finish in background)')
+  .option('--port-range <start-end>', 'Host port range for service containers', `${DEFAULTS.PORT_RANGE_START}-${DEFAULTS.PORT_RANGE_END}`)
+  .option('--build-parallelism <n>', 'Max concurrent Docker image builds in agent mode', DEFAULTS.BUILD_PARALLELISM.toString())
+  .option('--test-concurrency <n>', 'Max concurrent test cases per scenario in agent mode', DEFAULTS.TEST_CONCURRENCY.toString())
+  .option('--workspace-mode <mode>', 'Scaffold materialization in agent mode: copy, reflink, hardlink or overlay', DEFAULTS.WORKSPACE_MODE)
+  .option('--warm-pool <n>', 'Reuse N warm containers for agent-mode tests instead of building an image per scenario (0 = off)', '0')
+  .option('--schedule <order>', 'Parallel task order: lpt (longest expected first) or fifo', DEFAULTS.SCHEDULE)
+  .option('--pool-limits <spec>', 'Concurrent stages per resource pool, e.g. llm=6,docker=3,mcp=12 (default: max-workers)')
+  .option('--shard <i/N>', 'Run only shard i of N of the (config, scenario) matrix; combine shards with --merge')
+  .option('--coordinator <n>', 'Run the matrix as N local shard processes, then merge their results')
+  .option('--merge', 'Build the summary reports for --run-id from the reports written by its shards')
+  .option('--mcp-pool-size <n>', 'MCP server connections per config in parallel oneshot runs (default: min(max-workers, 4))')
   .option('--list-packages', 'List all available packages and exit')
   .option('--list-scenarios', 'List all available scenarios and exit')
   .option('--list-configs', 'List all available configs and exit')
@@ -98,6 +131,103 @@ async function main() {
     process.exit(EXIT_CODES.CONFIG_ERROR);
   }
 
+  // Resume and incremental runs read the run manifest
+  if (options.resume && options.onlyChanged) {
+    console.error(chalk.red('Error: --resume and --only-changed cannot be combined\n'));
+    process.exit(EXIT_CODES.CONFIG_ERROR);
+  }
+  for (const runId of [options.resume, options.onlyChanged]) {
+    if (runId && !RunManifest.exists(runId)) {
+      console.error(chalk.red(`Error: No run manifest found for ${runId} (${getManifestPath(runId)})\n`));
+      process.exit(EXIT_CODES.CONFIG_ERROR);
+    }
+  }
+  if (options.resume) {
+    options.runId = options.resume;
+  }
+
+  // Validate cache and workspace modes
+  let cacheMode: CacheMode;
+  let evalCacheMode: CacheMode;
+  let workspaceMode: WorkspaceMode;
+  try {
+    cacheMode = parseCacheMode(options.cacheMode);
+    evalCacheMode = parseCacheMode(options.evalCacheMode, '--eval-cache-mode');
+    workspaceMode = parseWorkspaceMode(options.workspaceMode);
+  } catch (error: any) {
+    console.error(chalk.red(`Error: ${error.message}\n`));
+    process.exit(EXIT_CODES.CONFIG_ERROR);
+  }
+
+  // Validate log level
+  if (options.logLevel) {
+    const logLevel = parseLogLevel(options.logLevel);
+    if (!logLevel) {
+      console.error(chalk.red(`Error: Invalid --log-level "${options.logLevel}". Must be one of: debug, info, warn, error\n`));
+      process.exit(EXIT_CODES.CONFIG_ERROR);
+    }
+    setLogLevel(logLevel);
+  }
+
+  // Service container port range
+  try {
+    portManager.configure(parsePortRange(options.portRange || `${DEFAULTS.PORT_RANGE_START}-${DEFAULTS.PORT_RANGE_END}`));
+  } catch (error: any) {
+    console.error(chalk.red(`Error: ${error.message}\n`));
+    process.exit(EXIT_CODES.CONFIG_ERROR);
+  }
+
+  // Docker build concurrency (shared by all workers)
+  const buildParallelism = parseInt(options.buildParallelism || DEFAULTS.BUILD_PARALLELISM.toString());
+  if (!(buildParallelism > 0)) {
+    console.error(chalk.red('Error: --build-parallelism must be a positive integer\n'));
+    process.exit(EXIT_CODES.CONFIG_ERROR);
+  }
+  setBuildParallelism(buildParallelism);
+
+  // Test cases in flight per scenario
+  const testConcurrency = parseInt(options.testConcurrency || DEFAULTS.TEST_CONCURRENCY.toString());
+  if (!(testConcurrency > 0)) {
+    console.error(chalk.red('Error: --test-concurrency must be a positive integer\n'));
+    process.exit(EXIT_CODES.CONFIG_ERROR);
+  }
+  setTestConcurrency(testConcurrency);
+
+  // Task order and per-resource stage limits for parallel runs
+  let schedule: ScheduleOrder;
+  try {
+    schedule = parseScheduleOrder(options.schedule);
+    if (options.poolLimits) {
+      setPoolLimits(parsePoolLimits(options.poolLimits));
+    }
+  } catch (error: any) {
+    console.error(chalk.red(`Error: ${error.message}\n`));
+    process.exit(EXIT_CODES.CONFIG_ERROR);
+  }
+
+  // Warm container pool for agent-mode tests
+  const warmPoolSize = parseInt(options.warmPool || '0');
+  if (!(warmPoolSize >= 0)) {
+    console.error(chalk.red('Error: --warm-pool must be a non-negative integer\n'));
+    process.exit(EXIT_CODES.CONFIG_ERROR);
+  }
+  ContainerPool.getInstance().configure(options.mode === 'agent' ? warmPoolSize : 0);
+
+  // Shared evaluator scheduler (all workers in this process)
+  const evalConcurrency = parseInt(options.evalConcurrency || DEFAULTS.EVAL_CONCURRENCY.toString());
+  const evalRpm = parseInt(options.evalRpm || DEFAULTS.EVAL_REQUESTS_PER_MINUTE.toString());
+  const evalBatchSize = parseInt(options.evalBatchSize || '1');
+  if (!(evalConcurrency > 0) || !(evalRpm > 0) || !(evalBatchSize > 0)) {
+    console.error(chalk.red('Error: --eval-concurrency, --eval-rpm and --eval-batch-size must be positive integers\n'));
+    process.exit(EXIT_CODES.CONFIG_ERROR);
+  }
+  ModelScheduler.getInstance().configure({ maxConcurrency: evalConcurrency, requestsPerMinute: evalRpm });
+
+  // Check all scenario packages and oracle files in one pass
+  for (const problem of validateCatalog()) {
+    console.warn(chalk.yellow(`Warning: ${problem}`));
+  }
+
   // Determine scenarios to run
   const scenarioIds = getScenarioIdsToRun(options);
   if (scenarioIds.length === 0) {
@@ -112,18 +242,100 @@ async function main() {
     process.exit(EXIT_CODES.CONFIG_ERROR);
   }
 
+  // Sharded runs: one shard of the matrix, local shard processes, or merging their reports
+  if ([options.shard, options.coordinator, options.merge].filter(Boolean).length > 1) {
+    console.error(chalk.red('Error: --shard, --coordinator and --merge cannot be combined\n'));
+    process.exit(EXIT_CODES.CONFIG_ERROR);
+  }
+  let shard: Shard | undefined;
+  try {
+    shard = options.shard ? parseShard(options.shard) : undefined;
+  } catch (error: any) {
+    console.error(chalk.red(`Error: ${error.message}\n`));
+    process.exit(EXIT_CODES.CONFIG_ERROR);
+  }
+  const shardWorkers = parseInt(options.coordinator || '0');
+  if (options.coordinator && !(shardWorkers > 0)) {
+    console.error(chalk.red('Error: --coordinator must be a positive integer\n'));
+    process.exit(EXIT_CODES.CONFIG_ERROR);
+  }
+
+  if (options.merge) {
+    console.log(chalk.cyan(`▶ Merging shard results for ${options.runId}\n`));
+    const summary = await writeSummaries(new SummaryAggregator(options.runId, configNames, scenarioIds), configNames);
+    await flushLogs();
+    process.exit(hasFailedScenarios(summary) ? EXIT_CODES.FAILURE : EXIT_CODES.SUCCESS);
+  }
+
+  if (shardWorkers > 0) {
+    console.log(chalk.blue('━'.repeat(80)));
+    console.log(`Run ID: ${options.runId}`);
+    console.log(`Coordinator: ${shardWorkers} shard processes over ${scenarioIds.length * configNames.length} scenario runs`);
+    console.log(chalk.blue('━'.repeat(80)) + '\n');
+
+    // Each shard has its own evaluator scheduler, so the judge limits are split between them
+    if (shardWorkers > evalConcurrency || shardWorkers > evalRpm) {
+      console.warn(chalk.yellow(`Warning: ${shardWorkers} shards exceed --eval-concurrency ${evalConcurrency} or --eval-rpm ${evalRpm}; each shard still gets at least 1`));
+    }
+    const exits = await runShardWorkers(shardWorkers, options.runId, !!options.resume,
+      { concurrency: evalConcurrency, rpm: evalRpm });
+    const crashed = exits.filter(e => e.code !== EXIT_CODES.SUCCESS && e.code !== EXIT_CODES.FAILURE);
+    for (const e of crashed) {
+      console.log(chalk.red(`✗ ${shardTag(e.shard)} exited with code ${e.code}; rerun with --resume ${options.runId} to finish it`));
+    }
+
+    console.log(chalk.cyan('\n▶ Merging shard results\n'));
+    const summary = await writeSummaries(new SummaryAggregator(options.runId, configNames, scenarioIds), configNames);
+    await flushLogs();
+    if (crashed.length > 0) {
+      process.exit(EXIT_CODES.RUNTIME_ERROR);
+    }
+    process.exit(hasFailedScenarios(summary) || exits.some(e => e.code !== EXIT_CODES.SUCCESS) ? EXIT_CODES.FAILURE : EXIT_CODES.SUCCESS);
+  }
+
   // Run benchmark
   console.log(chalk.blue('━'.repeat(80)));
   console.log(`Run ID: ${options.runId}`);
   console.log(`Mode: ${chalk.cyan(mode)}`);
   console.log(`Scenarios: ${scenarioIds.join(', ')}`);
   console.log(`Configs: ${configNames.join(', ')}`);
+  if (shard) {
+    console.log(`Shard: ${chalk.cyan(`${shard.index}/${shard.count}`)}`);
+  }
+  if (cacheMode !== 'off' || evalCacheMode !== 'off') {
+    console.log(`Cache: tools=${chalk.cyan(cacheMode)}, evaluations=${chalk.cyan(evalCacheMode)}`);
+  }
+
+  // Journal finished scenarios; skip work that is done (--resume) or unchanged (--only-changed)
+  const manifest = RunManifest.open(options.runId, shard);
+  const reference = options.onlyChanged ? RunManifest.open(options.onlyChanged) : undefined;
+  const skipped: ManifestEntry[] = [];
+  const shouldRun = (context: RunContext): boolean => {
+    const done = options.resume ? manifest.findReusable(context) : undefined;
+    const unchanged = reference?.findReusable(context);
+    if (unchanged) {
+      manifest.recordReused(unchanged, reference!.runId);
+    }
+    const entry = done ?? unchanged;
+    if (entry) {
+      skipped.push(entry);
+    }
+    return !entry;
+  };
+
+  // Summary totals are updated as each scenario finishes
+  const aggregator = new SummaryAggregator(options.runId, configNames, scenarioIds);
+  // Background evaluations (--eval-early-exit) replace the report they finish for
+  setReportUpdateListener(report => aggregator.add(report));
 
   const maxWorkers = parseInt(options.maxWorkers?.toString() || '1');
   const useParallel = maxWorkers > 1 && (scenarioIds.length * configNames.length) > 1;
 
   if (useParallel) {
     console.log(chalk.cyan(`Workers: ${maxWorkers} (parallel mode)`));
+  } else if (evalBatchSize > 1) {
+    // One scenario at a time would only wait out the batch linger alone
+    console.warn(chalk.yellow('Warning: --eval-batch-size needs parallel workers; evaluating one scenario per request'));
   }
 
   console.log(chalk.blue('━'.repeat(80)) + '\n');
@@ -142,33 +354,48 @@ async function main() {
       options.verbose || false,
       true, // Always keep workspace
       loadScenario,
-      loadConfig
-    );
+      loadConfig,
+      { cacheMode, evalCacheMode, evalBatchSize, evalEarlyExit: options.evalEarlyExit || false, workspaceMode }
+    ).filter((_, position) => inShard(position, shard)).filter(shouldRun);
+    printSkipped(skipped, contexts.length);
 
-    const results = await runParallel(contexts, {
+    const results = contexts.length > 0 ? await runParallel(contexts, {
       maxWorkers,
       verbose: options.verbose || false,
-    });
+      mcpPoolSize: options.mcpPoolSize ? Math.max(1, parseInt(options.mcpPoolSize)) : undefined,
+      schedule,
+      onResult: (context, result) => {
+        manifest.record(context, result.report, result.error);
+        if (result.report) {
+          aggregator.add(result.report);
+        }
+      },
+    }) : [];
 
     hasFailures = results.some(r => !r.success);
 
     printParallelSummary(results);
   } else {
-    // Sequential execution
+    // Sequential execution (same task order as createRunContexts, for sharding)
+    let position = 0;
     for (const configName of configNames) {
       console.log(chalk.cyan(`\n▶ Running config: ${configName}\n`));
 
       const config = loadConfig(configName);
 
       for (const scenarioId of scenarioIds) {
+        if (!inShard(position++, shard)) {
+          continue;
+        }
         console.log(chalk.yellow(`  ▶ Scenario: ${scenarioId}`));
 
+        let context: RunContext | undefined;
         try {
           const scenario = loadScenario(scenarioId);
           const workspaceDir = path.join('workspace', options.runId, mode, configName, scenarioId);
           const logDir = path.join('logs', 'run_evaluation', options.runId, mode, configName, scenarioId);
 
-          const context: RunContext = {
+          context = {
             scenario,
             config,
             mode,
@@ -178,14 +405,26 @@ async function main() {
             timeout: parseInt(options.timeout?.toString() || DEFAULTS.TIMEOUT_SEC.toString()),
             verbose: options.verbose || false,
             keepWorkspace: true, // Always keep workspace
+            cacheMode,
+            evalCacheMode,
+            evalBatchSize: 1,
+            evalEarlyExit: options.evalEarlyExit || false,
+            workspaceMode,
           };
 
+          if (!shouldRun(context)) {
+            console.log(chalk.gray('    ↷ Skipped (already done or unchanged)\n'));
+            continue;
+          }
+
           // Show progress steps even without verbose
           if (!options.verbose) {
             process.stdout.write(chalk.gray('    [1/8] Loading... '));
           }
 
           const report = await runScenario(context);
+          manifest.record(context, report);
+          aggregator.add(report);
 
           if (!options.verbose) {
             // Clear the progress line completely with spaces
@@ -200,41 +439,74 @@ async function main() {
           }
         } catch (error: any) {
           hasFailures = true;
+          if (context) {
+            manifest.record(context, undefined, error.message);
+          }
           console.log(chalk.red(`    ✗ ERROR: ${error.message}\n`));
         }
       }
     }
   }
 
+  // Results carried over from the manifest count toward the exit code
+  if (skipped.some(entry => entry.pass_rate !== 1)) {
+    hasFailures = true;
+  }
+
+  // Let background judge calls (--eval-early-exit) land before summarizing
+  await waitForPendingEvaluations();
+
+  printEvaluatorMetrics(options.runId, shard);
+  printPortMetrics();
+  printStageTimings(options.runId, shard);
+
   // Generate summary report if multiple scenarios/configs
-  if (scenarioIds.length > 1 || configNames.length > 1) {
+  if (shard) {
+    // Other shards may still be running; the summary is built by --merge
+    console.log(chalk.gray(`\n${shardTag(shard)} done. Build the summary with --merge --run-id ${options.runId}`));
+  } else if (scenarioIds.length > 1 || configNames.length > 1) {
     console.log(chalk.cyan('\n▶ Generating summary report\n'));
+    await writeSummaries(aggregator, configNames);
+  }
 
-    const summary = generateSummaryReport(
-      options.runId,
-      configNames,
-      scenarioIds,
-      options.outputDir
-    );
-
-    saveSummaryReport(summary, options.outputDir);
-    printSummaryReport(summary);
+  await ContainerPool.getInstance().shutdown();
+  await flushLogs();
+  process.exit(hasFailures ? EXIT_CODES.FAILURE : EXIT_CODES.SUCCESS);
+}
 
-    // Generate markdown reports in workspace directory (always)
-    // Full benchmark report (if multiple configs)
-    if (configNames.length > 1) {
-      const benchReportPath = saveBenchmarkSummaryMarkdown(summary, options.runId, options.outputDir);
-      console.log(chalk.gray(`Benchmark summary: ${benchReportPath}`));
-    }
+/**
+ * Save and print the summary and its markdown reports
+ * Only reports the aggregator has not seen live (skipped, from earlier runs or
+ * from other shards) are read from disk
+ */
+async function writeSummaries(aggregator: SummaryAggregator, configNames: string[]): Promise<SummaryReport> {
+  await aggregator.loadMissing(options.outputDir);
+  const summary = aggregator.getSummary();
+
+  saveSummaryReport(summary, options.outputDir);
+  printSummaryReport(summary);
+
+  // Generate markdown reports in workspace directory (always)
+  // Full benchmark report (if multiple configs)
+  if (configNames.length > 1) {
+    const benchReportPath = saveBenchmarkSummaryMarkdown(summary, options.runId, aggregator);
+    console.log(chalk.gray(`Benchmark summary: ${benchReportPath}`));
+  }
 
-    // Config-specific reports
-    for (const configName of configNames) {
-      const configReportPath = saveConfigSummaryMarkdown(summary, configName, options.runId, options.outputDir);
-      console.log(chalk.gray(`${configName} summary: ${configReportPath}`));
-    }
+  // Config-specific reports
+  for (const configName of configNames) {
+    const configReportPath = saveConfigSummaryMarkdown(summary, configName, options.runId, aggregator);
+    console.log(chalk.gray(`${configName} summary: ${configReportPath}`));
   }
 
-  process.exit(hasFailures ? EXIT_CODES.FAILURE : EXIT_CODES.SUCCESS);
+  return summary;
+}
+
+/**
+ * Whether any scenario in the summary did not pass every test
+ */
+function hasFailedScenarios(summary: SummaryReport): boolean {
+  return Object.values(summary.configs).some(stats => stats.passed_scenarios < stats.total_scenarios);
 }
 
 /**
@@ -304,7 +576,7 @@ function listConfigsCommand() {
   }
 
   for (const config of configs) {
-    console.log(chalk.cyan(`  ${config.config_name}`));
+    console.log(chalk.cyan(`  ${config.config_name}`) + (config.offline ? chalk.gray(' (offline)') : ''));
     console.log(`    ${config.description}`);
     console.log(`    MCP servers: ${Object.keys(config.mcp_servers).join(', ') || 'none'}`);
     console.log();
@@ -393,12 +665,90 @@ function getConfigNamesToRun(options: CLIOptions): string[] {
   }
 
   if (options.allConfigs) {
-    return getConfigNames();
+    // Replay configs duplicate the live ones, so they only run when asked for
+    const offline = options.offline || false;
+    return listConfigs()
+      .filter(c => (c.offline || false) === offline)
+      .map(c => c.config_name);
   }
 
   return [];
 }
 
+/**
+ * Print service port allocation latency (agent mode only allocates ports)
+ */
+function printPortMetrics() {
+  const m = portManager.getMetrics();
+  if (m.allocations === 0 && m.failures === 0) {
+    return;
+  }
+
+  console.log(chalk.gray(
+    `Port allocation: ${m.allocations} ok / ${m.failures} failed, ` +
+    `avg ${m.avg_latency_ms}ms, p95 ${m.p95_latency_ms}ms, max ${m.max_latency_ms}ms ` +
+    `(${m.lock_conflicts} lock conflicts, ${m.busy_ports} busy, ${m.stale_locks} stale locks reclaimed)`
+  ));
+}
+
+/**
+ * Report how much work the run manifest let us skip
+ */
+function printSkipped(skipped: ManifestEntry[], toRun: number) {
+  if (skipped.length === 0) {
+    return;
+  }
+  const reason = options.resume ? `already finished in ${options.runId}` : `unchanged since ${options.onlyChanged}`;
+  console.log(chalk.cyan(`Skipped ${skipped.length} scenario(s) ${reason}; running ${toRun}\n`));
+}
+
+/**
+ * Print evaluator scheduler metrics and save them next to the run's workspace
+ */
+function printEvaluatorMetrics(runId: string, shard?: Shard) {
+  const metrics = ModelScheduler.getInstance().getMetrics();
+  if (metrics.length === 0) {
+    return;
+  }
+
+  console.log(chalk.cyan('\n▶ Evaluator call metrics\n'));
+  for (const m of metrics) {
+    console.log(
+      `  ${m.model.padEnd(30)} calls: ${m.completed} ok / ${m.failed} failed  ` +
+      `retries: ${m.retries} (429: ${m.rate_limited})  ` +
+      `wait: avg ${m.avg_wait_ms}ms, max ${m.max_wait_ms}ms  ` +
+      `max queue: ${m.max_queue_depth}  limit: ${m.concurrency_limit}`
+    );
+  }
+
+  const metricsPath = path.join('workspace', runId, shardFileName('eval_scheduler_metrics.json', shard));
+  fs.ensureDirSync(path.dirname(metricsPath));
+  fs.writeJsonSync(metricsPath, metrics, { spaces: 2 });
+}
+
+/**
+ * Print where scenario time went, by stage, and save it next to the run's workspace
+ */
+function printStageTimings(runId: string, shard?: Shard) {
+  const timings = StageTimings.getInstance().getTimings();
+  if (timings.length === 0) {
+    return;
+  }
+
+  console.log(chalk.cyan('\n▶ Stage timings\n'));
+  for (const t of timings) {
+    console.log(
+      `  ${t.stage.padEnd(16)} ${(t.total_ms / 1000).toFixed(1).padStart(8)}s  ${(t.share * 100).toFixed(1).padStart(5)}%  ` +
+      `n=${t.count}  avg ${Math.round(t.avg_ms)}ms, p50 ${Math.round(t.p50_ms)}ms, p95 ${Math.round(t.p95_ms)}ms, max ${Math.round(t.max_ms)}ms`
+    );
+  }
+
+  const timingsPath = path.join('workspace', runId, shardFileName(STAGE_TIMINGS_FILE, shard));
+  fs.ensureDirSync(path.dirname(timingsPath));
+  fs.writeJsonSync(timingsPath, timings, { spaces: 2 });
+  console.log(chalk.gray(`Per-scenario traces: logs/run_evaluation/${runId}/<mode>/<config>/<scenario>/${TRACE_FILE}`));
+}
+
 /**
  * Generate a unique run ID
  */
@@ -445,6 +795,8 @@ async function globalCleanup(): Promise<void> {
   console.log(chalk.yellow('\n\nCleaning up...'));
 
   try {
+    await ContainerPool.getInstance().shutdown();
+
     // Stop all running context-bench containers
     const containers = await docker.listContainers();
     const benchContainers = containers.filter(c =>
@@ -480,6 +832,7 @@ process.on('SIGINT', async () => {
 
   console.log(chalk.yellow('\n\nReceived SIGINT (Ctrl+C), cleaning up...'));
   await globalCleanup();
+  await flushLogs();
   process.exit(130); // Standard exit code for SIGINT
 });
 
@@ -489,14 +842,19 @@ process.on('SIGTERM', async () => {
 
   console.log(chalk.yellow('\n\nReceived SIGTERM, cleaning up...'));
   await globalCleanup();
+  await flushLogs();
   process.exit(143); // Standard exit code for SIGTERM
 });
 
 // Clean up orphan containers from previous runs before starting
-await cleanupOrphanContainers();
+// (shards leave this to the coordinator so they don't remove each other's containers)
+if (!options.shard && !options.merge) {
+  await cleanupOrphanContainers();
+}
 
 // Run main
-main().catch(error => {
+main().catch(async error => {
   console.error(chalk.red(`\nFatal error: ${error.message}\n`));
+  await flushLogs();
   process.exit(EXIT_CODES.RUNTIME_ERROR);
 });
@@ -68,6 +68,29 @@ export const DEFAULTS = {
   SERVICE_PORT: 3000,
   SERVICE_STARTUP_TIMEOUT_MS: 10000,
   TEST_TIMEOUT_MS: 120000, // 2 minutes for API calls (was 30s)
+  TEST_CONCURRENCY: 8,     // Concurrent test cases per scenario (--test-concurrency)
+  CACHE_TTL_HOURS: 24 * 7,
+  CACHE_MAX_MB: 512,
+  EVAL_CONCURRENCY: 4,           // In-flight evaluator calls per model
+  EVAL_REQUESTS_PER_MINUTE: 60,  // Per model
+  EVAL_MAX_RETRIES: 5,
+  EVAL_BATCH_LINGER_MS: 3000,   // How long a partial evaluation batch waits for more scenarios
+  MCP_POOL_SIZE_MAX: 4,          // Default stdio connections per MCP server (capped by --max-workers)
+  MCP_HEALTH_INTERVAL_MS: 30000,
+  MCP_HEALTH_TIMEOUT_MS: 10000,
+  MCP_RECONNECT_ATTEMPTS: 5,
+  LOG_FLUSH_INTERVAL_MS: 200,    // Max delay before buffered log lines hit disk
+  LOG_FLUSH_BYTES: 64 * 1024,    // Flush a log file early once this much is buffered
+  PORT_RANGE_START: 3010,        // Host ports for service containers (--port-range)
+  PORT_RANGE_END: 3090,
+  BUILD_PARALLELISM: 2,          // Concurrent docker builds (--build-parallelism)
+  WORKSPACE_MODE: 'reflink',     // Scaffold materialization (--workspace-mode)
+  WORKSPACE_COPY_CONCURRENCY: 32,  // Concurrent file copies/links per process
+  REPORT_READ_CONCURRENCY: 64,   // Concurrent scenario report reads when summarizing
+  SCHEDULE: 'lpt',               // Parallel task order (--schedule)
+  DURATION_EWMA_ALPHA: 0.3,      // Weight of the latest run in the duration history
+  AGENT_DURATION_ESTIMATE_MS: 10 * 60 * 1000,  // Expected duration without history
+  ONESHOT_DURATION_ESTIMATE_MS: 30 * 1000,
 } as const;
 
 export const PATHS = {
@@ -75,6 +98,8 @@ export const PATHS = {
   CONFIGS_DIR: 'configs',
   SCAFFOLD_TEMPLATE_DIR: 'scaffold-template',
   REPORTS_DIR: 'reports',
+  PORT_LOCK_DIR: '.port-locks',
   LOGS_DIR: 'logs',
   WORKSPACE_DIR: 'workspace',
+  CACHE_DIR: '.cache',
 } as const;
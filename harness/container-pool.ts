@@ -0,0 +1,278 @@
+/**
+ * Warm container pool for agent-mode tests
+ * Keeps pre-started containers from the scaffold base image. A scenario's
+ * app/ (plus package.json and .env) is copied in, compiled with an exec and the
+ * service process is restarted, so tests skip the image build, container start
+ * and most of the health-check wait. Containers whose dependencies changed are
+ * replaced in the background; clean ones are reused.
+ */
+
+import Dockerode from 'dockerode';
+import fs from 'fs-extra';
+import os from 'os';
+import path from 'path';
+import { PassThrough } from 'stream';
+import { exec } from 'child_process';
+import { promisify } from 'util';
+import { Logger } from './logger.js';
+import { DEFAULTS, PATHS } from './constants.js';
+import { PortManager } from './port-manager.js';
+import { BuildBreakdown, BuildStep, ensureBaseImage, getBaseImageName, waitForService } from './docker-service.js';
+
+const execAsync = promisify(exec);
+
+const docker = new Dockerode();
+const portManager = PortManager.getInstance();
+
+// Restarts the service whenever it exits; `kill $(cat /tmp/app.pid)` reloads it
+const SUPERVISOR = 'while :; do if [ -f /app/dist/main.js ]; then node /app/dist/main.js & echo $! > /tmp/app.pid; wait $!; else sleep 0.2; fi; done';
+
+export interface WarmContainer {
+  name: string;
+  containerId: string;
+  port: number;
+  dirty: boolean;  // Dependencies differ from the base image; replace instead of reuse
+}
+
+interface ExecResult {
+  exitCode: number;
+  output: string;
+}
+
+/**
+ * Run a shell command in a container and collect its output
+ */
+async function execInContainer(containerId: string, command: string): Promise<ExecResult> {
+  const container = docker.getContainer(containerId);
+  const execution = await container.exec({
+    Cmd: ['sh', '-c', command],
+    WorkingDir: '/app',
+    AttachStdout: true,
+    AttachStderr: true,
+  });
+  const stream = await execution.start({});
+
+  const chunks: Buffer[] = [];
+  const sink = new PassThrough();
+  sink.on('data', (chunk: Buffer) => chunks.push(chunk));
+  docker.modem.demuxStream(stream, sink, sink);
+  await new Promise<void>((resolve, reject) => {
+    stream.on('end', resolve);
+    stream.on('error', reject);
+  });
+
+  const { ExitCode } = await execution.inspect();
+  return { exitCode: ExitCode ?? 1, output: Buffer.concat(chunks).toString('utf-8') };
+}
+
+export class ContainerPool {
+  private static instance: ContainerPool;
+  private size: number = 0;
+  private idle: WarmContainer[] = [];
+  private all: Set<WarmContainer> = new Set();
+  private starting: number = 0;
+  private waiters: Array<{ resolve: (container: WarmContainer) => void; reject: (error: Error) => void }> = [];
+  private nextId: number = 0;
+
+  private constructor() {}
+
+  /**
+   * Get singleton instance
+   */
+  public static getInstance(): ContainerPool {
+    if (!ContainerPool.instance) {
+      ContainerPool.instance = new ContainerPool();
+    }
+    return ContainerPool.instance;
+  }
+
+  /**
+   * Set the number of warm containers (0 disables the pool)
+   */
+  configure(size: number): void {
+    this.size = Math.max(0, size);
+  }
+
+  isEnabled(): boolean {
+    return this.size > 0;
+  }
+
+  /**
+   * Take a warm container, starting the pool on first use
+   */
+  async acquire(logger: Logger): Promise<WarmContainer> {
+    const ready = this.idle.shift();
+    if (ready) {
+      return ready;
+    }
+
+    const waiting = new Promise<WarmContainer>((resolve, reject) => this.waiters.push({ resolve, reject }));
+    this.fill(logger);
+    return waiting;
+  }
+
+  /**
+   * Deploy a workspace into a leased container and wait until it is healthy
+   */
+  async deploy(
+    container: WarmContainer,
+    workspaceDir: string,
+    envVars: Record<string, string> | undefined,
+    logger: Logger
+  ): Promise<BuildBreakdown> {
+    logger.marker('>>>>> Building Service');
+    logger.info(`Deploying workspace into warm container ${container.name} (port ${container.port})`);
+    const deployStart = Date.now();
+    const steps: BuildStep[] = [];
+
+    const step = async (name: string, command: string) => {
+      const start = Date.now();
+      const result = await execInContainer(container.containerId, command);
+      steps.push({ step: name, duration_ms: Date.now() - start, cached: false });
+      logger.info(`${name}:\n${result.output}`);
+      if (result.exitCode !== 0) {
+        logger.marker('>>>>> Build Failed');
+        throw new Error(`${name} failed in warm container (exit ${result.exitCode})`);
+      }
+    };
+
+    // Stage workspace files plus a .env with the resolved scenario variables
+    const stageDir = await fs.mkdtemp(path.join(os.tmpdir(), 'context-bench-deploy-'));
+    try {
+      const envContent = Object.entries(envVars || {}).map(([key, value]) => `${key}=${value}`).join('\n');
+      await fs.writeFile(path.join(stageDir, '.env'), envContent);
+      const archive = path.join(stageDir, 'deploy.tar');
+      const files = ['app', 'package.json', 'tsconfig.json'].filter(f => fs.existsSync(path.join(workspaceDir, f)));
+      await execAsync(`tar -cf ${archive} -C ${workspaceDir} ${files.join(' ')} -C ${stageDir} .env`);
+
+      const copyStart = Date.now();
+      await step('Clear previous deploy', 'rm -rf /app/app /app/dist /app/.env');
+      await docker.getContainer(container.containerId).putArchive(archive, { path: '/app' });
+      steps.push({ step: 'Copy workspace', duration_ms: Date.now() - copyStart, cached: false });
+    } finally {
+      await fs.remove(stageDir);
+    }
+
+    // Only install when the agent changed dependencies
+    const scaffoldPackage = await fs.readFile(path.join(PATHS.SCAFFOLD_TEMPLATE_DIR, 'package.json'), 'utf-8');
+    const workspacePackage = await fs.readFile(path.join(workspaceDir, 'package.json'), 'utf-8').catch(() => scaffoldPackage);
+    if (workspacePackage !== scaffoldPackage) {
+      container.dirty = true;
+      await step('npm install', 'npm install --production=false');
+    } else {
+      steps.push({ step: 'npm install', duration_ms: 0, cached: true });
+    }
+
+    await step('npm run build', 'npm run build');
+    // Wait for the old process to exit so the health check can't hit it
+    await step('Restart service', 'if [ -f /tmp/app.pid ]; then pid=$(cat /tmp/app.pid); kill $pid 2>/dev/null; while kill -0 $pid 2>/dev/null; do sleep 0.05; done; fi; true');
+
+    const healthStart = Date.now();
+    await waitForService(container.port, DEFAULTS.SERVICE_STARTUP_TIMEOUT_MS, logger);
+    steps.push({ step: 'Health check', duration_ms: Date.now() - healthStart, cached: false });
+
+    logger.marker('>>>>> Build Complete');
+    logger.marker('>>>>> Service Ready');
+
+    return {
+      queue_wait_ms: 0,
+      base_image: getBaseImageName(),
+      base_image_ms: 0,
+      base_image_cached: true,
+      image_build_ms: Date.now() - deployStart,
+      steps,
+    };
+  }
+
+  /**
+   * Return a container after its tests; dirty or failed containers are replaced
+   */
+  async release(container: WarmContainer, logger: Logger, failed: boolean = false): Promise<void> {
+    if (container.dirty || failed || this.size === 0) {
+      logger.info(`Replacing warm container ${container.name}`);
+      await this.destroy(container);
+      this.fill(logger);
+      return;
+    }
+
+    this.handOut(container);
+  }
+
+  /**
+   * Remove every pool container and release their ports
+   */
+  async shutdown(): Promise<void> {
+    this.size = 0;
+    this.idle = [];
+    await Promise.all(Array.from(this.all).map(c => this.destroy(c)));
+  }
+
+  /**
+   * Start containers until the pool (idle + leased + starting) reaches its size
+   */
+  private fill(logger: Logger): void {
+    while (this.size > 0 && this.all.size + this.starting < this.size) {
+      this.starting++;
+      this.start(logger)
+        .then(container => this.handOut(container))
+        .catch((error: any) => {
+          logger.error(`Failed to start warm container: ${error.message}`);
+          // Fail one waiting scenario instead of leaving it hanging
+          this.waiters.shift()?.reject(error);
+        })
+        .finally(() => {
+          this.starting--;
+        });
+    }
+  }
+
+  private handOut(container: WarmContainer): void {
+    const waiter = this.waiters.shift();
+    if (waiter) {
+      waiter.resolve(container);
+    } else {
+      this.idle.push(container);
+    }
+  }
+
+  private async start(logger: Logger): Promise<WarmContainer> {
+    const baseImage = getBaseImageName();
+    await ensureBaseImage(baseImage, logger);
+
+    const name = `context-bench-warm-${process.pid}-${this.nextId++}`;
+    const port = await portManager.allocatePort(name);
+
+    try {
+      const created = await docker.createContainer({
+        Image: baseImage,
+        name,
+        Cmd: ['sh', '-c', SUPERVISOR],
+        WorkingDir: '/app',
+        ExposedPorts: { '3000/tcp': {} },
+        HostConfig: {
+          PortBindings: { '3000/tcp': [{ HostPort: port.toString() }] },
+          AutoRemove: false,
+        },
+      });
+      await created.start();
+
+      const container: WarmContainer = { name, containerId: created.id, port, dirty: false };
+      this.all.add(container);
+      logger.info(`Warm container ${name} started on port ${port}`);
+      return container;
+    } catch (error) {
+      await portManager.releasePort(name);
+      throw error;
+    }
+  }
+
+  private async destroy(container: WarmContainer): Promise<void> {
+    this.all.delete(container);
+    try {
+      await docker.getContainer(container.containerId).remove({ force: true });
+    } catch {
+      // Already gone
+    }
+    await portManager.releasePort(container.name);
+  }
+}
@@ -5,14 +5,24 @@
 import Dockerode from 'dockerode';
 import fs from 'fs-extra';
 import path from 'path';
+import crypto from 'crypto';
 import { exec } from 'child_process';
 import { promisify } from 'util';
 import { Logger } from './logger.js';
-import { DEFAULTS } from './constants.js';
+import { DEFAULTS, PATHS } from './constants.js';
 import { PortManager } from './port-manager.js';
+import { Semaphore } from './semaphore.js';
 
 const execAsync = promisify(exec);
 
+const BASE_IMAGE_REPO = 'context-bench-base';
+
+// BuildKit is needed for --progress=plain step timings; npm output can be large
+const BUILD_EXEC_OPTIONS = {
+  env: { ...process.env, DOCKER_BUILDKIT: '1' },
+  maxBuffer: 64 * 1024 * 1024,
+};
+
 const docker = new Dockerode();
 const portManager = PortManager.getInstance();
 
@@ -21,14 +31,107 @@ export interface ServiceHandle {
   port: number;
 }
 
+export interface BuildStep {
+  step: string;
+  duration_ms: number;
+  cached: boolean;
+}
+
+export interface BuildBreakdown {
+  queue_wait_ms: number;      // Waiting for a --build-parallelism slot
+  base_image: string;
+  base_image_ms: number;      // Ensuring the base image (0 when already present)
+  base_image_cached: boolean;
+  image_build_ms: number;     // docker build of the scenario image
+  steps: BuildStep[];         // Per-step timings from BuildKit output
+}
+
+const buildSlots = new Semaphore(DEFAULTS.BUILD_PARALLELISM);
+const baseImageBuilds: Map<string, Promise<boolean>> = new Map();
+
+/**
+ * Limit concurrent docker builds (scenario and base images)
+ */
+export function setBuildParallelism(limit: number): void {
+  buildSlots.setLimit(limit);
+}
+
+/**
+ * Base image tag for the current scaffold dependencies
+ * Changes whenever package.json, package-lock.json or Dockerfile.base changes
+ */
+export function getBaseImageName(): string {
+  const hash = crypto.createHash('sha256');
+  for (const file of ['package.json', 'package-lock.json', 'Dockerfile.base']) {
+    hash.update(file).update(fs.readFileSync(path.join(PATHS.SCAFFOLD_TEMPLATE_DIR, file)));
+  }
+  return `${BASE_IMAGE_REPO}:${hash.digest('hex').substring(0, 12)}`;
+}
+
+/**
+ * Build the scaffold base image unless it already exists
+ * Concurrent callers share one build; resolves true if the image was reused
+ */
+export async function ensureBaseImage(baseImage: string, logger: Logger): Promise<boolean> {
+  let pending = baseImageBuilds.get(baseImage);
+  if (!pending) {
+    pending = (async () => {
+      try {
+        await docker.getImage(baseImage).inspect();
+        return true;
+      } catch {
+        // Not built yet
+      }
+
+      const dockerfile = path.join(PATHS.SCAFFOLD_TEMPLATE_DIR, 'Dockerfile.base');
+      const buildCmd = `docker build -f ${dockerfile} -t ${baseImage} ${PATHS.SCAFFOLD_TEMPLATE_DIR}`;
+      logger.info(`Building base image: ${buildCmd}`);
+      await buildSlots.run(() => execAsync(buildCmd, BUILD_EXEC_OPTIONS));
+      return false;
+    })();
+    baseImageBuilds.set(baseImage, pending);
+    // A failed build may be retried by the next scenario
+    pending.catch(() => baseImageBuilds.delete(baseImage));
+  }
+  return pending;
+}
+
+/**
+ * Per-step durations from BuildKit plain progress output
+ */
+function parseBuildSteps(output: string): BuildStep[] {
+  const names = new Map<string, string>();
+  const steps: BuildStep[] = [];
+
+  for (const line of output.split('\n')) {
+    const named = line.match(/^#(\d+) \[[^\]]*\d+\/\d+\] (.+)$/);
+    if (named) {
+      names.set(named[1], named[2].trim());
+      continue;
+    }
+    const done = line.match(/^#(\d+) (DONE ([\d.]+)s|CACHED)$/);
+    if (done && names.has(done[1])) {
+      steps.push({
+        step: names.get(done[1])!,
+        duration_ms: done[3] ? Math.round(parseFloat(done[3]) * 1000) : 0,
+        cached: done[2] === 'CACHED',
+      });
+      names.delete(done[1]);
+    }
+  }
+  return steps;
+}
+
 /**
  * Build Docker image for workspace
+ * The scenario image is layered on the prebuilt scaffold base image, so only
+ * the agent's dependency changes and app/ are built per scenario
  */
 export async function buildImage(
   workspaceDir: string,
   imageName: string,
   logger: Logger
-): Promise<void> {
+): Promise<BuildBreakdown> {
   logger.marker('>>>>> Building Service');
   logger.info(`Building Docker image: ${imageName}`);
 
@@ -38,12 +141,35 @@ export async function buildImage(
     throw new Error(`Dockerfile not found: ${dockerfilePath}`);
   }
 
+  const baseImage = getBaseImageName();
+  const baseStart = Date.now();
+  let baseImageCached = false;
+  let baseImageArg = '';
+  try {
+    baseImageCached = await ensureBaseImage(baseImage, logger);
+    baseImageArg = ` --build-arg BASE_IMAGE=${baseImage}`;
+    logger.info(`Base image ${baseImage} ${baseImageCached ? 'reused' : 'built'}`);
+  } catch (error: any) {
+    // Fall back to the Dockerfile's default base (full npm install)
+    logger.warn(`Base image build failed, building from scratch: ${error.message}`);
+  }
+  const baseImageMs = Date.now() - baseStart;
+
   // Build image using docker build command
-  const buildCmd = `docker build -t ${imageName} ${workspaceDir}`;
+  const buildCmd = `docker build --progress=plain${baseImageArg} -t ${imageName} ${workspaceDir}`;
   logger.info(`Running: ${buildCmd}`);
 
+  const queuedAt = Date.now();
+  let queueWaitMs = 0;
+  let buildStart = 0;
+
   try {
-    const { stdout, stderr } = await execAsync(buildCmd);
+    const { stdout, stderr } = await buildSlots.run(() => {
+      queueWaitMs = Date.now() - queuedAt;
+      buildStart = Date.now();
+      return execAsync(buildCmd, BUILD_EXEC_OPTIONS);
+    });
+    const imageBuildMs = Date.now() - buildStart;
     logger.info('Build output:');
     logger.info(stdout);
     if (stderr) {
@@ -51,6 +177,17 @@ export async function buildImage(
       logger.info(stderr);
     }
     logger.marker('>>>>> Build Complete');
+
+    const breakdown: BuildBreakdown = {
+      queue_wait_ms: queueWaitMs,
+      base_image: baseImage,
+      base_image_ms: baseImageMs,
+      base_image_cached: baseImageCached,
+      image_build_ms: imageBuildMs,
+      steps: parseBuildSteps(`${stdout}\n${stderr}`),
+    };
+    logger.info(`Build breakdown: queue ${queueWaitMs}ms, base image ${baseImageMs}ms${baseImageCached ? ' (cached)' : ''}, image ${imageBuildMs}ms`);
+    return breakdown;
   } catch (error: any) {
     logger.marker('>>>>> Build Failed');
     logger.error(`Build failed: ${error.message}`);
@@ -80,10 +217,11 @@ export async function startService(
     const portStatus = portManager.getStatus();
     logger.info(`Port pool status: ${portStatus.allocated}/${portStatus.total} allocated, ${portStatus.available} available`);
 
-    // Allocate port from pool (3010-3090) with temporary ID
+    // Allocate port from pool with temporary ID
     tempId = `temp-${Date.now()}-${Math.random().toString(36).substring(7)}`;
+    const allocStart = Date.now();
     assignedPort = await portManager.allocatePort(tempId);
-    logger.info(`Allocated port ${assignedPort} from pool (verified system availability)`);
+    logger.info(`Allocated port ${assignedPort} from pool in ${Date.now() - allocStart}ms (bind-probed)`);
 
     // Prepare environment variables for container
     const containerEnv: string[] = [];
@@ -162,7 +300,7 @@ export async function startService(
 /**
  * Wait for service to respond
  */
-async function waitForService(
+export async function waitForService(
   port: number,
   timeoutMs: number,
   logger: Logger
@@ -0,0 +1,89 @@
+/**
+ * Request batcher for evaluator calls
+ * Items are grouped per key (model) and flushed as one batch when the batch
+ * is full or the linger window expires, DataLoader style. Scenarios finishing
+ * around the same time in parallel workers share a single judge request.
+ */
+
+export interface EvalBatcherOptions<TItem, TResult> {
+  maxBatchSize: number;
+  lingerMs: number;
+  /**
+   * Execute one batch; returns one entry per item, in order (an Error rejects that item)
+   */
+  execute: (key: string, items: TItem[]) => Promise<Array<TResult | Error>>;
+}
+
+interface Pending<TItem, TResult> {
+  item: TItem;
+  resolve: (result: TResult) => void;
+  reject: (error: Error) => void;
+}
+
+interface Group<TItem, TResult> {
+  pending: Pending<TItem, TResult>[];
+  timer: NodeJS.Timeout | null;
+}
+
+export class EvalBatcher<TItem, TResult> {
+  private groups: Map<string, Group<TItem, TResult>> = new Map();
+
+  constructor(private options: EvalBatcherOptions<TItem, TResult>) {}
+
+  /**
+   * Queue an item and resolve with its own result once its batch completes
+   */
+  load(key: string, item: TItem): Promise<TResult> {
+    return new Promise<TResult>((resolve, reject) => {
+      let group = this.groups.get(key);
+      if (!group) {
+        group = { pending: [], timer: null };
+        this.groups.set(key, group);
+      }
+
+      group.pending.push({ item, resolve, reject });
+
+      if (group.pending.length >= this.options.maxBatchSize) {
+        this.flush(key);
+      } else if (!group.timer) {
+        group.timer = setTimeout(() => this.flush(key), this.options.lingerMs);
+      }
+    });
+  }
+
+  private flush(key: string): void {
+    const group = this.groups.get(key);
+    if (!group || group.pending.length === 0) {
+      return;
+    }
+
+    if (group.timer) {
+      clearTimeout(group.timer);
+      group.timer = null;
+    }
+
+    const batch = group.pending.splice(0, this.options.maxBatchSize);
+
+    // Anything left over (a burst larger than one batch) starts a new window
+    if (group.pending.length > 0) {
+      group.timer = setTimeout(() => this.flush(key), this.options.lingerMs);
+    }
+
+    this.options.execute(key, batch.map(p => p.item))
+      .then(results => {
+        batch.forEach((p, i) => {
+          const result = results[i];
+          if (result === undefined) {
+            p.reject(new Error('Batch returned no result for item'));
+          } else if (result instanceof Error) {
+            p.reject(result);
+          } else {
+            p.resolve(result);
+          }
+        });
+      })
+      .catch((error: Error) => {
+        batch.forEach(p => p.reject(error));
+      });
+  }
+}
@@ -7,6 +7,11 @@ import { ScenarioSpec, ExecutionMode } from './types.js';
 import { Logger } from './logger.js';
 import path from 'path';
 import fs from 'fs-extra';
+import { DiskCache, CacheMode, hashContent } from './cache.js';
+import { ModelScheduler } from './model-scheduler.js';
+import { withSpan } from './tracing.js';
+import { EvalBatcher } from './eval-batcher.js';
+import { DEFAULTS } from './constants.js';
 
 export interface SingleModelEvaluation {
   model: string;
@@ -31,6 +36,15 @@ export interface EvaluationResult {
     pass: boolean; // true only if both completeness_majority AND relevance_majority are true
   };
   consensus: boolean; // true if all models agree on completeness and relevance
+  pending_models?: string[]; // Early exit: models still running when the vote was decided
+}
+
+export interface EvaluationOptions {
+  models?: string[];
+  cacheMode?: CacheMode;  // Verdict cache: read, write or off
+  batchSize?: number;     // > 1 packs scenarios into shared judge requests
+  earlyExit?: boolean;    // Resolve once the majority vote is decided
+  onComplete?: (result: EvaluationResult) => Promise<void> | void;  // Called after background stragglers finish
 }
 
 /**
@@ -42,6 +56,466 @@ const DEFAULT_EVALUATION_MODELS = [
   'x-ai/grok-4'
 ];
 
+/**
+ * Evaluation schema for structured output
+ */
+const evaluationSchema = {
+  type: "object",
+  properties: {
+    completeness: {
+      type: "boolean",
+      description: "True if the implementation covers all required aspects and effectively uses MCP context from documentation/code search. False otherwise."
+    },
+    relevance: {
+      type: "boolean",
+      description: "True if the implementation is relevant to the scenario query and matches the oracle code structure and functionality. False otherwise."
+    },
+    overall_score: {
+      type: "integer",
+      enum: [1, 2, 3, 4, 5],
+      description: "Overall quality score: 1=Poor, 2=Below Average, 3=Average, 4=Good, 5=Excellent"
+    },
+    confidence: {
+      type: "string",
+      enum: ["high", "medium", "low"],
+      description: "Confidence level in this evaluation: high=very confident in the assessment, medium=moderately confident, low=uncertain or limited information"
+    },
+    reasoning: {
+      type: "string",
+      description: "Detailed explanation of the evaluation, including what was done well and what could be improved"
+    }
+  },
+  required: ["completeness", "relevance", "overall_score", "confidence", "reasoning"],
+  additionalProperties: false
+};
+
+/**
+ * System prompt shared by all evaluation models
+ */
+const systemPrompt = `You are an expert evaluator for MCP context quality assessment. 
+Your task is to evaluate whether the MCP context retrieved contains sufficient information to implement the oracle code.
+
+**Evaluation Focus**: Can a developer implement functionality equivalent to the oracle code based on the MCP context only?
+
+**IMPORTANT: Evaluation Process (Follow in Order)**:
+
+**Step 1: Analyze User Requirements**
+- Extract ALL specific requirements from the user's query
+- Identify explicit constraints (specific APIs, models, versions, features)
+
+**Step 2: Analyze Oracle Implementation**
+- What APIs/functions does the oracle use?
+- What parameters and return types are used?
+
+**Step 3: Evaluate MCP Context Completeness**
+For EACH requirement identified in Step 1, check if the MCP context provides:
+1. **API/Function signatures**: Are the necessary functions documented?
+2. **Parameters**: Can parameter types, names, and purposes be inferred from examples?
+3. **Return values**: Can return types and structures be inferred from examples?
+4. **Usage patterns**: Are there examples showing how to use the APIs?
+
+**Step 4: Make Completeness Decision**
+- **COMPLETE (true)** = For ALL user requirements, the MCP context provides enough information to infer API signatures, parameters, return types, and usage
+- **INCOMPLETE (false)** = ANY critical information is missing or cannot be reliably inferred from context
+
+**Key Rules**:
+1. **Explicit constraints must be met**:
+   - User says "use GPT-4" + context only has GPT-3 → INCOMPLETE
+   - User says "implement search" + context has different search API → COMPLETE (if parameters/returns are inferable)
+
+2. **All information must be inferable from context**:
+   - Parameter types must be clear from examples or documentation
+   - Return value structures must be inferable
+   - If you have to guess without evidence → INCOMPLETE
+
+3. **Partial implementation = INCOMPLETE**:
+   - If only 80% of requirements can be met → INCOMPLETE
+   - All user requirements must be addressable
+
+Evaluation criteria:
+- **Completeness (boolean)**:
+  - True = For ALL user requirements, you can infer: (1) which APIs/functions to call, (2) what parameters to pass and their types, (3) what the return values look like, (4) how to handle errors
+  - False = ANY critical information cannot be reliably inferred, OR user's explicit requirements are not addressed, OR you would have to guess without evidence
+
+- **Relevance (boolean)**:
+  - True = The MCP context directly addresses the user's requirements and oracle's functionality
+  - False = The MCP context is off-topic or doesn't help implement the required functionality
+
+- **Overall Score (1-5)**:
+  - 5 = Excellent: All information clearly inferable; can confidently implement all requirements
+  - 4 = Good: Most information inferable; minor gaps that don't block implementation
+  - 3 = Average: Some key information inferable but significant gaps exist
+  - 2 = Below Average: Many critical details missing; cannot reliably implement
+  - 1 = Poor: Context is insufficient; cannot determine how to implement
+
+- **Confidence (high/medium/low)**:
+  - high = Very confident based on clear evidence in the context
+  - medium = Moderately confident, some aspects require interpretation
+  - low = Uncertain due to ambiguity or missing information`;
+
+/**
+ * Request parameters shared by every evaluation call
+ */
+const EVALUATION_REQUEST = {
+  temperature: 0,
+  max_tokens: 8192,
+};
+
+/**
+ * Hash of everything that shapes a verdict besides the inputs themselves.
+ * Editing the system prompt, the prompt builder or the schema invalidates
+ * every cached verdict.
+ */
+let promptVersion: string | null = null;
+
+function getPromptVersion(): string {
+  if (!promptVersion) {
+    promptVersion = hashContent({
+      system: systemPrompt,
+      builder: [buildEvaluationPrompt, buildScenarioContext, buildEvaluationInstructions].map(fn => fn.toString()),
+      schema: evaluationSchema,
+      request: EVALUATION_REQUEST,
+    });
+  }
+  return promptVersion;
+}
+
+let verdictCache: DiskCache<SingleModelEvaluation> | null = null;
+
+function getVerdictCache(): DiskCache<SingleModelEvaluation> {
+  if (!verdictCache) {
+    verdictCache = new DiskCache<SingleModelEvaluation>({ namespace: 'evaluations' });
+  }
+  return verdictCache;
+}
+
+/**
+ * Votes needed for a majority (2 out of 3)
+ */
+const MAJORITY_VOTES = 2;
+
+/**
+ * Background straggler evaluations (early exit) that must finish before exit
+ */
+const pendingEvaluations: Set<Promise<void>> = new Set();
+
+function trackPendingEvaluation(promise: Promise<void>): void {
+  pendingEvaluations.add(promise);
+  promise.finally(() => pendingEvaluations.delete(promise));
+}
+
+/**
+ * Wait for background straggler evaluations (call before process exit)
+ */
+export async function waitForPendingEvaluations(): Promise<void> {
+  while (pendingEvaluations.size > 0) {
+    await Promise.allSettled(Array.from(pendingEvaluations));
+  }
+}
+
+/**
+ * Resolve with the verdicts received so far as soon as both majority votes are
+ * decided: a criterion is decided once MAJORITY_VOTES models said true, or so
+ * many said false that the remaining ones cannot reach MAJORITY_VOTES.
+ * Rejects like Promise.all if a model fails before the decision.
+ */
+function waitForMajority(promises: Promise<SingleModelEvaluation>[]): Promise<SingleModelEvaluation[]> {
+  const total = promises.length;
+  const received: SingleModelEvaluation[] = [];
+
+  return new Promise((resolve, reject) => {
+    let settled = false;
+
+    const decided = (key: 'completeness' | 'relevance'): boolean => {
+      const yes = received.filter(e => e[key]).length;
+      const no = received.length - yes;
+      return yes >= MAJORITY_VOTES || no > total - MAJORITY_VOTES;
+    };
+
+    for (const promise of promises) {
+      promise.then(evaluation => {
+        if (settled) return;
+        received.push(evaluation);
+        if (received.length === total || (decided('completeness') && decided('relevance'))) {
+          settled = true;
+          resolve([...received]);
+        }
+      }, error => {
+        if (settled) return;
+        settled = true;
+        reject(error);
+      });
+    }
+  });
+}
+
+/**
+ * Aggregate model verdicts into scores, majority votes and consensus
+ */
+function aggregateEvaluations(modelEvaluations: SingleModelEvaluation[]): {
+  aggregated: EvaluationResult['aggregated'];
+  consensus: boolean;
+} {
+  const completenessCount = modelEvaluations.filter(e => e.completeness).length;
+  const relevanceCount = modelEvaluations.filter(e => e.relevance).length;
+  const averageScore = modelEvaluations.reduce((sum, e) => sum + e.overall_score, 0) / modelEvaluations.length;
+  const finalScore = Math.round(averageScore) as 1 | 2 | 3 | 4 | 5;
+
+  // Majority vote: 2 out of 3 = true
+  const completenessMajority = completenessCount >= MAJORITY_VOTES;
+  const relevanceMajority = relevanceCount >= MAJORITY_VOTES;
+
+  // Pass only if both completeness AND relevance pass majority vote
+  const pass = completenessMajority && relevanceMajority;
+
+  // Check consensus (all models agree on completeness and relevance)
+  const allCompleteness = modelEvaluations.every(e => e.completeness);
+  const allRelevance = modelEvaluations.every(e => e.relevance);
+  const noneCompleteness = modelEvaluations.every(e => !e.completeness);
+  const noneRelevance = modelEvaluations.every(e => !e.relevance);
+  const consensus = (allCompleteness || noneCompleteness) && (allRelevance || noneRelevance);
+
+  return {
+    aggregated: {
+      completeness_rate: completenessCount / modelEvaluations.length,
+      relevance_rate: relevanceCount / modelEvaluations.length,
+      average_score: averageScore,
+      final_score: finalScore,
+      completeness_majority: completenessMajority,
+      relevance_majority: relevanceMajority,
+      pass: pass
+    },
+    consensus,
+  };
+}
+
+function logAggregatedResults(
+  logger: Logger,
+  modelEvaluations: SingleModelEvaluation[],
+  aggregated: EvaluationResult['aggregated'],
+  consensus: boolean
+): void {
+  const completenessCount = modelEvaluations.filter(e => e.completeness).length;
+  const relevanceCount = modelEvaluations.filter(e => e.relevance).length;
+
+  logger.info('='.repeat(80));
+  logger.info('Aggregated Results:');
+  logger.info(`  Final Score: ${aggregated.final_score}/5 (avg: ${aggregated.average_score.toFixed(2)})`);
+  logger.info(`  Completeness: ${completenessCount}/${modelEvaluations.length} → Majority: ${aggregated.completeness_majority ? 'PASS ✓' : 'FAIL ✗'}`);
+  logger.info(`  Relevance: ${relevanceCount}/${modelEvaluations.length} → Majority: ${aggregated.relevance_majority ? 'PASS ✓' : 'FAIL ✗'}`);
+  logger.info(`  Overall: ${aggregated.pass ? 'PASS ✓' : 'FAIL ✗'} (Both must pass)`);
+  logger.info(`  Consensus: ${consensus ? 'YES' : 'NO'}`);
+  logger.info('='.repeat(80));
+}
+
+/**
+ * Header lines in oneshot_result.md that describe the run, not the retrieved context
+ */
+const RUN_METADATA_LINE = /^\*\*(MCP Config|Cache Hit)\*\*:.*\n/gm;
+
+/**
+ * Remove run metadata so judges only see the context (and the pre-existing header)
+ */
+function stripRunMetadata(resultMd: string): string {
+  return resultMd.replace(RUN_METADATA_LINE, '');
+}
+
+/**
+ * Drop run-specific lines (timestamps) so re-runs with identical context hash the same
+ */
+function normalizeResultContent(resultMd: string): string {
+  return stripRunMetadata(resultMd).replace(/^\*\*Timestamp\*\*:.*$/gm, '');
+}
+
+/**
+ * One scenario waiting in a batched judge request
+ */
+interface BatchEvaluationItem {
+  scenarioId: string;
+  mode: ExecutionMode;
+  context: string;  // buildScenarioContext output
+  client: OpenAI;
+  logger: Logger;
+  single: () => Promise<SingleModelEvaluation>;
+}
+
+/**
+ * Structured output for a batch: evaluationSchema per item plus its item_id
+ */
+const batchEvaluationSchema = {
+  type: "object",
+  properties: {
+    evaluations: {
+      type: "array",
+      items: {
+        type: "object",
+        properties: {
+          item_id: {
+            type: "string",
+            description: "The item id exactly as given in the item heading (e.g. \"item-1\")"
+          },
+          ...evaluationSchema.properties
+        },
+        required: ["item_id", ...evaluationSchema.required],
+        additionalProperties: false
+      }
+    }
+  },
+  required: ["evaluations"],
+  additionalProperties: false
+};
+
+const MAX_BATCH_OUTPUT_TOKENS = 32768;
+
+let batchPromptVersion: string | null = null;
+
+function getBatchPromptVersion(): string {
+  if (!batchPromptVersion) {
+    batchPromptVersion = hashContent({
+      base: getPromptVersion(),
+      builder: buildBatchEvaluationPrompt.toString(),
+      schema: batchEvaluationSchema,
+    });
+  }
+  return batchPromptVersion;
+}
+
+let evalBatcher: EvalBatcher<BatchEvaluationItem, SingleModelEvaluation> | null = null;
+
+function getEvalBatcher(batchSize: number): EvalBatcher<BatchEvaluationItem, SingleModelEvaluation> {
+  if (!evalBatcher) {
+    evalBatcher = new EvalBatcher<BatchEvaluationItem, SingleModelEvaluation>({
+      maxBatchSize: batchSize,
+      lingerMs: DEFAULTS.EVAL_BATCH_LINGER_MS,
+      execute: executeEvaluationBatch,
+    });
+  }
+  return evalBatcher;
+}
+
+/**
+ * Build one prompt covering several scenarios; the checklist appears once
+ */
+function buildBatchEvaluationPrompt(items: BatchEvaluationItem[]): string {
+  let prompt = `# MCP Context Evaluation Task (Batch of ${items.length})\n\n`;
+  prompt += `**Task**: For EACH item below, independently evaluate whether the MCP context contains sufficient information to implement the oracle code\n`;
+  prompt += `**Output**: One entry in \`evaluations\` per item, with \`item_id\` set to the item's id. Never let one item influence another.\n\n`;
+  prompt += `---\n\n`;
+
+  items.forEach((item, i) => {
+    prompt += `# Item item-${i + 1}\n\n`;
+    prompt += `**Scenario**: ${item.scenarioId}\n`;
+    prompt += `**Mode**: ${item.mode}\n\n`;
+    prompt += `---\n\n`;
+    prompt += item.context;
+  });
+
+  prompt += buildEvaluationInstructions();
+  prompt += `\n\nApply these steps to every item separately; each item's reasoning must stand on its own.`;
+
+  return prompt;
+}
+
+/**
+ * Validate one verdict from model output
+ */
+function parseVerdict(model: string, raw: any): SingleModelEvaluation | null {
+  if (!raw || typeof raw !== 'object') return null;
+  if (typeof raw.completeness !== 'boolean' || typeof raw.relevance !== 'boolean') return null;
+  if (![1, 2, 3, 4, 5].includes(raw.overall_score)) return null;
+  if (!['high', 'medium', 'low'].includes(raw.confidence)) return null;
+  if (typeof raw.reasoning !== 'string') return null;
+
+  return {
+    model,
+    completeness: raw.completeness,
+    relevance: raw.relevance,
+    overall_score: raw.overall_score,
+    confidence: raw.confidence,
+    reasoning: raw.reasoning,
+  };
+}
+
+/**
+ * Evaluate a batch with one judge call; items the model got wrong (or a failed
+ * call) fall back to single-scenario requests
+ */
+async function executeEvaluationBatch(
+  model: string,
+  items: BatchEvaluationItem[]
+): Promise<Array<SingleModelEvaluation | Error>> {
+  const verdicts = new Map<string, SingleModelEvaluation>();
+
+  if (items.length > 1) {
+    for (const item of items) {
+      item.logger.info(`  - ${model}: batched with ${items.length - 1} other scenario(s)`);
+    }
+
+    try {
+      // Only the API call is retried; a malformed batch answer goes straight to the single-call fallback
+      const response = await ModelScheduler.getInstance().run(model, () =>
+        items[0].client.chat.completions.create({
+          model: model,
+          ...EVALUATION_REQUEST,
+          max_tokens: Math.min(EVALUATION_REQUEST.max_tokens * items.length, MAX_BATCH_OUTPUT_TOKENS),
+          response_format: {
+            type: "json_schema",
+            json_schema: {
+              name: "batch_evaluation_result",
+              strict: true,
+              schema: batchEvaluationSchema
+            }
+          },
+          messages: [
+            {
+              role: 'system',
+              content: systemPrompt
+            },
+            {
+              role: 'user',
+              content: buildBatchEvaluationPrompt(items)
+            }
+          ]
+        } as any)
+      );
+
+      const content = response.choices[0]?.message?.content;
+      if (!content) {
+        throw new Error(`No content in batch response from ${model}`);
+      }
+      const raw = JSON.parse(content);
+
+      for (const entry of Array.isArray(raw?.evaluations) ? raw.evaluations : []) {
+        const verdict = parseVerdict(model, entry);
+        if (verdict && typeof entry.item_id === 'string' && !verdicts.has(entry.item_id)) {
+          verdicts.set(entry.item_id, verdict);
+        }
+      }
+    } catch (error: any) {
+      for (const item of items) {
+        item.logger.warn(`  ⚠ ${model} batch call failed: ${error.message}`);
+      }
+    }
+  }
+
+  return Promise.all(items.map(async (item, i) => {
+    const verdict = verdicts.get(`item-${i + 1}`);
+    if (verdict) {
+      item.logger.info(`  ✓ ${model} (batch): score=${verdict.overall_score}, completeness=${verdict.completeness}, relevance=${verdict.relevance}, confidence=${verdict.confidence}`);
+      return verdict;
+    }
+
+    if (items.length > 1) {
+      item.logger.warn(`  ⚠ ${model}: no valid batch verdict for ${item.scenarioId}, falling back to a single call`);
+    }
+    try {
+      return await item.single();
+    } catch (error: any) {
+      return error instanceof Error ? error : new Error(String(error));
+    }
+  }));
+}
+
 /**
  * Evaluate result markdown against oracle using multiple models
  */
@@ -50,22 +524,20 @@ export async function evaluateResult(
   mode: ExecutionMode,
   workspaceDir: string,
   logger: Logger,
-  models: string[] = DEFAULT_EVALUATION_MODELS
+  options: EvaluationOptions = {}
 ): Promise<EvaluationResult> {
+  const models = options.models || DEFAULT_EVALUATION_MODELS;
+  const cacheMode = options.cacheMode || 'off';
+  const batchSize = options.batchSize || 1;
   logger.marker(`>>>>> Evaluating ${mode} mode result with ${models.length} models`);
 
-  // Verify API key
-  if (!process.env.OPENROUTER_API_KEY) {
-    throw new Error('OPENROUTER_API_KEY environment variable not set');
-  }
-
   try {
     // Read result markdown based on mode
     let resultMd = '';
     if (mode === 'oneshot') {
       const resultPath = path.join(workspaceDir, 'oneshot_result.md');
       if (await fs.pathExists(resultPath)) {
-        resultMd = await fs.readFile(resultPath, 'utf-8');
+        resultMd = stripRunMetadata(await fs.readFile(resultPath, 'utf-8'));
         logger.info(`Read oneshot result: ${resultPath}`);
       } else {
         logger.warn(`Oneshot result not found: ${resultPath}`);
@@ -121,240 +593,215 @@ export async function evaluateResult(
       oracleContent
     );
 
-    // Initialize OpenRouter client
-    const openai = new OpenAI({
-      baseURL: 'https://openrouter.ai/api/v1',
-      apiKey: process.env.OPENROUTER_API_KEY,
-      defaultHeaders: {
-        'HTTP-Referer': 'https://context-bench',
-        'X-Title': 'Context Code Benchmark Evaluator',
-      }
-    });
-
-    // Define evaluation schema for structured output
-    const evaluationSchema = {
-      type: "object",
-      properties: {
-        completeness: {
-          type: "boolean",
-          description: "True if the implementation covers all required aspects and effectively uses MCP context from documentation/code search. False otherwise."
-        },
-        relevance: {
-          type: "boolean",
-          description: "True if the implementation is relevant to the scenario query and matches the oracle code structure and functionality. False otherwise."
-        },
-        overall_score: {
-          type: "integer",
-          enum: [1, 2, 3, 4, 5],
-          description: "Overall quality score: 1=Poor, 2=Below Average, 3=Average, 4=Good, 5=Excellent"
-        },
-        confidence: {
-          type: "string",
-          enum: ["high", "medium", "low"],
-          description: "Confidence level in this evaluation: high=very confident in the assessment, medium=moderately confident, low=uncertain or limited information"
-        },
-        reasoning: {
-          type: "string",
-          description: "Detailed explanation of the evaluation, including what was done well and what could be improved"
+    // Initialize OpenRouter client lazily: fully cached evaluations need no API key
+    let openai: OpenAI | null = null;
+    const getClient = (): OpenAI => {
+      if (!openai) {
+        // Verify API key
+        if (!process.env.OPENROUTER_API_KEY) {
+          throw new Error('OPENROUTER_API_KEY environment variable not set');
         }
-      },
-      required: ["completeness", "relevance", "overall_score", "confidence", "reasoning"],
-      additionalProperties: false
+        openai = new OpenAI({
+          baseURL: 'https://openrouter.ai/api/v1',
+          apiKey: process.env.OPENROUTER_API_KEY,
+          maxRetries: 0,  // Retries are owned by the shared ModelScheduler
+          defaultHeaders: {
+            'HTTP-Referer': 'https://context-bench',
+            'X-Title': 'Context Code Benchmark Evaluator',
+          }
+        });
+      }
+      return openai;
     };
 
-    const systemPrompt = `You are an expert evaluator for MCP context quality assessment. 
-Your task is to evaluate whether the MCP context retrieved contains sufficient information to implement the oracle code.
-
-**Evaluation Focus**: Can a developer implement functionality equivalent to the oracle code based on the MCP context only?
-
-**IMPORTANT: Evaluation Process (Follow in Order)**:
-
-**Step 1: Analyze User Requirements**
-- Extract ALL specific requirements from the user's query
-- Identify explicit constraints (specific APIs, models, versions, features)
-
-**Step 2: Analyze Oracle Implementation**
-- What APIs/functions does the oracle use?
-- What parameters and return types are used?
-
-**Step 3: Evaluate MCP Context Completeness**
-For EACH requirement identified in Step 1, check if the MCP context provides:
-1. **API/Function signatures**: Are the necessary functions documented?
-2. **Parameters**: Can parameter types, names, and purposes be inferred from examples?
-3. **Return values**: Can return types and structures be inferred from examples?
-4. **Usage patterns**: Are there examples showing how to use the APIs?
-
-**Step 4: Make Completeness Decision**
-- **COMPLETE (true)** = For ALL user requirements, the MCP context provides enough information to infer API signatures, parameters, return types, and usage
-- **INCOMPLETE (false)** = ANY critical information is missing or cannot be reliably inferred from context
-
-**Key Rules**:
-1. **Explicit constraints must be met**:
-   - User says "use GPT-4" + context only has GPT-3 → INCOMPLETE
-   - User says "implement search" + context has different search API → COMPLETE (if parameters/returns are inferable)
-
-2. **All information must be inferable from context**:
-   - Parameter types must be clear from examples or documentation
-   - Return value structures must be inferable
-   - If you have to guess without evidence → INCOMPLETE
-
-3. **Partial implementation = INCOMPLETE**:
-   - If only 80% of requirements can be met → INCOMPLETE
-   - All user requirements must be addressable
-
-Evaluation criteria:
-- **Completeness (boolean)**:
-  - True = For ALL user requirements, you can infer: (1) which APIs/functions to call, (2) what parameters to pass and their types, (3) what the return values look like, (4) how to handle errors
-  - False = ANY critical information cannot be reliably inferred, OR user's explicit requirements are not addressed, OR you would have to guess without evidence
-
-- **Relevance (boolean)**:
-  - True = The MCP context directly addresses the user's requirements and oracle's functionality
-  - False = The MCP context is off-topic or doesn't help implement the required functionality
-
-- **Overall Score (1-5)**:
-  - 5 = Excellent: All information clearly inferable; can confidently implement all requirements
-  - 4 = Good: Most information inferable; minor gaps that don't block implementation
-  - 3 = Average: Some key information inferable but significant gaps exist
-  - 2 = Below Average: Many critical details missing; cannot reliably implement
-  - 1 = Poor: Context is insufficient; cannot determine how to implement
-
-- **Confidence (high/medium/low)**:
-  - high = Very confident based on clear evidence in the context
-  - medium = Moderately confident, some aspects require interpretation
-  - low = Uncertain due to ambiguity or missing information`;
+    // Verdicts are cached per model on (context, oracle, model, prompt version), where the
+    // prompt is the one that produced the verdict: batched, or single (including batch fallbacks)
+    const cache = cacheMode !== 'off' ? getVerdictCache() : null;
+    const contentHash = hashContent(normalizeResultContent(resultMd));
+    const oracleHash = hashContent(oracleContent);
+    const cacheKeyFor = (model: string, promptVersion: string) => DiskCache.key({
+      scenario: scenario.id,
+      mode,
+      query: scenario.agent_prompt,
+      content: contentHash,
+      oracle: oracleHash,
+      model,
+      prompt: promptVersion,
+    });
+    // A batched run also accepts single-prompt verdicts, which is what its fallback produces
+    const readPromptVersions = batchSize > 1 ? [getBatchPromptVersion(), getPromptVersion()] : [getPromptVersion()];
+    let cacheHits = 0;
 
-    // Call all models in parallel with retry
+    // Call all models in parallel; the shared scheduler paces calls per model
     logger.info(`Calling OpenRouter API with ${models.length} models in parallel...`);
 
     const evaluationPromises = models.map(async (model) => {
-      const MAX_RETRIES = 5;
-      let lastError: any;
-
-      for (let attempt = 1; attempt <= MAX_RETRIES; attempt++) {
-        try {
-          logger.info(`  - Calling ${model} (attempt ${attempt}/${MAX_RETRIES})...`);
-
-          const response = await openai.chat.completions.create({
-            model: model,
-            temperature: 0,
-            max_tokens: 8192,
-            response_format: {
-              type: "json_schema",
-              json_schema: {
-                name: "evaluation_result",
-                strict: true,
-                schema: evaluationSchema
-              }
-            },
-            messages: [
-              {
-                role: 'system',
-                content: systemPrompt
-              },
-              {
-                role: 'user',
-                content: evaluationPrompt
-              }
-            ]
-          } as any);
-
-          const content = response.choices[0]?.message?.content;
-          if (!content) {
-            throw new Error(`No content in response from ${model}`);
-          }
-
-          const evaluation = JSON.parse(content);
-
-          logger.info(`  ✓ ${model}: score=${evaluation.overall_score}, completeness=${evaluation.completeness}, relevance=${evaluation.relevance}, confidence=${evaluation.confidence}`);
-
-          return {
-            model,
-            completeness: evaluation.completeness,
-            relevance: evaluation.relevance,
-            overall_score: evaluation.overall_score,
-            confidence: evaluation.confidence,
-            reasoning: evaluation.reasoning
-          } as SingleModelEvaluation;
-
-        } catch (error: any) {
-          lastError = error;
-          logger.warn(`  ⚠ ${model} attempt ${attempt}/${MAX_RETRIES} failed: ${error.message}`);
-
-          if (attempt < MAX_RETRIES) {
-            // Exponential backoff: 1s, 2s, 4s, 8s
-            const delay = Math.pow(2, attempt - 1) * 1000;
-            logger.info(`  ⏳ Retrying ${model} in ${delay}ms...`);
-            await new Promise(resolve => setTimeout(resolve, delay));
+      if (cache && cacheMode === 'read') {
+        for (const promptVersion of readPromptVersions) {
+          const cached = await cache.get(cacheKeyFor(model, promptVersion));
+          if (cached) {
+            cacheHits++;
+            logger.info(`  ✓ ${model} (cached): score=${cached.overall_score}, completeness=${cached.completeness}, relevance=${cached.relevance}, confidence=${cached.confidence}`);
+            return { ...cached, model };
           }
         }
       }
 
-      // All retries failed
-      logger.error(`  ✗ ${model} failed after ${MAX_RETRIES} attempts: ${lastError.message}`);
-      throw lastError;
-    });
-
-    // Wait for all evaluations to complete
-    const modelEvaluations = await Promise.all(evaluationPromises);
+      const client = getClient();
+      const scheduler = ModelScheduler.getInstance();
+
+      // Single-scenario judge call (also the fallback for a failed batch)
+      const callSingle = () => scheduler.run(model, (attempt) => withSpan('judge_attempt', async () => {
+        logger.info(`  - Calling ${model} (attempt ${attempt})...`);
+
+        const response = await client.chat.completions.create({
+          model: model,
+          ...EVALUATION_REQUEST,
+          response_format: {
+            type: "json_schema",
+            json_schema: {
+              name: "evaluation_result",
+              strict: true,
+              schema: evaluationSchema
+            }
+          },
+          messages: [
+            {
+              role: 'system',
+              content: systemPrompt
+            },
+            {
+              role: 'user',
+              content: evaluationPrompt
+            }
+          ]
+        } as any);
+
+        const content = response.choices[0]?.message?.content;
+        if (!content) {
+          throw new Error(`No content in response from ${model}`);
+        }
 
-    logger.marker('>>>>> All Model Evaluations Complete');
+        const evaluation = JSON.parse(content);
+
+        logger.info(`  ✓ ${model}: score=${evaluation.overall_score}, completeness=${evaluation.completeness}, relevance=${evaluation.relevance}, confidence=${evaluation.confidence}`);
+
+        return {
+          model,
+          completeness: evaluation.completeness,
+          relevance: evaluation.relevance,
+          overall_score: evaluation.overall_score,
+          confidence: evaluation.confidence,
+          reasoning: evaluation.reasoning
+        } as SingleModelEvaluation;
+      }, { model, attempt }), {
+        onRetry: (attempt, delayMs, error) => {
+          logger.warn(`  ⚠ ${model} attempt ${attempt} failed: ${error.message}`);
+          logger.info(`  ⏳ Retrying ${model} in ${delayMs}ms...`);
+        },
+      });
+
+      try {
+        let promptVersion = batchSize > 1 ? getBatchPromptVersion() : getPromptVersion();
+        const result = await withSpan('judge', () => batchSize > 1
+          ? getEvalBatcher(batchSize).load(model, {
+              scenarioId: scenario.id,
+              mode,
+              context: buildScenarioContext(scenario, resultMd, oracleContent),
+              client,
+              logger,
+              single: () => {
+                promptVersion = getPromptVersion();
+                return callSingle();
+              },
+            })
+          : callSingle(), { model, batched: batchSize > 1 });
 
-    // Aggregate results
-    const completenessCount = modelEvaluations.filter(e => e.completeness).length;
-    const relevanceCount = modelEvaluations.filter(e => e.relevance).length;
-    const averageScore = modelEvaluations.reduce((sum, e) => sum + e.overall_score, 0) / modelEvaluations.length;
-    const finalScore = Math.round(averageScore) as 1 | 2 | 3 | 4 | 5;
+        if (cache) {
+          await cache.set(cacheKeyFor(model, promptVersion), result);
+        }
 
-    // Majority vote: 2 out of 3 = true
-    const completenessMajority = completenessCount >= 2;
-    const relevanceMajority = relevanceCount >= 2;
+        return result;
+      } catch (error: any) {
+        // All retries failed (or the error was not retryable)
+        logger.error(`  ✗ ${model} failed: ${error.message}`);
+        throw error;
+      }
+    });
 
-    // Pass only if both completeness AND relevance pass majority vote
-    const pass = completenessMajority && relevanceMajority;
+    const evalPath = path.join(workspaceDir, `evaluation_${mode}.json`);
 
-    // Check consensus (all models agree on completeness and relevance)
-    const allCompleteness = modelEvaluations.every(e => e.completeness);
-    const allRelevance = modelEvaluations.every(e => e.relevance);
-    const noneCompleteness = modelEvaluations.every(e => !e.completeness);
-    const noneRelevance = modelEvaluations.every(e => !e.relevance);
-    const consensus = (allCompleteness || noneCompleteness) && (allRelevance || noneRelevance);
+    // Wait for all evaluations, or only until the majority vote is decided
+    const earlyExit = !!options.earlyExit && models.length > 1;
+    const modelEvaluations = earlyExit
+      ? await waitForMajority(evaluationPromises)
+      : await Promise.all(evaluationPromises);
+    const pendingModels = models.filter(m => !modelEvaluations.some(e => e.model === m));
 
-    const aggregated = {
-      completeness_rate: completenessCount / modelEvaluations.length,
-      relevance_rate: relevanceCount / modelEvaluations.length,
-      average_score: averageScore,
-      final_score: finalScore,
-      completeness_majority: completenessMajority,
-      relevance_majority: relevanceMajority,
-      pass: pass
-    };
+    if (pendingModels.length > 0) {
+      logger.marker('>>>>> Majority Decided (Early Exit)');
+      logger.info(`Still running in background: ${pendingModels.join(', ')}`);
+    } else {
+      logger.marker('>>>>> All Model Evaluations Complete');
+    }
+    if (cache) {
+      logger.info(`Verdict cache: ${cacheHits}/${models.length} reused, ${models.length - cacheHits} model call(s)`);
+    }
 
-    logger.info('='.repeat(80));
-    logger.info('Aggregated Results:');
-    logger.info(`  Final Score: ${finalScore}/5 (avg: ${averageScore.toFixed(2)})`);
-    logger.info(`  Completeness: ${completenessCount}/${modelEvaluations.length} → Majority: ${completenessMajority ? 'PASS ✓' : 'FAIL ✗'}`);
-    logger.info(`  Relevance: ${relevanceCount}/${modelEvaluations.length} → Majority: ${relevanceMajority ? 'PASS ✓' : 'FAIL ✗'}`);
-    logger.info(`  Overall: ${pass ? 'PASS ✓' : 'FAIL ✗'} (Both must pass)`);
-    logger.info(`  Consensus: ${consensus ? 'YES' : 'NO'}`);
-    logger.info('='.repeat(80));
+    const { aggregated, consensus } = aggregateEvaluations(modelEvaluations);
+    logAggregatedResults(logger, modelEvaluations, aggregated, consensus);
 
     // Save evaluation result
-    const evalPath = path.join(workspaceDir, `evaluation_${mode}.json`);
     await fs.writeJson(evalPath, {
       scenario: scenario.id,
       mode,
       timestamp: new Date().toISOString(),
       models: modelEvaluations,
       aggregated,
-      consensus
+      consensus,
+      ...(earlyExit ? { early_exit: true, pending_models: pendingModels } : {}),
     }, { spaces: 2 });
     logger.info(`Evaluation saved to ${evalPath}`);
 
+    if (pendingModels.length > 0) {
+      // Stragglers finish in the background; the file is rewritten with all verdicts
+      trackPendingEvaluation(
+        Promise.allSettled(evaluationPromises).then(async (settled) => {
+          const all = settled
+            .filter((r): r is PromiseFulfilledResult<SingleModelEvaluation> => r.status === 'fulfilled')
+            .map(r => r.value);
+          const failedModels = models.filter(m => !all.some(e => e.model === m));
+          const full = aggregateEvaluations(all);
+
+          logger.marker('>>>>> Background Evaluations Complete');
+          logAggregatedResults(logger, all, full.aggregated, full.consensus);
+
+          await fs.writeJson(evalPath, {
+            scenario: scenario.id,
+            mode,
+            timestamp: new Date().toISOString(),
+            models: all,
+            aggregated: full.aggregated,
+            consensus: full.consensus,
+            early_exit: true,
+            pending_models: [],
+            ...(failedModels.length > 0 ? { failed_models: failedModels } : {}),
+          }, { spaces: 2 });
+          logger.info(`Evaluation updated with all verdicts: ${evalPath}`);
+
+          await options.onComplete?.({ mode, models: all, aggregated: full.aggregated, consensus: full.consensus });
+        }).catch((error: any) => {
+          logger.warn(`Background evaluation update failed: ${error.message}`);
+        })
+      );
+    }
+
     return {
       mode,
       models: modelEvaluations,
       aggregated,
-      consensus
+      consensus,
+      ...(pendingModels.length > 0 ? { pending_models: pendingModels } : {}),
     };
 
   } catch (error: any) {
@@ -380,7 +827,21 @@ function buildEvaluationPrompt(
   prompt += `**Task**: Evaluate whether the MCP context contains sufficient information to implement the oracle code\n\n`;
   prompt += `---\n\n`;
 
-  prompt += `## Original Query\n\n${scenario.agent_prompt}\n\n`;
+  prompt += buildScenarioContext(scenario, resultMd, oracleContent);
+  prompt += buildEvaluationInstructions();
+
+  return prompt;
+}
+
+/**
+ * Scenario-specific prompt sections: query, retrieved context and oracle
+ */
+function buildScenarioContext(
+  scenario: ScenarioSpec,
+  resultMd: string,
+  oracleContent: string
+): string {
+  let prompt = `## Original Query\n\n${scenario.agent_prompt}\n\n`;
   prompt += `---\n\n`;
 
   prompt += `## MCP Context Retrieved\n\n${resultMd}\n\n`;
@@ -396,7 +857,14 @@ function buildEvaluationPrompt(
     prompt += `---\n\n`;
   }
 
-  prompt += `## Evaluation Task\n\n`;
+  return prompt;
+}
+
+/**
+ * Evaluation steps and checklist, shared by single and batched prompts
+ */
+function buildEvaluationInstructions(): string {
+  let prompt = `## Evaluation Task\n\n`;
   prompt += `Follow these steps systematically:\n\n`;
 
   prompt += `### Step 1: Analyze User Requirements\n`;
@@ -1,31 +1,173 @@
 /**
  * Logger for benchmark execution
  * Per-scenario file logging with optional stdout output
+ *
+ * File writes are buffered per file and appended asynchronously, so parallel
+ * workers sharing the event loop never block on log I/O. Buffers flush every
+ * LOG_FLUSH_INTERVAL_MS, when they exceed LOG_FLUSH_BYTES, on flushLogs(), and
+ * synchronously on process exit.
  */
 
 import fs from 'fs-extra';
 import path from 'path';
+import { DEFAULTS } from './constants.js';
+
+export type LogLevel = 'DEBUG' | 'INFO' | 'WARN' | 'ERROR';
+
+const LEVEL_ORDER: Record<LogLevel, number> = { DEBUG: 0, INFO: 1, WARN: 2, ERROR: 3 };
+
+interface FileBuffer {
+  chunks: string[];
+  bytes: number;
+  writing: Promise<void> | null;
+}
+
+const buffers: Map<string, FileBuffer> = new Map();
+const knownDirs: Set<string> = new Set();
+let flushTimer: NodeJS.Timeout | null = null;
+let minLevel: LogLevel = parseLogLevel(process.env.LOG_LEVEL) ?? 'DEBUG';
+
+/**
+ * Parse a level name (case-insensitive); undefined if not a level
+ */
+export function parseLogLevel(value: string | undefined): LogLevel | undefined {
+  const level = value?.toUpperCase() as LogLevel | undefined;
+  return level && level in LEVEL_ORDER ? level : undefined;
+}
+
+/**
+ * Drop log lines below this level (file and stdout); markers and JSONL are always kept
+ */
+export function setLogLevel(level: LogLevel): void {
+  minLevel = level;
+}
+
+function ensureDir(dir: string): void {
+  if (!knownDirs.has(dir)) {
+    fs.ensureDirSync(dir);
+    knownDirs.add(dir);
+  }
+}
+
+function getBuffer(file: string): FileBuffer {
+  let buffer = buffers.get(file);
+  if (!buffer) {
+    buffer = { chunks: [], bytes: 0, writing: null };
+    buffers.set(file, buffer);
+  }
+  return buffer;
+}
+
+/**
+ * Queue text for a file; flushes early once the buffer is large
+ */
+function enqueue(file: string, text: string): void {
+  const buffer = getBuffer(file);
+  buffer.chunks.push(text);
+  buffer.bytes += text.length;
+
+  if (buffer.bytes >= DEFAULTS.LOG_FLUSH_BYTES) {
+    flushFile(file, buffer);
+  } else if (!flushTimer) {
+    flushTimer = setTimeout(() => {
+      flushTimer = null;
+      flushLogs();
+    }, DEFAULTS.LOG_FLUSH_INTERVAL_MS);
+    flushTimer.unref();
+  }
+}
+
+/**
+ * Append a file's buffered text; appends to one file never overlap, so order is kept
+ */
+function flushFile(file: string, buffer: FileBuffer): Promise<void> {
+  if (buffer.writing) {
+    return buffer.writing;
+  }
+  if (buffer.chunks.length === 0) {
+    return Promise.resolve();
+  }
+
+  const data = buffer.chunks.join('');
+  buffer.chunks = [];
+  buffer.bytes = 0;
+
+  buffer.writing = fs.appendFile(file, data)
+    .catch((error: any) => {
+      console.error(`Failed to write log ${file}: ${error.message}`);
+    })
+    .finally(() => {
+      buffer.writing = null;
+    })
+    .then(() => {
+      // Lines logged while this append was in flight
+      if (buffer.chunks.length > 0) {
+        return flushFile(file, buffer);
+      }
+      // Idle files are dropped so long runs don't accumulate buffers
+      if (buffers.get(file) === buffer) {
+        buffers.delete(file);
+      }
+    });
+
+  return buffer.writing;
+}
+
+/**
+ * Write out every buffered log line
+ */
+export async function flushLogs(): Promise<void> {
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+  await Promise.all(Array.from(buffers.entries()).map(([file, buffer]) => flushFile(file, buffer)));
+}
+
+// Last resort for process.exit() and crashes: write what is still queued synchronously.
+// An append already handed to the OS may be partly written, so it is not repeated
+process.on('exit', () => {
+  for (const [file, buffer] of buffers.entries()) {
+    if (buffer.chunks.length > 0) {
+      try {
+        fs.appendFileSync(file, buffer.chunks.join(''));
+      } catch {
+        // Nothing left to report to
+      }
+      buffer.chunks = [];
+    }
+  }
+});
 
 export class Logger {
   private logFile: string;
   private verbose: boolean;
 
   constructor(logDir: string, logFileName: string, verbose = false, append = false) {
-    fs.ensureDirSync(logDir);
+    ensureDir(logDir);
     this.logFile = path.join(logDir, logFileName);
     this.verbose = verbose;
 
     // Clear log file unless append mode
     if (!append) {
+      const buffer = buffers.get(this.logFile);
+      if (buffer) {
+        buffer.chunks = [];
+        buffer.bytes = 0;
+      }
       fs.writeFileSync(this.logFile, '');
     }
   }
 
-  private write(level: 'INFO' | 'ERROR' | 'DEBUG' | 'WARN', message: string) {
+  private write(level: LogLevel, message: string, force = false) {
+    if (!force && LEVEL_ORDER[level] < LEVEL_ORDER[minLevel]) {
+      return;
+    }
+
     const timestamp = new Date().toISOString().replace('T', ' ').substring(0, 19);
     const logLine = `${timestamp} - ${level} - ${message}\n`;
 
-    fs.appendFileSync(this.logFile, logLine);
+    enqueue(this.logFile, logLine);
 
     if (this.verbose || level === 'ERROR' || level === 'WARN') {
       console.log(logLine.trim());
@@ -49,7 +191,7 @@ export class Logger {
   }
 
   marker(marker: string) {
-    this.write('INFO', marker);
+    this.write('INFO', marker, true);
   }
 
   /**
@@ -58,7 +200,17 @@ export class Logger {
   jsonl(data: any) {
     const timestamp = new Date().toISOString();
     const entry = { timestamp, ...data };
-    fs.appendFileSync(this.logFile, JSON.stringify(entry) + '\n');
+    enqueue(this.logFile, JSON.stringify(entry) + '\n');
+  }
+
+  /**
+   * Write out this logger's buffered lines
+   */
+  async flush(): Promise<void> {
+    const buffer = buffers.get(this.logFile);
+    if (buffer) {
+      await flushFile(this.logFile, buffer);
+    }
   }
 }
 
@@ -93,9 +245,9 @@ export function createBuildLogger(
  * Useful for logging tool calls incrementally
  */
 export function appendJsonl(logDir: string, logFileName: string, data: any): void {
-  fs.ensureDirSync(logDir);
+  ensureDir(logDir);
   const logFile = path.join(logDir, logFileName);
   const timestamp = new Date().toISOString();
   const entry = { timestamp, ...data };
-  fs.appendFileSync(logFile, JSON.stringify(entry) + '\n');
+  enqueue(logFile, JSON.stringify(entry) + '\n');
 }
@@ -11,6 +11,7 @@
 import { Client } from '@modelcontextprotocol/sdk/client/index.js';
 import { StdioClientTransport } from '@modelcontextprotocol/sdk/client/stdio.js';
 import { MCPServerConfig } from './types.js';
+import { DEFAULTS } from './constants.js';
 
 export interface MCPToolCall {
   name: string;
@@ -31,11 +32,21 @@ export class SimpleMCPClient {
   private config: MCPServerConfig;
   private connected: boolean = false;
 
+  /**
+   * Called when the connection closes (child process exit or disconnect())
+   */
+  onclose?: () => void;
+
   constructor(config: MCPServerConfig) {
     this.config = config;
+    this.client = this.createClient();
+  }
 
-    // Create MCP client
-    this.client = new Client(
+  /**
+   * Create MCP client (a fresh one per connection so reconnects start clean)
+   */
+  private createClient(): Client {
+    return new Client(
       {
         name: 'context-bench-client',
         version: '1.0.0',
@@ -65,6 +76,7 @@ export class SimpleMCPClient {
     }
 
     // Create stdio transport
+    this.client = this.createClient();
     this.transport = new StdioClientTransport({
       command: this.config.command,
       args: this.config.args,
@@ -74,6 +86,13 @@ export class SimpleMCPClient {
       } as Record<string, string>,
     });
 
+    // Track unexpected exits of the server process
+    this.client.onclose = () => {
+      this.connected = false;
+      this.transport = null;
+      this.onclose?.();
+    };
+
     // Connect client to transport
     await this.client.connect(this.transport);
     this.connected = true;
@@ -230,15 +249,270 @@ export async function connectToMCPServer(config: MCPServerConfig): Promise<Simpl
   return client;
 }
 
+interface PoolMember {
+  id: number;
+  client: SimpleMCPClient;
+  inFlight: number;
+  calls: number;
+  reconnecting: Promise<void> | null;
+}
+
+export interface MCPPoolStats {
+  server: string;
+  size: number;
+  connected: number;
+  in_flight: number;
+  calls: number;
+  reconnects: number;
+  failed_probes: number;
+}
+
+/**
+ * Pool of stdio connections to one MCP server
+ * Calls go to the least busy live connection. Connections whose child process
+ * dies are reconnected with backoff, and idle connections are probed with
+ * listTools so hung servers get replaced before a worker hits them.
+ */
+export class MCPClientPool {
+  private members: PoolMember[] = [];
+  private healthTimer: NodeJS.Timeout | null = null;
+  private closed: boolean = false;
+  private nextPick: number = 0;
+  private reconnects: number = 0;
+  private failedProbes: number = 0;
+
+  constructor(
+    private serverName: string,
+    private config: MCPServerConfig,
+    private size: number = 1
+  ) {}
+
+  /**
+   * Start all connections; succeeds if at least one connects
+   */
+  async connect(): Promise<void> {
+    this.closed = false;
+    this.members = Array.from({ length: Math.max(1, this.size) }, (_, id) => this.createMember(id));
+
+    const results = await Promise.allSettled(this.members.map(m => m.client.connect()));
+    const failures = results.filter((r): r is PromiseRejectedResult => r.status === 'rejected');
+
+    if (failures.length === results.length) {
+      this.members = [];
+      throw failures[0].reason;
+    }
+
+    // Members that failed to start are retried in the background
+    results.forEach((r, i) => {
+      if (r.status === 'rejected') {
+        this.scheduleReconnect(this.members[i]);
+      }
+    });
+
+    this.healthTimer = setInterval(() => this.probe(), DEFAULTS.MCP_HEALTH_INTERVAL_MS);
+    this.healthTimer.unref();
+  }
+
+  /**
+   * Close every connection and stop health probes
+   */
+  async disconnect(): Promise<void> {
+    this.closed = true;
+    if (this.healthTimer) {
+      clearInterval(this.healthTimer);
+      this.healthTimer = null;
+    }
+    await Promise.all(this.members.map(m => m.client.disconnect().catch(() => {})));
+    this.members = [];
+  }
+
+  /**
+   * Call a tool on the least busy live connection
+   */
+  async callTool(name: string, args: Record<string, any>): Promise<MCPToolResult> {
+    let member = await this.acquire();
+    if (!member) {
+      return {
+        content: `MCP server '${this.serverName}' has no live connections`,
+        isError: true,
+      };
+    }
+
+    let result = await this.dispatch(member, name, args);
+
+    // The child process died mid-call: retry once on another live connection
+    if (result.isError && !member.client.isConnected()) {
+      member = await this.acquire();
+      if (member) {
+        result = await this.dispatch(member, name, args);
+      }
+    }
+
+    return result;
+  }
+
+  /**
+   * Least busy live client (for direct use outside callTool)
+   */
+  getClient(): SimpleMCPClient | undefined {
+    return this.pick()?.client;
+  }
+
+  isConnected(): boolean {
+    return this.members.some(m => m.client.isConnected());
+  }
+
+  async listTools(): Promise<any[]> {
+    const member = await this.acquire();
+    if (!member) {
+      throw new Error(`MCP server '${this.serverName}' has no live connections`);
+    }
+    return member.client.listTools();
+  }
+
+  getStats(): MCPPoolStats {
+    return {
+      server: this.serverName,
+      size: this.members.length,
+      connected: this.members.filter(m => m.client.isConnected()).length,
+      in_flight: this.members.reduce((sum, m) => sum + m.inFlight, 0),
+      calls: this.members.reduce((sum, m) => sum + m.calls, 0),
+      reconnects: this.reconnects,
+      failed_probes: this.failedProbes,
+    };
+  }
+
+  private createMember(id: number): PoolMember {
+    const member: PoolMember = {
+      id,
+      client: new SimpleMCPClient(this.config),
+      inFlight: 0,
+      calls: 0,
+      reconnecting: null,
+    };
+    member.client.onclose = () => {
+      if (!this.closed) {
+        this.scheduleReconnect(member);
+      }
+    };
+    return member;
+  }
+
+  private async dispatch(member: PoolMember, name: string, args: Record<string, any>): Promise<MCPToolResult> {
+    member.inFlight++;
+    member.calls++;
+    try {
+      return await member.client.callTool(name, args);
+    } finally {
+      member.inFlight--;
+    }
+  }
+
+  /**
+   * Least busy live member; ties rotate so idle connections share the load
+   */
+  private pick(): PoolMember | undefined {
+    const live = this.members.filter(m => m.client.isConnected());
+    if (live.length === 0) {
+      return undefined;
+    }
+
+    const start = this.nextPick++ % live.length;
+    let best = live[start];
+    for (let i = 1; i < live.length; i++) {
+      const candidate = live[(start + i) % live.length];
+      if (candidate.inFlight < best.inFlight) {
+        best = candidate;
+      }
+    }
+    return best;
+  }
+
+  /**
+   * Pick a member, waiting for an in-progress reconnect if nothing is live
+   */
+  private async acquire(): Promise<PoolMember | undefined> {
+    const member = this.pick();
+    if (member || this.closed) {
+      return member;
+    }
+
+    const pending = this.members.map(m => m.reconnecting).filter((p): p is Promise<void> => p !== null);
+    if (pending.length > 0) {
+      await Promise.race(pending.map(p => p.catch(() => {})));
+    }
+    return this.pick();
+  }
+
+  private scheduleReconnect(member: PoolMember): void {
+    if (member.reconnecting || this.closed) {
+      return;
+    }
+
+    member.reconnecting = (async () => {
+      for (let attempt = 1; attempt <= DEFAULTS.MCP_RECONNECT_ATTEMPTS && !this.closed; attempt++) {
+        await new Promise(resolve => setTimeout(resolve, Math.min(30000, 1000 * Math.pow(2, attempt - 1))));
+        if (this.closed) return;
+        try {
+          await member.client.disconnect().catch(() => {});
+          await member.client.connect();
+          this.reconnects++;
+          console.error(`MCP server '${this.serverName}' connection #${member.id} reconnected`);
+          return;
+        } catch (error: any) {
+          console.error(`MCP server '${this.serverName}' connection #${member.id} reconnect ${attempt} failed: ${error.message || error}`);
+        }
+      }
+      // Gave up for now; the next health probe schedules another round
+    })().finally(() => {
+      member.reconnecting = null;
+    });
+  }
+
+  /**
+   * Health probe: listTools on idle connections, recycle the ones that fail
+   */
+  private async probe(): Promise<void> {
+    await Promise.all(this.members.map(async (member) => {
+      if (this.closed || member.reconnecting) return;
+
+      if (!member.client.isConnected()) {
+        this.scheduleReconnect(member);
+        return;
+      }
+      if (member.inFlight > 0) return;
+
+      let timer: NodeJS.Timeout | undefined;
+      try {
+        await Promise.race([
+          member.client.listTools(),
+          new Promise((_, reject) => {
+            timer = setTimeout(() => reject(new Error('health probe timed out')), DEFAULTS.MCP_HEALTH_TIMEOUT_MS);
+          }),
+        ]);
+      } catch (error: any) {
+        this.failedProbes++;
+        console.error(`MCP server '${this.serverName}' connection #${member.id} failed health probe: ${error.message}`);
+        // disconnect() fires onclose, which schedules the reconnect
+        await member.client.disconnect().catch(() => {});
+        this.scheduleReconnect(member);
+      } finally {
+        if (timer) clearTimeout(timer);
+      }
+    }));
+  }
+}
+
 /**
  * MCP Client Manager
  * Manages multiple MCP server connections from a config
+ * Each server is backed by a pool of poolSize stdio connections
  */
 export class MCPClientManager {
-  private clients: Map<string, SimpleMCPClient> = new Map();
+  private clients: Map<string, MCPClientPool> = new Map();
   private connected: boolean = false;
 
-  constructor(private mcpServers: Record<string, MCPServerConfig>) {}
+  constructor(private mcpServers: Record<string, MCPServerConfig>, private poolSize: number = 1) {}
 
   /**
    * Connect to all MCP servers
@@ -253,9 +527,9 @@ export class MCPClientManager {
     const connectionPromises = Object.entries(this.mcpServers).map(
       async ([serverName, serverConfig]) => {
         try {
-          const client = new SimpleMCPClient(serverConfig);
-          await client.connect();
-          this.clients.set(serverName, client);
+          const pool = new MCPClientPool(serverName, serverConfig, this.poolSize);
+          await pool.connect();
+          this.clients.set(serverName, pool);
           results.set(serverName, { success: true });
           return { serverName, success: true };
         } catch (error: any) {
@@ -281,7 +555,7 @@ export class MCPClientManager {
     }
 
     const disconnectionPromises = Array.from(this.clients.values()).map(
-      client => client.disconnect()
+      pool => pool.disconnect()
     );
 
     await Promise.all(disconnectionPromises);
@@ -290,10 +564,10 @@ export class MCPClientManager {
   }
 
   /**
-   * Get a specific MCP client by server name
+   * Get a specific MCP client by server name (least busy pool member)
    */
   getClient(serverName: string): SimpleMCPClient | undefined {
-    return this.clients.get(serverName);
+    return this.clients.get(serverName)?.getClient();
   }
 
   /**
@@ -307,8 +581,8 @@ export class MCPClientManager {
    * Check if a specific server is connected
    */
   isServerConnected(serverName: string): boolean {
-    const client = this.clients.get(serverName);
-    return client?.isConnected() ?? false;
+    const pool = this.clients.get(serverName);
+    return pool?.isConnected() ?? false;
   }
 
   /**
@@ -319,16 +593,16 @@ export class MCPClientManager {
     toolName: string,
     args: Record<string, any>
   ): Promise<MCPToolResult> {
-    const client = this.clients.get(serverName);
+    const pool = this.clients.get(serverName);
 
-    if (!client) {
+    if (!pool) {
       return {
         content: `MCP server '${serverName}' not found or not connected`,
         isError: true,
       };
     }
 
-    return client.callTool(toolName, args);
+    return pool.callTool(toolName, args);
   }
 
   /**
@@ -337,9 +611,9 @@ export class MCPClientManager {
   async listAllTools(): Promise<Record<string, any[]>> {
     const toolsMap: Record<string, any[]> = {};
 
-    for (const [serverName, client] of this.clients.entries()) {
+    for (const [serverName, pool] of this.clients.entries()) {
       try {
-        const tools = await client.listTools();
+        const tools = await pool.listTools();
         toolsMap[serverName] = tools;
       } catch (error: any) {
         console.error(`Failed to list tools for '${serverName}': ${error.message}`);
@@ -350,6 +624,13 @@ export class MCPClientManager {
     return toolsMap;
   }
 
+  /**
+   * Per-server pool statistics
+   */
+  getPoolStats(): MCPPoolStats[] {
+    return Array.from(this.clients.values()).map(pool => pool.getStats());
+  }
+
   /**
    * Check if manager is connected
    */
@@ -0,0 +1,296 @@
+/**
+ * MCP call recorder for agent runs
+ * Tracks in-flight MCP tool calls by tool_use_id and persists each call to
+ * <workspace>/mcp_results/ as soon as its result arrives: call_<n>.md plus a
+ * line in calls.jsonl. Token counting and file writes run on a serialized
+ * background queue, so the agent message loop never waits on them, and only
+ * per-call metadata stays in memory. summary.md and calls.json are assembled
+ * from calls.jsonl when the run ends, including after a failed run.
+ */
+
+import fs from 'fs-extra';
+import path from 'path';
+import readline from 'readline';
+import { MCPConfig } from './types.js';
+import { Logger } from './logger.js';
+import { countTokens, mcpContentToText } from './tokens.js';
+
+export const MCP_RESULTS_DIR = 'mcp_results';
+export const MCP_CALLS_JOURNAL = 'calls.jsonl';
+
+export interface MCPCall {
+  call_num: number;
+  timestamp: string;
+  tool: string;
+  tool_use_id: string;
+  input: any;
+  output?: any;
+  error?: string;
+  duration_ms?: number;
+}
+
+export interface MCPStats {
+  total_calls: number;
+  total_elapsed_ms: number;
+  total_input_tokens: number;
+  total_output_tokens: number;
+}
+
+export class McpCallRecorder {
+  private readonly dir: string;
+  private readonly journal: string;
+  private inFlight: Map<string, MCPCall> = new Map();
+  private tools: Set<string> = new Set();
+  private callCount = 0;
+  private stats: MCPStats = { total_calls: 0, total_elapsed_ms: 0, total_input_tokens: 0, total_output_tokens: 0 };
+  private queue: Promise<void> = Promise.resolve();
+  private journalReady: Promise<void> | null = null;
+  private finished: Promise<MCPStats> | null = null;
+
+  constructor(workspaceDir: string, private readonly config: MCPConfig, private readonly logger: Logger) {
+    this.dir = path.join(workspaceDir, MCP_RESULTS_DIR);
+    this.journal = path.join(this.dir, MCP_CALLS_JOURNAL);
+  }
+
+  get size(): number {
+    return this.callCount;
+  }
+
+  /**
+   * Register a tool_use block for an MCP tool
+   */
+  start(toolUseId: string, tool: string, input: any): void {
+    this.inFlight.set(toolUseId, {
+      call_num: ++this.callCount,
+      timestamp: new Date().toISOString(),
+      tool,
+      tool_use_id: toolUseId,
+      input,
+    });
+    this.tools.add(tool);
+  }
+
+  /**
+   * Attach a tool_result to its call and persist it; unknown ids are ignored
+   */
+  complete(toolUseId: string, content: any, isError: boolean): void {
+    const call = this.inFlight.get(toolUseId);
+    if (!call) {
+      return;
+    }
+    this.inFlight.delete(toolUseId);
+
+    if (isError) {
+      call.error = typeof content === 'string' ? content : JSON.stringify(content);
+    } else {
+      call.output = content;
+    }
+    call.duration_ms = Date.now() - new Date(call.timestamp).getTime();
+    this.persist(call);
+  }
+
+  /**
+   * Persist calls still in flight, write summary.md and calls.json, and return totals
+   */
+  finish(): Promise<MCPStats> {
+    if (!this.finished) {
+      this.finished = (async () => {
+        for (const call of this.inFlight.values()) {
+          this.persist(call);
+        }
+        this.inFlight.clear();
+        await this.queue;
+        await this.writeSummary();
+        await this.writeCallsJson();
+
+        const { total_calls, total_elapsed_ms, total_input_tokens, total_output_tokens } = this.stats;
+        this.logger.info(`MCP Stats: ${total_calls} calls, ${total_elapsed_ms}ms total, ${total_input_tokens} input tokens, ${total_output_tokens} output tokens`);
+        return { ...this.stats };
+      })();
+    }
+    return this.finished;
+  }
+
+  private persist(call: MCPCall): void {
+    this.queue = this.queue
+      // Yield so the message loop keeps draining the agent stream
+      .then(() => new Promise<void>(resolve => setImmediate(resolve)))
+      .then(async () => {
+        this.stats.total_calls++;
+        this.stats.total_elapsed_ms += call.duration_ms || 0;
+        if (call.input) {
+          this.stats.total_input_tokens += this.countMcpTokens(call.input);
+        }
+        if (call.output) {
+          this.stats.total_output_tokens += this.countMcpTokens(call.output);
+        }
+
+        // Created on the first call, so runs without MCP calls leave no mcp_results/
+        this.journalReady ??= fs.ensureDir(this.dir).then(() => fs.writeFile(this.journal, ''));
+        await this.journalReady;
+        await fs.appendFile(this.journal, JSON.stringify(call) + '\n');
+        await fs.writeFile(path.join(this.dir, `call_${call.call_num}.md`), formatCallMarkdown(call));
+        this.logger.info(`MCP call ${call.call_num} saved to ${this.dir}/call_${call.call_num}.md`);
+      })
+      .catch((error: any) => {
+        this.logger.error(`Failed to save MCP call ${call.call_num}: ${error.message}`);
+      });
+  }
+
+  /**
+   * Count tokens in MCP data using the shared cl100k_base encoder
+   */
+  private countMcpTokens(data: any): number {
+    try {
+      return countTokens(mcpContentToText(data));
+    } catch (error: any) {
+      this.logger.warn(`Failed to count MCP tokens: ${error.message}`);
+      return 0;
+    }
+  }
+
+  /**
+   * Stream journal entries (completion order)
+   */
+  private async *readJournal(): AsyncGenerator<MCPCall> {
+    const lines = readline.createInterface({ input: fs.createReadStream(this.journal), crlfDelay: Infinity });
+    for await (const line of lines) {
+      if (line.trim()) {
+        yield JSON.parse(line) as MCPCall;
+      }
+    }
+  }
+
+  /**
+   * summary.md grouped by tool, one journal pass per tool
+   */
+  private async writeSummary(): Promise<void> {
+    const summaryPath = path.join(this.dir, 'summary.md');
+    const out = fs.createWriteStream(summaryPath);
+
+    let header = `# MCP Tool Calls Summary\n\n`;
+    header += `**Configuration**: ${this.config.config_name}\n`;
+    header += `**MCP Servers**: ${Object.keys(this.config.mcp_servers).join(', ')}\n`;
+    header += `**Total Calls**: ${this.callCount}\n`;
+    header += `**Generated**: ${new Date().toISOString()}\n\n`;
+    header += `---\n\n`;
+    header += `## Calls by Tool\n\n`;
+    await write(out, header);
+
+    const counts = new Map<string, number>();
+    for await (const call of this.readJournal()) {
+      counts.set(call.tool, (counts.get(call.tool) ?? 0) + 1);
+    }
+
+    for (const tool of this.tools) {
+      await write(out, `### ${tool} (${counts.get(tool) ?? 0} calls)\n\n`);
+      let idx = 0;
+      for await (const call of this.readJournal()) {
+        if (call.tool === tool) {
+          await write(out, formatSummaryEntry(call, ++idx));
+        }
+      }
+    }
+
+    await new Promise<void>((resolve, reject) => out.end((error?: Error | null) => error ? reject(error) : resolve()));
+    this.logger.info(`MCP results saved to ${this.dir}/summary.md`);
+  }
+
+  /**
+   * calls.json with the same shape as before, streamed from the journal
+   */
+  private async writeCallsJson(): Promise<void> {
+    const jsonPath = path.join(this.dir, 'calls.json');
+    const out = fs.createWriteStream(jsonPath);
+    const indent = (text: string) => text.replace(/\n/g, '\n    ');
+
+    await write(out, `{\n  "config": ${JSON.stringify(this.config.config_name)},\n`);
+    await write(out, `  "servers": ${JSON.stringify(Object.keys(this.config.mcp_servers))},\n`);
+    await write(out, `  "total_calls": ${this.callCount},\n  "calls": [`);
+    let first = true;
+    for await (const call of this.readJournal()) {
+      await write(out, `${first ? '' : ','}\n    ${indent(JSON.stringify(call, null, 2))}`);
+      first = false;
+    }
+    await write(out, `${first ? '' : '\n  '}],\n  "generated_at": ${JSON.stringify(new Date().toISOString())}\n}`);
+
+    await new Promise<void>((resolve, reject) => out.end((error?: Error | null) => error ? reject(error) : resolve()));
+    this.logger.info(`MCP calls JSON saved to ${this.dir}/calls.json`);
+  }
+}
+
+/**
+ * Write to a stream, waiting for drain when its buffer is full
+ */
+async function write(out: fs.WriteStream, chunk: string): Promise<void> {
+  if (!out.write(chunk)) {
+    await new Promise(resolve => out.once('drain', resolve));
+  }
+}
+
+function formatSummaryEntry(call: MCPCall, idx: number): string {
+  let entry = `#### Call ${idx}\n\n`;
+  entry += `**Timestamp**: ${call.timestamp}\n`;
+  if (call.duration_ms) {
+    entry += `**Duration**: ${call.duration_ms}ms\n`;
+  }
+  entry += `\n**Input**:\n\`\`\`json\n${JSON.stringify(call.input, null, 2)}\n\`\`\`\n\n`;
+
+  if (call.error) {
+    entry += `**Error**:\n\`\`\`\n${call.error}\n\`\`\`\n\n`;
+  } else if (call.output) {
+    const outputStr = typeof call.output === 'string'
+      ? call.output
+      : JSON.stringify(call.output, null, 2);
+    entry += `**Output**:\n\`\`\`\n${outputStr}\n\`\`\`\n\n`;
+  } else {
+    entry += `**Output**: _(No response captured)_\n\n`;
+  }
+
+  entry += `---\n\n`;
+  return entry;
+}
+
+function formatCallMarkdown(call: MCPCall): string {
+  let callMd = `# MCP Call ${call.call_num}\n\n`;
+  callMd += `**Tool**: ${call.tool}\n`;
+  callMd += `**Timestamp**: ${call.timestamp}\n`;
+  callMd += `**Tool Use ID**: ${call.tool_use_id}\n`;
+  if (call.duration_ms) {
+    callMd += `**Duration**: ${call.duration_ms}ms\n`;
+  }
+  callMd += `\n---\n\n`;
+
+  callMd += `## Input\n\n\`\`\`json\n${JSON.stringify(call.input, null, 2)}\n\`\`\`\n\n`;
+
+  callMd += `## Output\n\n`;
+
+  if (call.error) {
+    callMd += `**Error occurred:**\n\n\`\`\`\n${call.error}\n\`\`\`\n`;
+  } else if (call.output) {
+    // Extract text from output if it's an array with text blocks
+    let outputText = '';
+
+    if (Array.isArray(call.output)) {
+      // Output is an array of blocks with type and text
+      for (const block of call.output) {
+        if (block.type === 'text' && block.text) {
+          outputText += block.text + '\n\n';
+        }
+      }
+    } else if (typeof call.output === 'string') {
+      outputText = call.output;
+    } else if (typeof call.output === 'object' && call.output.text) {
+      outputText = call.output.text;
+    } else {
+      // Fallback: stringify the whole output
+      outputText = JSON.stringify(call.output, null, 2);
+    }
+
+    callMd += outputText.trim() + '\n';
+  } else {
+    callMd += `_(No response captured)_\n`;
+  }
+
+  return callMd;
+}
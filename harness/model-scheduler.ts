@@ -0,0 +1,285 @@
+/**
+ * Shared scheduler for evaluator model calls
+ * One lane per model with a token bucket (requests per minute), an adaptive
+ * concurrency limit (additive increase, multiplicative decrease on 429) and a
+ * FIFO wait queue. Every parallel worker in the process goes through the same
+ * lanes, so a rate limit seen by one scenario pauses the whole model.
+ */
+
+import { DEFAULTS } from './constants.js';
+
+export interface ModelSchedulerOptions {
+  maxConcurrency: number;     // Upper bound on in-flight calls per model
+  requestsPerMinute: number;  // Token bucket refill rate per model
+  maxRetries: number;         // Attempts per call, including the first
+  baseDelayMs: number;        // Backoff base (full jitter)
+  maxDelayMs: number;         // Backoff cap
+}
+
+export interface ModelMetrics {
+  model: string;
+  queued: number;
+  in_flight: number;
+  concurrency_limit: number;
+  max_queue_depth: number;
+  completed: number;
+  failed: number;
+  retries: number;
+  rate_limited: number;
+  avg_wait_ms: number;
+  max_wait_ms: number;
+}
+
+export interface ScheduleHooks {
+  onRetry?: (attempt: number, delayMs: number, error: any) => void;
+}
+
+interface Waiter {
+  enqueuedAt: number;
+  resolve: (waitMs: number) => void;
+}
+
+interface Lane {
+  tokens: number;
+  lastRefill: number;
+  limit: number;
+  inFlight: number;
+  blockedUntil: number;
+  queue: Waiter[];
+  timer: NodeJS.Timeout | null;
+  maxQueueDepth: number;
+  completed: number;
+  failed: number;
+  retries: number;
+  rateLimited: number;
+  totalWaitMs: number;
+  maxWaitMs: number;
+  acquisitions: number;
+}
+
+const NON_RETRYABLE_STATUS = new Set([400, 401, 403, 404, 422]);
+
+/**
+ * Read a header from an SDK error (plain object or Headers instance)
+ */
+function getHeader(headers: any, name: string): string | undefined {
+  if (!headers) return undefined;
+  if (typeof headers.get === 'function') {
+    return headers.get(name) ?? undefined;
+  }
+  return headers[name] ?? headers[name.toLowerCase()];
+}
+
+/**
+ * Retry-After hint in ms (retry-after-ms, retry-after seconds or HTTP date)
+ */
+export function getRetryAfterMs(error: any): number | undefined {
+  const headers = error?.headers;
+  const ms = Number(getHeader(headers, 'retry-after-ms'));
+  if (Number.isFinite(ms) && ms > 0) {
+    return ms;
+  }
+
+  const retryAfter = getHeader(headers, 'retry-after');
+  if (!retryAfter) return undefined;
+
+  const seconds = Number(retryAfter);
+  if (Number.isFinite(seconds)) {
+    return Math.max(0, seconds * 1000);
+  }
+
+  const date = Date.parse(retryAfter);
+  return Number.isNaN(date) ? undefined : Math.max(0, date - Date.now());
+}
+
+export class ModelScheduler {
+  private static instance: ModelScheduler;
+  private lanes: Map<string, Lane> = new Map();
+  private options: ModelSchedulerOptions = {
+    maxConcurrency: DEFAULTS.EVAL_CONCURRENCY,
+    requestsPerMinute: DEFAULTS.EVAL_REQUESTS_PER_MINUTE,
+    maxRetries: DEFAULTS.EVAL_MAX_RETRIES,
+    baseDelayMs: 1000,
+    maxDelayMs: 30000,
+  };
+
+  private constructor() {}
+
+  /**
+   * Get singleton instance
+   */
+  public static getInstance(): ModelScheduler {
+    if (!ModelScheduler.instance) {
+      ModelScheduler.instance = new ModelScheduler();
+    }
+    return ModelScheduler.instance;
+  }
+
+  /**
+   * Override scheduler limits (call before the first evaluation)
+   */
+  configure(options: Partial<ModelSchedulerOptions>): void {
+    this.options = { ...this.options, ...options };
+    for (const lane of this.lanes.values()) {
+      lane.limit = Math.min(lane.limit, this.options.maxConcurrency);
+    }
+  }
+
+  /**
+   * Run a model call through the model's lane, retrying with jittered backoff
+   */
+  async run<T>(model: string, task: (attempt: number) => Promise<T>, hooks: ScheduleHooks = {}): Promise<T> {
+    const lane = this.getLane(model);
+    let lastError: any;
+
+    for (let attempt = 1; attempt <= this.options.maxRetries; attempt++) {
+      await this.acquire(lane);
+
+      try {
+        const result = await task(attempt);
+        this.release(lane, 'success');
+        lane.completed++;
+        return result;
+      } catch (error: any) {
+        lastError = error;
+        const status = error?.status as number | undefined;
+        const rateLimited = status === 429;
+        this.release(lane, rateLimited ? 'rate_limited' : 'error');
+
+        if ((status && NON_RETRYABLE_STATUS.has(status)) || attempt >= this.options.maxRetries) {
+          break;
+        }
+
+        // Full jitter, but never earlier than the server asked for
+        const cap = Math.min(this.options.maxDelayMs, this.options.baseDelayMs * Math.pow(2, attempt - 1));
+        let delay = Math.random() * cap;
+        const retryAfter = getRetryAfterMs(error);
+        if (retryAfter !== undefined) {
+          delay = Math.max(delay, retryAfter);
+        }
+        if (rateLimited) {
+          lane.rateLimited++;
+          // Pause the whole lane, not just this caller
+          lane.blockedUntil = Math.max(lane.blockedUntil, Date.now() + delay);
+        }
+
+        lane.retries++;
+        hooks.onRetry?.(attempt, Math.round(delay), error);
+        await new Promise(resolve => setTimeout(resolve, delay));
+      }
+    }
+
+    lane.failed++;
+    throw lastError;
+  }
+
+  /**
+   * Snapshot of per-model queue and latency metrics
+   */
+  getMetrics(): ModelMetrics[] {
+    return Array.from(this.lanes.entries()).map(([model, lane]) => ({
+      model,
+      queued: lane.queue.length,
+      in_flight: lane.inFlight,
+      concurrency_limit: Math.floor(lane.limit),
+      max_queue_depth: lane.maxQueueDepth,
+      completed: lane.completed,
+      failed: lane.failed,
+      retries: lane.retries,
+      rate_limited: lane.rateLimited,
+      avg_wait_ms: lane.acquisitions > 0 ? Math.round(lane.totalWaitMs / lane.acquisitions) : 0,
+      max_wait_ms: Math.round(lane.maxWaitMs),
+    }));
+  }
+
+  private getLane(model: string): Lane {
+    let lane = this.lanes.get(model);
+    if (!lane) {
+      lane = {
+        tokens: this.options.maxConcurrency,  // Allow an initial burst
+        lastRefill: Date.now(),
+        limit: this.options.maxConcurrency,
+        inFlight: 0,
+        blockedUntil: 0,
+        queue: [],
+        timer: null,
+        maxQueueDepth: 0,
+        completed: 0,
+        failed: 0,
+        retries: 0,
+        rateLimited: 0,
+        totalWaitMs: 0,
+        maxWaitMs: 0,
+        acquisitions: 0,
+      };
+      this.lanes.set(model, lane);
+    }
+    return lane;
+  }
+
+  private acquire(lane: Lane): Promise<void> {
+    return new Promise(resolve => {
+      lane.queue.push({
+        enqueuedAt: Date.now(),
+        resolve: (waitMs: number) => {
+          lane.acquisitions++;
+          lane.totalWaitMs += waitMs;
+          lane.maxWaitMs = Math.max(lane.maxWaitMs, waitMs);
+          resolve();
+        },
+      });
+      lane.maxQueueDepth = Math.max(lane.maxQueueDepth, lane.queue.length);
+      this.pump(lane);
+    });
+  }
+
+  private release(lane: Lane, outcome: 'success' | 'error' | 'rate_limited'): void {
+    lane.inFlight--;
+
+    if (outcome === 'success') {
+      // Additive increase: roughly +1 slot per window of successful calls
+      lane.limit = Math.min(this.options.maxConcurrency, lane.limit + 1 / Math.max(1, lane.limit));
+    } else if (outcome === 'rate_limited') {
+      // Multiplicative decrease
+      lane.limit = Math.max(1, lane.limit / 2);
+    }
+
+    this.pump(lane);
+  }
+
+  private refill(lane: Lane): void {
+    const now = Date.now();
+    const perMs = this.options.requestsPerMinute / 60000;
+    const burst = Math.max(1, this.options.maxConcurrency);
+    lane.tokens = Math.min(burst, lane.tokens + (now - lane.lastRefill) * perMs);
+    lane.lastRefill = now;
+  }
+
+  private pump(lane: Lane): void {
+    if (lane.timer) {
+      clearTimeout(lane.timer);
+      lane.timer = null;
+    }
+
+    this.refill(lane);
+    const now = Date.now();
+
+    while (lane.queue.length > 0 && lane.inFlight < Math.floor(lane.limit)) {
+      if (now < lane.blockedUntil || lane.tokens < 1) {
+        break;
+      }
+      const waiter = lane.queue.shift()!;
+      lane.tokens -= 1;
+      lane.inFlight++;
+      waiter.resolve(now - waiter.enqueuedAt);
+    }
+
+    // Wake up when the lane unblocks or the next token arrives
+    if (lane.queue.length > 0 && lane.inFlight < Math.floor(lane.limit)) {
+      const perMs = this.options.requestsPerMinute / 60000;
+      const tokenWait = lane.tokens >= 1 ? 0 : Math.ceil((1 - lane.tokens) / perMs);
+      const blockWait = Math.max(0, lane.blockedUntil - now);
+      lane.timer = setTimeout(() => this.pump(lane), Math.max(tokenWait, blockWait, 10));
+    }
+  }
+}
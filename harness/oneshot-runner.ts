@@ -5,9 +5,11 @@
 
 import { MCPConfig, ScenarioSpec } from './types.js';
 import { Logger } from './logger.js';
-import { MCPClientManager } from './mcp-client.js';
+import { MCPClientManager, MCPToolResult } from './mcp-client.js';
+import { DiskCache, CacheMode } from './cache.js';
 import { resolveMcpConfig, validateMcpEnv } from './mcp-resolver.js';
 import { parseScenarioId, loadPackage } from './scenario-loader.js';
+import { withSpan } from './tracing.js';
 import path from 'path';
 import fs from 'fs-extra';
 
@@ -17,6 +19,40 @@ export interface OneshotStats {
   result_md: string;
   mcp_tool_used?: string;
   mcp_server_used?: string;
+  cache_hit?: boolean;
+}
+
+/**
+ * Cached outcome of a oneshot tool call (after any NIA fallback)
+ */
+interface CachedToolResult {
+  tool_name: string;
+  result: MCPToolResult;
+}
+
+let toolResultCache: DiskCache<CachedToolResult> | null = null;
+
+function getToolResultCache(): DiskCache<CachedToolResult> {
+  if (!toolResultCache) {
+    toolResultCache = new DiskCache<CachedToolResult>({ namespace: 'mcp-tool-results' });
+  }
+  return toolResultCache;
+}
+
+/**
+ * Check if content contains error message (some MCP servers don't set isError flag)
+ */
+function hasErrorInContent(result: MCPToolResult): boolean {
+  if (typeof result.content === 'string') {
+    return result.content.includes('❌ Error') || result.content.includes('Server error');
+  }
+  if (Array.isArray(result.content)) {
+    return result.content.some((block: any) =>
+      block.type === 'text' && block.text &&
+      (block.text.includes('❌ Error') || block.text.includes('Server error'))
+    );
+  }
+  return false;
 }
 
 /**
@@ -95,7 +131,8 @@ export async function runOneshot(
   workspaceDir: string,
   logger: Logger,
   timeout: number,
-  sharedMcpManager?: MCPClientManager
+  sharedMcpManager?: MCPClientManager,
+  cacheMode: CacheMode = 'off'
 ): Promise<OneshotStats> {
   logger.marker('>>>>> Oneshot Mode: Single Tool Call');
   logger.info(`Scenario: ${scenario.id}`);
@@ -154,80 +191,113 @@ export async function runOneshot(
 
   logger.info(`Using MCP mapping: ${mcpMapping.serverName}`);
 
-  // Connect to MCP servers (use shared manager if provided for parallel execution)
-  let mcpManager: MCPClientManager;
+  // Build parameters for the tool call
+  const toolParams = mcpMapping.buildParams(scenario, parsed.packageId, registry, context7Id, deepconId);
+
+  // Identical (config, server, tool, params) calls return the cached result; the
+  // config name and server command/url keep replay configs, which reuse the live
+  // server names, from sharing entries with real calls
+  const cache = cacheMode !== 'off' ? getToolResultCache() : null;
+  const server = resolvedConfig.mcp_servers[mcpMapping.serverName];
+  const cacheKey = DiskCache.key({
+    config: config.config_name,
+    server: mcpMapping.serverName,
+    command: server?.command,
+    args: server?.args,
+    url: server && 'url' in server ? (server as any).url : undefined,
+    tool: mcpMapping.toolName,
+    params: toolParams,
+  });
+  const cached = cache && cacheMode === 'read' ? await cache.get(cacheKey) : undefined;
+
+  // Connect to MCP servers lazily: a cache hit needs no connection at all
+  let mcpManager: MCPClientManager | undefined;
   let shouldDisconnect = false;
 
-  if (sharedMcpManager) {
-    // Reuse shared MCP manager (parallel execution)
-    mcpManager = sharedMcpManager;
-    logger.info('Using shared MCP client manager');
-  } else {
-    // Create new MCP manager (sequential execution)
-    mcpManager = new MCPClientManager(resolvedConfig.mcp_servers);
-    shouldDisconnect = true;
-
-    logger.info('Connecting to MCP servers...');
-    const connectionResults = await mcpManager.connectAll();
-    const connectedServers = mcpManager.getConnectedServers();
-    logger.info(`Connected to ${connectedServers.length} MCP servers: ${connectedServers.join(', ')}`);
-
-    // Log connection failures
-    for (const [serverName, result] of connectionResults.entries()) {
-      if (!result.success) {
-        logger.warn(`MCP server '${serverName}' failed to connect: ${result.error}`);
+  const getMcpManager = async (): Promise<MCPClientManager> => {
+    if (mcpManager) {
+      return mcpManager;
+    }
+
+    if (sharedMcpManager) {
+      // Reuse shared MCP manager (parallel execution)
+      mcpManager = sharedMcpManager;
+      logger.info('Using shared MCP client manager');
+    } else {
+      // Create new MCP manager (sequential execution)
+      mcpManager = new MCPClientManager(resolvedConfig.mcp_servers);
+      shouldDisconnect = true;
+
+      logger.info('Connecting to MCP servers...');
+      const connectionResults = await withSpan('mcp_connect', () => mcpManager!.connectAll(),
+        { servers: Object.keys(resolvedConfig.mcp_servers).length });
+      const connectedServers = mcpManager.getConnectedServers();
+      logger.info(`Connected to ${connectedServers.length} MCP servers: ${connectedServers.join(', ')}`);
+
+      // Log connection failures
+      for (const [serverName, result] of connectionResults.entries()) {
+        if (!result.success) {
+          logger.warn(`MCP server '${serverName}' failed to connect: ${result.error}`);
+        }
       }
     }
-  }
 
-  try {
     // Check if the required server is connected
-    if (!mcpManager.isServerConnected(mcpMapping.serverName)) {
+    if (!mcpManager.isServerConnected(mcpMapping!.serverName)) {
       const connectedServers = mcpManager.getConnectedServers();
-      throw new Error(`Required MCP server '${mcpMapping.serverName}' is not connected. Available: ${connectedServers.join(', ')}`);
+      throw new Error(`Required MCP server '${mcpMapping!.serverName}' is not connected. Available: ${connectedServers.join(', ')}`);
     }
 
-    // Build parameters for the tool call
-    const toolParams = mcpMapping.buildParams(scenario, parsed.packageId, registry, context7Id, deepconId);
+    return mcpManager;
+  };
 
+  try {
     logger.marker(`>>>>> Calling MCP Tool: ${mcpMapping.toolName} on ${mcpMapping.serverName}`);
     logger.info(`Tool parameters: ${JSON.stringify(toolParams, null, 2)}`);
 
-    // Call the MCP tool
-    let toolResult = await mcpManager.callTool(mcpMapping.serverName, mcpMapping.toolName, toolParams);
+    let toolResult: MCPToolResult;
+    let toolUsed = mcpMapping.toolName;
 
-    // Check if content contains error message (some MCP servers don't set isError flag)
-    const hasErrorInContent = (result: any): boolean => {
-      if (typeof result.content === 'string') {
-        return result.content.includes('❌ Error') || result.content.includes('Server error');
-      }
-      if (Array.isArray(result.content)) {
-        return result.content.some(block =>
-          block.type === 'text' && block.text &&
-          (block.text.includes('❌ Error') || block.text.includes('Server error'))
-        );
+    if (cached) {
+      logger.info(`Cache hit (${cacheKey.substring(0, 12)}), skipping MCP call`);
+      toolResult = cached.result;
+      toolUsed = cached.tool_name;
+    } else {
+      const manager = await getMcpManager();
+
+      // Call the MCP tool
+      toolResult = await withSpan('tool_call', () => manager.callTool(mcpMapping!.serverName, mcpMapping!.toolName, toolParams),
+        { server: mcpMapping.serverName, tool: mcpMapping.toolName });
+
+      const shouldFallback = toolResult.isError || hasErrorInContent(toolResult);
+
+      // For NIA: If primary tool fails, try fallback with documentation search
+      if (mcpMapping.serverName === 'nia' && shouldFallback && mcpMapping.fallbackToolName) {
+        logger.warn(`Primary tool '${mcpMapping.toolName}' failed: ${typeof toolResult.content === 'string' ? toolResult.content : JSON.stringify(toolResult.content)}`);
+
+        if (mcpMapping.buildFallbackParams) {
+          try {
+            const fallbackParams = mcpMapping.buildFallbackParams(scenario, parsed.packageId);
+            logger.info(`Trying fallback: ${mcpMapping.fallbackToolName} with documentation source: ${fallbackParams.sources?.[0]}`);
+            toolResult = await withSpan('tool_call', () => manager.callTool(mcpMapping!.serverName, mcpMapping!.fallbackToolName!, fallbackParams),
+              { server: mcpMapping.serverName, tool: mcpMapping.fallbackToolName, fallback: true });
+            toolUsed = mcpMapping.fallbackToolName;
+          } catch (fallbackError: any) {
+            logger.error(`Fallback parameter building failed: ${fallbackError.message}`);
+            // Keep the original error result
+          }
+        } else {
+          logger.warn(`No fallback parameter builder available, using original params`);
+          toolResult = await withSpan('tool_call', () => manager.callTool(mcpMapping!.serverName, mcpMapping!.fallbackToolName!, toolParams),
+            { server: mcpMapping.serverName, tool: mcpMapping.fallbackToolName, fallback: true });
+          toolUsed = mcpMapping.fallbackToolName;
+        }
       }
-      return false;
-    };
 
-    const shouldFallback = toolResult.isError || hasErrorInContent(toolResult);
-
-    // For NIA: If primary tool fails, try fallback with documentation search
-    if (mcpMapping.serverName === 'nia' && shouldFallback && mcpMapping.fallbackToolName) {
-      logger.warn(`Primary tool '${mcpMapping.toolName}' failed: ${typeof toolResult.content === 'string' ? toolResult.content : JSON.stringify(toolResult.content)}`);
-
-      if (mcpMapping.buildFallbackParams) {
-        try {
-          const fallbackParams = mcpMapping.buildFallbackParams(scenario, parsed.packageId);
-          logger.info(`Trying fallback: ${mcpMapping.fallbackToolName} with documentation source: ${fallbackParams.sources?.[0]}`);
-          toolResult = await mcpManager.callTool(mcpMapping.serverName, mcpMapping.fallbackToolName, fallbackParams);
-        } catch (fallbackError: any) {
-          logger.error(`Fallback parameter building failed: ${fallbackError.message}`);
-          // Keep the original error result
-        }
-      } else {
-        logger.warn(`No fallback parameter builder available, using original params`);
-        toolResult = await mcpManager.callTool(mcpMapping.serverName, mcpMapping.fallbackToolName, toolParams);
+      // Errors are never cached so a transient provider failure is retried next run
+      if (cache && !toolResult.isError && !hasErrorInContent(toolResult)) {
+        await cache.set(cacheKey, { tool_name: toolUsed, result: toolResult });
+        logger.info(`Tool result cached (${cacheKey.substring(0, 12)})`);
       }
     }
 
@@ -239,8 +309,10 @@ export async function runOneshot(
     resultMd += `**Package**: ${parsed.packageId}\n`;
     if (registry) resultMd += `**Registry**: ${registry}\n`;
     if (context7Id) resultMd += `**Context7 ID**: ${context7Id}\n`;
+    resultMd += `**MCP Config**: ${config.config_name}\n`;
     resultMd += `**MCP Server**: ${mcpMapping.serverName}\n`;
-    resultMd += `**Tool Called**: ${mcpMapping.toolName}\n`;
+    resultMd += `**Tool Called**: ${toolUsed}\n`;
+    resultMd += `**Cache Hit**: ${cached ? 'yes' : 'no'}\n`;
     resultMd += `**Timestamp**: ${new Date().toISOString()}\n\n`;
     resultMd += `---\n\n`;
     resultMd += `## Query\n\n${scenario.agent_prompt}\n\n`;
@@ -276,15 +348,16 @@ export async function runOneshot(
     const elapsed = Date.now() - startTime;
 
     logger.marker('>>>>> Oneshot Completed');
-    logger.info(`Tool called: ${mcpMapping.toolName}`);
+    logger.info(`Tool called: ${toolUsed}${cached ? ' (cached)' : ''}`);
     logger.info(`Duration: ${(elapsed / 1000).toFixed(1)}s`);
 
     return {
       tool_calls: 1,
       elapsed_ms: elapsed,
       result_md: resultMd,
-      mcp_tool_used: mcpMapping.toolName,
+      mcp_tool_used: toolUsed,
       mcp_server_used: mcpMapping.serverName,
+      cache_hit: !!cached,
     };
 
   } catch (error: any) {
@@ -295,7 +368,7 @@ export async function runOneshot(
     throw error;
   } finally {
     // Disconnect only if we created a new manager (not shared)
-    if (shouldDisconnect) {
+    if (shouldDisconnect && mcpManager) {
       logger.info('Disconnecting from MCP servers...');
       await mcpManager.disconnectAll();
       logger.info('Disconnected');
@@ -1,17 +1,35 @@
 /**
  * Parallel execution runner with worker pool
  * Based on SWE-bench ThreadPoolExecutor pattern
+ *
+ * Idle workers take the next task from one shared queue. With --schedule lpt
+ * the queue is ordered longest-expected-first from the duration history, and a
+ * task whose first stage's resource pool is full is passed over for the next
+ * longest one that can start.
  */
 
 import { RunContext, ScenarioReport } from './types.js';
 import { runScenario } from './run-scenario.js';
 import { MCPClientManager } from './mcp-client.js';
 import { resolveMcpConfig } from './mcp-resolver.js';
+import { DEFAULTS } from './constants.js';
+import {
+  DurationHistory,
+  DurationEstimate,
+  ScheduleOrder,
+  entryPool,
+  poolHasCapacity,
+  getPoolStats,
+  simulateMakespan,
+} from './scheduler.js';
 import chalk from 'chalk';
 
 export interface ParallelRunnerOptions {
   maxWorkers: number;
   verbose: boolean;
+  mcpPoolSize?: number;  // stdio connections per MCP server (default: min(maxWorkers, 4))
+  schedule?: ScheduleOrder;  // Task order (default: lpt)
+  onResult?: (context: RunContext, result: TaskResult) => void;  // Called as each task finishes
 }
 
 export interface TaskResult {
@@ -40,51 +58,71 @@ export async function runParallel(
   const { maxWorkers, verbose } = options;
 
   const results: TaskResult[] = [];
+  const schedule = options.schedule ?? DEFAULTS.SCHEDULE;
+  const history = DurationHistory.load();
+  const estimates = new Map<RunContext, DurationEstimate>(contexts.map(c => [c, history.estimate(c)]));
   const queue = [...contexts];
+  if (schedule === 'lpt') {
+    queue.sort((a, b) => estimates.get(b)!.ms - estimates.get(a)!.ms);
+  }
+  const elapsed = new Map<RunContext, number>();
+  const runStart = Date.now();
   const active = new Map<number, Promise<TaskResult>>();
   const workerStates = new Map<number, WorkerState>();
 
   let completed = 0;
   const total = contexts.length;
   let progressInterval: NodeJS.Timeout | null = null;
+  // The redrawn worker table needs a terminal (shard workers write to a pipe)
+  const liveProgress = !verbose && !!process.stdout.isTTY;
 
-  // Create shared MCP client manager for oneshot mode (if any oneshot contexts exist)
-  let sharedMcpManager: MCPClientManager | undefined;
+  // Create one pooled MCP client manager per config for oneshot mode
+  const mcpManagers = new Map<string, MCPClientManager>();
   const oneshotContexts = contexts.filter(c => c.mode === 'oneshot');
 
   if (oneshotContexts.length > 0) {
-    // Get config from first oneshot context
-    const firstConfig = oneshotContexts[0].config;
-    const resolvedConfig = resolveMcpConfig(firstConfig);
+    const byConfig = new Map<string, RunContext[]>();
+    for (const ctx of oneshotContexts) {
+      const group = byConfig.get(ctx.config.config_name) || [];
+      group.push(ctx);
+      byConfig.set(ctx.config.config_name, group);
+    }
 
-    console.log(chalk.cyan(`Creating shared MCP client for ${oneshotContexts.length} oneshot scenario(s)...`));
-    sharedMcpManager = new MCPClientManager(resolvedConfig.mcp_servers);
+    const poolSize = options.mcpPoolSize ?? Math.min(maxWorkers, DEFAULTS.MCP_POOL_SIZE_MAX);
+    console.log(chalk.cyan(`Creating shared MCP clients for ${oneshotContexts.length} oneshot scenario(s) across ${byConfig.size} config(s) (pool size ${poolSize})...`));
 
-    try {
-      const connectionResults = await sharedMcpManager.connectAll();
-      const connectedServers = sharedMcpManager.getConnectedServers();
-      console.log(chalk.green(`✓ Connected to ${connectedServers.length} MCP servers: ${connectedServers.join(', ')}`));
-
-      // Log connection failures
-      for (const [serverName, result] of connectionResults.entries()) {
-        if (!result.success) {
-          console.log(chalk.yellow(`⚠ MCP server '${serverName}' failed to connect: ${result.error}`));
+    await Promise.all(Array.from(byConfig.entries()).map(async ([configName, configContexts]) => {
+      const resolvedConfig = resolveMcpConfig(configContexts[0].config);
+      const manager = new MCPClientManager(resolvedConfig.mcp_servers, poolSize);
+
+      try {
+        const connectionResults = await manager.connectAll();
+        const connectedServers = manager.getConnectedServers();
+        console.log(chalk.green(`✓ [${configName}] Connected to ${connectedServers.length} MCP servers: ${connectedServers.join(', ')}`));
+
+        // Log connection failures
+        for (const [serverName, result] of connectionResults.entries()) {
+          if (!result.success) {
+            console.log(chalk.yellow(`⚠ [${configName}] MCP server '${serverName}' failed to connect: ${result.error}`));
+          }
         }
+      } catch (error: any) {
+        console.log(chalk.red(`✗ [${configName}] Failed to connect to MCP servers: ${error.message}`));
+        return;
       }
-    } catch (error: any) {
-      console.log(chalk.red(`✗ Failed to connect to MCP servers: ${error.message}`));
-      sharedMcpManager = undefined;
-    }
 
-    // Inject shared manager into all oneshot contexts
-    for (const ctx of oneshotContexts) {
-      ctx.sharedMcpManager = sharedMcpManager;
-    }
+      mcpManagers.set(configName, manager);
+
+      // Inject the config's manager into its oneshot contexts
+      for (const ctx of configContexts) {
+        ctx.sharedMcpManager = manager;
+      }
+    }));
   }
 
   // Display progress function
   const displayProgress = () => {
-    if (verbose) return; // Don't show progress bar in verbose mode
+    if (!liveProgress) return; // Don't show progress bar in verbose mode or without a TTY
 
     const states = Array.from(workerStates.values());
     if (states.length === 0) return;
@@ -117,7 +155,7 @@ export async function runParallel(
   };
 
   // Start progress display timer (update every 2 seconds)
-  if (!verbose) {
+  if (liveProgress) {
     // Print initial placeholder
     console.log('\n\n\n'); // Reserve space
     progressInterval = setInterval(displayProgress, 2000);
@@ -153,8 +191,11 @@ export async function runParallel(
       );
     }
 
+    const taskStart = Date.now();
     try {
       const report = await runScenario(context);
+      elapsed.set(context, Date.now() - taskStart);
+      history.record(context, Date.now() - taskStart);
 
       // Remove from active workers
       workerStates.delete(workerId);
@@ -191,6 +232,7 @@ export async function runParallel(
         report,
       };
     } catch (error: any) {
+      elapsed.set(context, Date.now() - taskStart);
       workerStates.delete(workerId);
       completed++;
 
@@ -221,11 +263,27 @@ export async function runParallel(
     }
   };
 
+  // Hand each result to the caller as soon as it is known (e.g. the run manifest)
+  const reportResult = (context: RunContext, result: TaskResult): TaskResult => {
+    try {
+      options.onResult?.(context, result);
+    } catch (error: any) {
+      console.log(chalk.yellow(`⚠ Failed to record result for ${result.scenarioId} (${result.config}): ${error.message}`));
+    }
+    return result;
+  };
+
+  // Longest task whose first stage can start now; the longest overall if none can
+  const takeNext = (): RunContext => {
+    const index = schedule === 'lpt' ? queue.findIndex(c => poolHasCapacity(entryPool(c))) : 0;
+    return queue.splice(Math.max(0, index), 1)[0];
+  };
+
   // Start initial workers
   let workerId = 0;
   while (active.size < maxWorkers && queue.length > 0) {
-    const context = queue.shift()!;
-    const promise = runWorker(workerId++, context);
+    const context = takeNext();
+    const promise = runWorker(workerId++, context).then(result => reportResult(context, result));
     active.set(workerId, promise);
   }
 
@@ -250,8 +308,8 @@ export async function runParallel(
 
     // Start new worker if queue not empty
     if (queue.length > 0) {
-      const context = queue.shift()!;
-      const promise = runWorker(workerId++, context);
+      const context = takeNext();
+      const promise = runWorker(workerId++, context).then(result => reportResult(context, result));
       active.set(workerId, promise);
     }
   }
@@ -267,20 +325,70 @@ export async function runParallel(
     }
   }
 
-  // Cleanup shared MCP client
-  if (sharedMcpManager) {
-    console.log(chalk.cyan('\nDisconnecting shared MCP client...'));
-    try {
-      await sharedMcpManager.disconnectAll();
-      console.log(chalk.green('✓ Shared MCP client disconnected'));
-    } catch (error: any) {
-      console.log(chalk.yellow(`⚠ Failed to disconnect MCP client: ${error.message}`));
+  const makespan = Date.now() - runStart;
+  printScheduleSummary(contexts, schedule, estimates, elapsed, makespan, maxWorkers);
+  try {
+    await history.save();
+  } catch (error: any) {
+    console.log(chalk.yellow(`⚠ Failed to save duration history: ${error.message}`));
+  }
+
+  // Cleanup shared MCP clients
+  if (mcpManagers.size > 0) {
+    console.log(chalk.cyan('\nDisconnecting shared MCP clients...'));
+    for (const [configName, manager] of mcpManagers.entries()) {
+      if (verbose) {
+        for (const stats of manager.getPoolStats()) {
+          console.log(chalk.gray(`  [${configName}] ${stats.server}: ${stats.calls} calls over ${stats.size} connections, ${stats.reconnects} reconnects, ${stats.failed_probes} failed probes`));
+        }
+      }
+      try {
+        await manager.disconnectAll();
+      } catch (error: any) {
+        console.log(chalk.yellow(`⚠ [${configName}] Failed to disconnect MCP client: ${error.message}`));
+      }
     }
+    console.log(chalk.green('✓ Shared MCP clients disconnected'));
   }
 
   return results;
 }
 
+/**
+ * Compare the run's makespan with the same tasks in FIFO order and with the
+ * lower bound (longest task, or total work spread over all workers)
+ */
+function printScheduleSummary(
+  contexts: RunContext[],
+  schedule: ScheduleOrder,
+  estimates: Map<RunContext, DurationEstimate>,
+  elapsed: Map<RunContext, number>,
+  makespan: number,
+  maxWorkers: number
+) {
+  const durations = contexts.map(c => elapsed.get(c) ?? 0);
+  const fifoMakespan = simulateMakespan(durations, maxWorkers);
+  const lowerBound = Math.max(0, ...durations, durations.reduce((sum, d) => sum + d, 0) / maxWorkers);
+  const saved = fifoMakespan - makespan;
+
+  const sources = new Map<string, number>();
+  for (const estimate of estimates.values()) {
+    sources.set(estimate.source, (sources.get(estimate.source) ?? 0) + 1);
+  }
+
+  console.log(chalk.cyan(`\nSchedule (${schedule}): makespan ${(makespan / 1000).toFixed(1)}s, lower bound ${(lowerBound / 1000).toFixed(1)}s`));
+  if (schedule !== 'fifo') {
+    const pct = fifoMakespan > 0 ? ((saved / fifoMakespan) * 100).toFixed(1) : '0.0';
+    console.log(chalk.gray(`  FIFO order estimate: ${(fifoMakespan / 1000).toFixed(1)}s (saved ${(saved / 1000).toFixed(1)}s, ${pct}%)`));
+  }
+  console.log(chalk.gray(`  Duration estimates: ${Array.from(sources.entries()).map(([source, count]) => `${count} ${source}`).join(', ')}`));
+  for (const stats of getPoolStats()) {
+    if (stats.waited > 0) {
+      console.log(chalk.gray(`  Pool ${stats.pool} (limit ${stats.limit}): ${stats.waited}/${stats.acquired} waited, ${(stats.wait_ms / 1000).toFixed(1)}s total`));
+    }
+  }
+}
+
 /**
  * Create run contexts for all scenario×config combinations
  */
@@ -293,7 +401,8 @@ export function createRunContexts(
   verbose: boolean,
   keepWorkspace: boolean,
   loadScenario: (id: string) => any,
-  loadConfig: (name: string) => any
+  loadConfig: (name: string) => any,
+  overrides: Partial<RunContext> = {}
 ): RunContext[] {
   const contexts: RunContext[] = [];
 
@@ -314,6 +423,7 @@ export function createRunContexts(
         verbose,
         keepWorkspace,
         isParallel: true,
+        ...overrides,
       };
 
       contexts.push(context);
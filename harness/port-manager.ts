@@ -1,42 +1,102 @@
 /**
  * Port pool manager for parallel execution
- * Manages port allocation from 3010-3090 range
- * Uses file-based locking to support multiple processes
+ * Manages port allocation from a configurable range (default 3010-3090)
+ *
+ * Each allocated port is claimed with its own lock file created with O_EXCL
+ * (.port-locks/<hostname>/<port>.lock, holding the owner PID), so processes never
+ * wait on a global lock. A claimed port is then verified free with a bind attempt.
+ * Locks left behind by dead processes are reclaimed on the next allocation. Ports
+ * and PIDs are per host, so hosts sharing a checkout (e.g. over NFS) each get
+ * their own lock directory and never judge each other's locks.
  */
 
-import { exec } from 'child_process';
-import { promisify } from 'util';
+import net from 'net';
+import os from 'os';
 import fs from 'fs-extra';
 import path from 'path';
+import { DEFAULTS, PATHS } from './constants.js';
 
-const execAsync = promisify(exec);
+interface PortLock {
+  pid: number;
+  owner: string;
+  created_at: number;
+}
+
+export interface PortAllocationMetrics {
+  allocations: number;
+  failures: number;
+  releases: number;
+  avg_latency_ms: number;
+  p95_latency_ms: number;
+  max_latency_ms: number;
+  lock_conflicts: number;   // Ports already claimed by another process
+  busy_ports: number;       // Ports that failed the bind probe
+  stale_locks: number;      // Locks reclaimed from dead processes
+}
 
-// File-based port allocation state
-const PORT_STATE_FILE = path.join(process.cwd(), '.port-allocation.json');
-const PORT_LOCK_FILE = path.join(process.cwd(), '.port-allocation.lock');
+// Latency samples kept for the p95 estimate
+const MAX_LATENCY_SAMPLES = 1000;
 
-interface PortState {
-  allocatedPorts: Record<string, number>; // containerId -> port
-  lastUpdated: number;
+// An unreadable lock younger than this may still be mid-write
+const STALE_PARTIAL_LOCK_MS = 10000;
+
+/**
+ * Parse a "start-end" port range
+ */
+export function parsePortRange(value: string): { start: number; end: number } {
+  const match = value.trim().match(/^(\d+)-(\d+)$/);
+  const start = match ? parseInt(match[1], 10) : NaN;
+  const end = match ? parseInt(match[2], 10) : NaN;
+  if (!(start >= 1024 && end <= 65535 && start <= end)) {
+    throw new Error(`Invalid --port-range "${value}". Expected START-END within 1024-65535`);
+  }
+  return { start, end };
 }
 
-export class PortManager {
-  private static instance: PortManager;
-  private availablePorts: Set<number>;
-  private allocatedPorts: Map<string, number>; // containerId -> port
-  private allocationLock: Promise<void> = Promise.resolve();
-
-  private constructor() {
-    // Initialize port pool (3010-3090)
-    this.availablePorts = new Set();
-    for (let port = 3010; port <= 3090; port++) {
-      this.availablePorts.add(port);
-    }
-    this.allocatedPorts = new Map();
+/**
+ * Check that nothing on the host is listening on a port by binding it briefly
+ */
+function probePort(port: number): Promise<boolean> {
+  return new Promise(resolve => {
+    const server = net.createServer();
+    server.unref();
+    server.once('error', () => resolve(false));
+    server.listen({ port, host: '0.0.0.0', exclusive: true }, () => {
+      server.close(() => resolve(true));
+    });
+  });
+}
 
-    // Load existing allocations from file
-    this.loadPortState();
+function isProcessAlive(pid: number): boolean {
+  try {
+    // Signal 0 doesn't kill, just checks
+    process.kill(pid, 0);
+    return true;
+  } catch (error: any) {
+    // EPERM: the process exists but belongs to another user
+    return error.code === 'EPERM';
   }
+}
+
+export class PortManager {
+  private static instance: PortManager;
+  private start: number = DEFAULTS.PORT_RANGE_START;
+  private end: number = DEFAULTS.PORT_RANGE_END;
+  private lockDir: string = path.join(process.cwd(), PATHS.PORT_LOCK_DIR, os.hostname());
+  private allocatedPorts: Map<string, number> = new Map(); // containerId -> port
+  private nextCandidate: number = DEFAULTS.PORT_RANGE_START;
+
+  private latencies: number[] = [];
+  private totalLatencyMs: number = 0;
+  private maxLatencyMs: number = 0;
+  private allocations: number = 0;
+  private failures: number = 0;
+  private releases: number = 0;
+  private lockConflicts: number = 0;
+  private busyPorts: number = 0;
+  private staleLocks: number = 0;
+
+  private constructor() {}
 
   /**
    * Get singleton instance
@@ -49,314 +109,213 @@ export class PortManager {
   }
 
   /**
-   * Load port state from file (cross-process synchronization)
-   * Also cleans up stale allocations
+   * Change the port range (call before the first allocation)
    */
-  private loadPortState(): void {
-    try {
-      if (fs.existsSync(PORT_STATE_FILE)) {
-        const state: PortState = fs.readJsonSync(PORT_STATE_FILE);
+  public configure(range: { start: number; end: number }): void {
+    this.start = range.start;
+    this.end = range.end;
+    this.nextCandidate = range.start;
+  }
 
-        // Load allocated ports from file
-        for (const [containerId, port] of Object.entries(state.allocatedPorts)) {
-          this.allocatedPorts.set(containerId, port);
-          this.availablePorts.delete(port);
-        }
-      }
-    } catch (error) {
-      // Ignore errors, start fresh
-      console.warn('Warning: Could not load port state file:', error);
-    }
+  private lockPath(port: number): string {
+    return path.join(this.lockDir, `${port}.lock`);
   }
 
   /**
-   * Clean up stale allocations (containers that no longer exist)
+   * Claim a port's lock file; reclaims it if the holder process is gone
    */
-  private async cleanupStaleAllocations(): Promise<void> {
-    try {
-      // Get list of all Docker containers (running and stopped)
-      const { stdout } = await execAsync('docker ps -a --format "{{.ID}}"');
-      const existingContainers = new Set(
-        stdout
-          .trim()
-          .split('\n')
-          .filter(id => id.length > 0)
-      );
-
-      // Find stale allocations
-      const staleContainers: string[] = [];
-      const now = Date.now();
-      const TEMP_ID_TIMEOUT_MS = 5 * 60 * 1000; // 5 minutes
-
-      for (const containerId of this.allocatedPorts.keys()) {
-        // Check for stale temp IDs (older than 5 minutes)
-        if (containerId.startsWith('temp-')) {
-          const match = containerId.match(/^temp-(\d+)-/);
-          if (match) {
-            const timestamp = parseInt(match[1]);
-            if (now - timestamp > TEMP_ID_TIMEOUT_MS) {
-              staleContainers.push(containerId);
-              console.log(`Found stale temp-ID allocation (${Math.floor((now - timestamp) / 1000)}s old): ${containerId}`);
-            }
-          }
-          continue;
-        }
+  private claimPort(port: number, owner: string): boolean {
+    const lockFile = this.lockPath(port);
+    const lock: PortLock = { pid: process.pid, owner, created_at: Date.now() };
 
-        // Check if container exists
-        const shortId = containerId.substring(0, 12);
-        let exists = false;
-        for (const existingId of existingContainers) {
-          if (existingId.startsWith(shortId) || shortId.startsWith(existingId)) {
-            exists = true;
-            break;
-          }
-        }
-
-        if (!exists) {
-          staleContainers.push(containerId);
-        }
-      }
-
-      // Release stale allocations
-      for (const containerId of staleContainers) {
-        const port = this.allocatedPorts.get(containerId);
-        this.allocatedPorts.delete(containerId);
-        if (port !== undefined) {
-          this.availablePorts.add(port);
+    for (let attempt = 0; attempt < 2; attempt++) {
+      try {
+        fs.writeFileSync(lockFile, JSON.stringify(lock), { flag: 'wx' });
+        return true;
+      } catch (error: any) {
+        if (error.code !== 'EEXIST') {
+          throw error;
         }
-        const displayId = containerId.startsWith('temp-') ? containerId : containerId.substring(0, 12);
-        console.log(`Cleaned up stale port allocation for ${displayId} (port ${port})`);
       }
 
-      // Save cleaned state
-      if (staleContainers.length > 0) {
-        this.savePortState();
+      if (!this.removeIfStale(port)) {
+        return false;
       }
-    } catch (error) {
-      // Ignore cleanup errors
-      console.warn('Warning: Could not clean up stale allocations:', error);
     }
+    return false;
   }
 
   /**
-   * Save port state to file (cross-process synchronization)
+   * Remove a lock held by a dead process; true if the port may be claimed again
    */
-  private savePortState(): void {
+  private removeIfStale(port: number): boolean {
+    const lockFile = this.lockPath(port);
+    let lock: PortLock | undefined;
     try {
-      const state: PortState = {
-        allocatedPorts: Object.fromEntries(this.allocatedPorts),
-        lastUpdated: Date.now(),
-      };
-      fs.writeJsonSync(PORT_STATE_FILE, state, { spaces: 2 });
-    } catch (error) {
-      console.warn('Warning: Could not save port state file:', error);
+      lock = fs.readJsonSync(lockFile);
+    } catch (error: any) {
+      if (error.code === 'ENOENT') return true;
+      // Unparseable: being written right now, or half-written by a crashed process
+      try {
+        if (Date.now() - fs.statSync(lockFile).mtimeMs < STALE_PARTIAL_LOCK_MS) return false;
+      } catch {
+        return true;
+      }
     }
-  }
 
-  /**
-   * Acquire file lock (simple implementation)
-   */
-  private async acquireFileLock(): Promise<() => void> {
-    // Wait for lock file to be removed
-    let attempts = 0;
-    const MAX_ATTEMPTS = 200; // 200 * 50ms = 10 seconds
-    const STALE_LOCK_TIMEOUT_MS = 10000; // 10 seconds
-
-    while (fs.existsSync(PORT_LOCK_FILE) && attempts < MAX_ATTEMPTS) {
-      await new Promise(resolve => setTimeout(resolve, 50));
-      attempts++;
+    if (lock && (lock.pid === process.pid || isProcessAlive(lock.pid))) {
+      return false;
     }
 
-    if (attempts >= MAX_ATTEMPTS) {
-      // Force remove stale lock (older than 10 seconds)
+    // Move the lock aside first so two processes reclaiming the same port
+    // cannot delete each other's fresh lock
+    const aside = `${lockFile}.${process.pid}.stale`;
+    try {
+      fs.renameSync(lockFile, aside);
+    } catch {
+      return true;
+    }
+    let moved: PortLock | undefined;
+    try {
+      moved = fs.readJsonSync(aside);
+    } catch {
+      // Still unparseable, so it is the stale lock we inspected
+    }
+    if (moved && lock && moved.pid !== lock.pid) {
+      // Another process reclaimed it first: put its lock back
       try {
-        const stats = fs.statSync(PORT_LOCK_FILE);
-        const lockAge = Date.now() - stats.mtimeMs;
-
-        if (lockAge > STALE_LOCK_TIMEOUT_MS) {
-          // Check if the process that created the lock is still alive
-          const lockPid = parseInt(fs.readFileSync(PORT_LOCK_FILE, 'utf-8'));
-          let processExists = false;
-
-          try {
-            // Check if process exists (signal 0 doesn't kill, just checks)
-            process.kill(lockPid, 0);
-            processExists = true;
-          } catch (e) {
-            // Process doesn't exist
-            processExists = false;
-          }
-
-          if (!processExists) {
-            console.warn(`Removing stale lock file (${lockAge}ms old, PID ${lockPid} not found)`);
-            fs.removeSync(PORT_LOCK_FILE);
-          } else {
-            console.warn(`Lock file is old (${lockAge}ms) but process ${lockPid} still exists, waiting...`);
-            // Wait a bit more
-            await new Promise(resolve => setTimeout(resolve, 1000));
-          }
-        }
-      } catch (e) {
-        // Ignore errors reading lock file
+        fs.linkSync(aside, lockFile);
+      } catch {
+        // A third claimant got there; its lock stands
       }
+      fs.removeSync(aside);
+      return false;
     }
 
-    // Create lock file with PID
-    fs.writeFileSync(PORT_LOCK_FILE, process.pid.toString());
-
-    // Return release function
-    return () => {
-      try {
-        // Only remove if it's our lock
-        const currentPid = fs.readFileSync(PORT_LOCK_FILE, 'utf-8');
-        if (parseInt(currentPid) === process.pid) {
-          fs.removeSync(PORT_LOCK_FILE);
-        }
-      } catch (e) {
-        // Ignore
-      }
-    };
+    fs.removeSync(aside);
+    this.staleLocks++;
+    return true;
   }
 
-  /**
-   * Check if a port is actually free on the system
-   * Also checks Docker to see if any container is using it
-   */
-  private async isSystemPortFree(port: number): Promise<boolean> {
+  private unlockPort(port: number): void {
     try {
-      // Check system-level port usage
-      await execAsync(`lsof -i :${port}`);
-      // If lsof succeeds, port is in use
-      return false;
-    } catch (error) {
-      // lsof failed (port appears free), but double-check Docker
-      try {
-        // Check if any Docker container (running or not) has this port bound
-        const { stdout } = await execAsync(
-          `docker ps -a --format "{{.Ports}}" | grep ":${port}->" || true`
-        );
-        if (stdout.trim()) {
-          // Port is allocated to a Docker container
-          return false;
-        }
-      } catch (dockerError) {
-        // Docker check failed, assume port is free
+      const lock: PortLock = fs.readJsonSync(this.lockPath(port));
+      // Only remove if it's our lock
+      if (lock.pid === process.pid) {
+        fs.removeSync(this.lockPath(port));
       }
-      return true;
+    } catch {
+      // Already gone
     }
   }
 
   /**
    * Allocate a port for a container
    * Returns the assigned port or throws if no ports available
-   * Thread-safe with mutex lock and cross-process file lock
+   * Safe across workers and processes: a port is only handed out after its
+   * lock file was created exclusively and a bind probe succeeded
    */
   public async allocatePort(containerId: string): Promise<number> {
-    // Acquire file lock first (cross-process)
-    const releaseFileLock = await this.acquireFileLock();
-
-    try {
-      // Reload state from file to get latest allocations from other processes
-      this.loadPortState();
-
-      // Clean up stale allocations (containers that no longer exist)
-      await this.cleanupStaleAllocations();
-
-      // Wait for any ongoing allocation to complete (in-process mutex)
-      await this.allocationLock;
-
-      // Create new lock for this allocation
-      let releaseLock: () => void;
-      this.allocationLock = new Promise(resolve => {
-        releaseLock = resolve;
-      });
+    const startedAt = performance.now();
+    fs.ensureDirSync(this.lockDir);
 
-      try {
-        if (this.availablePorts.size === 0) {
-          throw new Error('No available ports in range 3010-3090');
-        }
-
-        // Try to find a port that's both in our pool and actually free on the system
-        const availablePortArray = Array.from(this.availablePorts);
-        let assignedPort: number | null = null;
-
-        for (const port of availablePortArray) {
-          const isFree = await this.isSystemPortFree(port);
-          if (isFree) {
-            assignedPort = port;
-            break;
-          } else {
-            // Port is in our pool but actually in use - remove it from available pool
-            console.warn(`Warning: Port ${port} was in pool but is actually in use, removing from available ports`);
-            this.availablePorts.delete(port);
-          }
-        }
+    const size = this.end - this.start + 1;
+    const held = new Set(this.allocatedPorts.values());
+    const first = this.nextCandidate;
 
-        if (assignedPort === null) {
-          throw new Error('No free ports available - all ports in pool are in use by system');
-        }
+    // Rotate through the range so a just-released port (possibly in TIME_WAIT) is not reused first
+    for (let i = 0; i < size; i++) {
+      const port = this.start + ((first - this.start + i) % size);
+      if (held.has(port)) continue;
 
-        // Mark as allocated
-        this.availablePorts.delete(assignedPort);
-        this.allocatedPorts.set(containerId, assignedPort);
+      if (!this.claimPort(port, containerId)) {
+        this.lockConflicts++;
+        continue;
+      }
 
-        // Save state to file for other processes
-        this.savePortState();
+      // Claimed synchronously, so concurrent workers in this process skip it from here on
+      this.allocatedPorts.set(containerId, port);
+      this.nextCandidate = port + 1 > this.end ? this.start : port + 1;
 
-        return assignedPort;
-      } finally {
-        // Release in-process lock
-        releaseLock!();
+      if (!await probePort(port)) {
+        this.busyPorts++;
+        this.allocatedPorts.delete(containerId);
+        this.unlockPort(port);
+        continue;
       }
-    } finally {
-      // Release file lock
-      releaseFileLock();
+
+      this.recordLatency(performance.now() - startedAt);
+      this.allocations++;
+      return port;
     }
+
+    this.failures++;
+    throw new Error(`No free ports available in range ${this.start}-${this.end}`);
   }
 
   /**
    * Release a port when container is stopped
    */
   public async releasePort(containerId: string): Promise<void> {
-    const releaseFileLock = await this.acquireFileLock();
-
-    try {
-      // Reload state
-      this.loadPortState();
-
-      const port = this.allocatedPorts.get(containerId);
-      if (port !== undefined) {
-        this.allocatedPorts.delete(containerId);
-        this.availablePorts.add(port);
-
-        // Save state
-        this.savePortState();
-      }
-    } finally {
-      releaseFileLock();
+    const port = this.allocatedPorts.get(containerId);
+    if (port !== undefined) {
+      this.allocatedPorts.delete(containerId);
+      this.unlockPort(port);
+      this.releases++;
     }
   }
 
   /**
-   * Get current port allocation status
+   * Get current port allocation status (allocations made by this process)
    */
   public getStatus(): {
     available: number;
     allocated: number;
     total: number;
   } {
+    const total = this.end - this.start + 1;
     return {
-      available: this.availablePorts.size,
+      available: total - this.allocatedPorts.size,
       allocated: this.allocatedPorts.size,
-      total: 81, // 3010-3090 = 81 ports
+      total,
+    };
+  }
+
+  /**
+   * Allocation latency and contention metrics
+   */
+  public getMetrics(): PortAllocationMetrics {
+    const sorted = [...this.latencies].sort((a, b) => a - b);
+    const p95 = sorted.length > 0 ? sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * 0.95))] : 0;
+    return {
+      allocations: this.allocations,
+      failures: this.failures,
+      releases: this.releases,
+      avg_latency_ms: this.allocations > 0 ? Math.round((this.totalLatencyMs / this.allocations) * 100) / 100 : 0,
+      p95_latency_ms: Math.round(p95 * 100) / 100,
+      max_latency_ms: Math.round(this.maxLatencyMs * 100) / 100,
+      lock_conflicts: this.lockConflicts,
+      busy_ports: this.busyPorts,
+      stale_locks: this.staleLocks,
     };
   }
 
+  private recordLatency(ms: number): void {
+    this.totalLatencyMs += ms;
+    this.maxLatencyMs = Math.max(this.maxLatencyMs, ms);
+    this.latencies.push(ms);
+    if (this.latencies.length > MAX_LATENCY_SAMPLES) {
+      this.latencies.shift();
+    }
+  }
+
   /**
    * Check if a specific port is available
    */
   public isPortAvailable(port: number): boolean {
-    return this.availablePorts.has(port);
+    if (port < this.start || port > this.end) return false;
+    if (Array.from(this.allocatedPorts.values()).includes(port)) return false;
+    return !fs.existsSync(this.lockPath(port));
   }
 
   /**
@@ -371,49 +330,38 @@ export class PortManager {
    * Used when replacing temporary ID with actual container ID
    */
   public async reassignPort(oldId: string, newId: string): Promise<void> {
-    const releaseFileLock = await this.acquireFileLock();
+    const port = this.allocatedPorts.get(oldId);
+    if (port !== undefined) {
+      this.allocatedPorts.delete(oldId);
+      this.allocatedPorts.set(newId, port);
 
-    try {
-      // Reload state from file
-      this.loadPortState();
-
-      const port = this.allocatedPorts.get(oldId);
-      if (port !== undefined) {
-        this.allocatedPorts.delete(oldId);
-        this.allocatedPorts.set(newId, port);
-
-        // Save state to file for cross-process synchronization
-        this.savePortState();
+      const lock: PortLock = { pid: process.pid, owner: newId, created_at: Date.now() };
+      try {
+        fs.writeFileSync(this.lockPath(port), JSON.stringify(lock));
+      } catch {
+        // Owner is informational; the PID is what protects the port
       }
-    } finally {
-      releaseFileLock();
     }
   }
 
   /**
    * Reset all allocations (for cleanup)
-   * Also clears the file-based state
+   * Releases this process's ports and reclaims locks left by dead processes
    */
   public async reset(): Promise<void> {
-    const releaseFileLock = await this.acquireFileLock();
-
-    try {
-      this.availablePorts.clear();
-      for (let port = 3010; port <= 3090; port++) {
-        this.availablePorts.add(port);
-      }
-      this.allocatedPorts.clear();
+    for (const port of this.allocatedPorts.values()) {
+      this.unlockPort(port);
+    }
+    this.allocatedPorts.clear();
 
-      // Clear file state
-      try {
-        if (fs.existsSync(PORT_STATE_FILE)) {
-          fs.removeSync(PORT_STATE_FILE);
-        }
-      } catch (error) {
-        console.warn('Warning: Could not remove port state file:', error);
+    if (!fs.existsSync(this.lockDir)) {
+      return;
+    }
+    for (const name of fs.readdirSync(this.lockDir)) {
+      const port = parseInt(path.basename(name, '.lock'), 10);
+      if (Number.isFinite(port)) {
+        this.removeIfStale(port);
       }
-    } finally {
-      releaseFileLock();
     }
   }
 }
@@ -0,0 +1,273 @@
+/**
+ * Offline MCP replay server
+ * A stdio MCP server that answers the oneshot tools from recorded
+ * oneshot_result.md files instead of calling the providers. Used by the
+ * replay-* configs for network-free, deterministic runs. Results produced by
+ * the replay configs themselves are never indexed, so replayed (and injected)
+ * answers can't shadow the real recordings.
+ *
+ * Environment:
+ *   REPLAY_DIR         Directories to index, comma-separated (default: sample_workspace,workspace)
+ *   REPLAY_SERVER      Only replay recordings made against this MCP server (nia, deepcon, exa, context7)
+ *   REPLAY_LATENCY_MS  Injected latency per call: "250" or a "100-800" range (default: 0)
+ *   REPLAY_ERROR_RATE  Fraction of calls that fail with a server error, 0-1 (default: 0)
+ *   REPLAY_SEED        Seed for latency and error injection (default: 1)
+ */
+
+import fs from 'fs-extra';
+import path from 'path';
+import { Server } from '@modelcontextprotocol/sdk/server/index.js';
+import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
+import { CallToolRequestSchema, ListToolsRequestSchema } from '@modelcontextprotocol/sdk/types.js';
+import { canonicalJson } from './cache.js';
+import { listConfigs } from './config-loader.js';
+
+interface Recording {
+  config?: string;
+  server: string;
+  tool: string;
+  params: Record<string, any>;
+  query: string;
+  result: string;
+  isError: boolean;
+  source: string;
+}
+
+const RESULT_FILE = 'oneshot_result.md';
+
+const INJECTED_ERROR = 'Server error (injected by replay server)';
+const NO_RECORDING = 'No recording for ';
+
+/**
+ * Tools the oneshot runner calls, with the parameters it sends
+ */
+const REPLAY_TOOLS: Record<string, { description: string; properties: Record<string, any> }> = {
+  nia_package_search_hybrid: {
+    description: 'Replay of NIA package hybrid search',
+    properties: {
+      registry: { type: 'string' },
+      package_name: { type: 'string' },
+      semantic_queries: { type: 'array', items: { type: 'string' } },
+    },
+  },
+  search_documentation: {
+    description: 'Replay of documentation search (DeepCon, NIA fallback)',
+    properties: {
+      name: { type: 'string' },
+      language: { type: 'string' },
+      query: { type: 'string' },
+      sources: { type: 'array', items: { type: 'string' } },
+    },
+  },
+  get_code_context_exa: {
+    description: 'Replay of Exa code context search',
+    properties: {
+      query: { type: 'string' },
+    },
+  },
+  'get-library-docs': {
+    description: 'Replay of Context7 library docs',
+    properties: {
+      context7CompatibleLibraryID: { type: 'string' },
+      topic: { type: 'string' },
+    },
+  },
+};
+
+/**
+ * Seeded PRNG (mulberry32) so injected latency and errors are reproducible
+ */
+function createRandom(seed: number): () => number {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+/**
+ * Parse "250" or "100-800" into a latency range
+ */
+function parseLatency(value: string | undefined): [number, number] {
+  if (!value) return [0, 0];
+  const [min, max] = value.split('-').map(v => Math.max(0, parseInt(v.trim(), 10) || 0));
+  return [min, max ?? min];
+}
+
+/**
+ * Text of a "## Heading" section, up to the next --- separator
+ */
+function extractSection(content: string, heading: string, untilEnd: boolean = false): string | undefined {
+  const start = content.indexOf(`\n## ${heading}\n`);
+  if (start === -1) return undefined;
+  const body = content.substring(start + heading.length + 5);
+  if (untilEnd) return body.trim();
+  const end = body.indexOf('\n---\n');
+  return (end === -1 ? body : body.substring(0, end)).trim();
+}
+
+function extractField(content: string, field: string): string | undefined {
+  const match = content.match(new RegExp(`^\\*\\*${field}\\*\\*: (.+)$`, 'm'));
+  return match?.[1].trim();
+}
+
+/**
+ * Query text the runner put into the tool params (differs per tool)
+ */
+function queryOf(params: Record<string, any>): string {
+  return String(params.query ?? params.topic ?? params.semantic_queries?.[0] ?? '').trim();
+}
+
+/**
+ * Parse one recorded oneshot_result.md
+ */
+function parseRecording(content: string, source: string): Recording | undefined {
+  const server = extractField(content, 'MCP Server');
+  const tool = extractField(content, 'Tool Called');
+  const input = extractSection(content, 'Tool Input');
+  const result = extractSection(content, 'Tool Result', true);
+  if (!server || !tool || !input || result === undefined) {
+    return undefined;
+  }
+
+  let params: Record<string, any>;
+  try {
+    params = JSON.parse(input.replace(/^```json\s*/, '').replace(/\s*```$/, ''));
+  } catch {
+    return undefined;
+  }
+
+  const isError = result.startsWith('**Error**:');
+  return {
+    // Older results have no config line; their directory is workspace/<run>/oneshot/<config>/<scenario>
+    config: extractField(content, 'MCP Config') ?? path.basename(path.dirname(path.dirname(source))),
+    server,
+    tool,
+    params,
+    query: extractSection(content, 'Query') ?? queryOf(params),
+    result: isError ? result.substring('**Error**:'.length).trim() : result,
+    isError,
+    source,
+  };
+}
+
+/**
+ * Index recordings by exact (tool, params) and by (tool, query) as a fallback
+ */
+class RecordingIndex {
+  private byParams: Map<string, Recording> = new Map();
+  private byQuery: Map<string, Recording> = new Map();
+
+  constructor(private serverFilter?: string, private replayConfigs: Set<string> = new Set()) {}
+
+  get size(): number {
+    return this.byParams.size;
+  }
+
+  async load(dirs: string[]): Promise<void> {
+    const files: string[] = [];
+    for (const dir of dirs) {
+      await this.collect(dir, files);
+    }
+
+    // Run ids are timestamped, so later paths are newer recordings and win
+    files.sort();
+    for (const file of files) {
+      const recording = parseRecording(await fs.readFile(file, 'utf-8'), file);
+      if (!recording) continue;
+      if (this.serverFilter && recording.server !== this.serverFilter) continue;
+      if (recording.config && this.replayConfigs.has(recording.config)) continue;
+      if (recording.result.includes(INJECTED_ERROR) || recording.result.includes(NO_RECORDING)) continue;
+      this.byParams.set(canonicalJson({ tool: recording.tool, params: recording.params }), recording);
+      this.byQuery.set(`${recording.tool}\n${recording.query}`, recording);
+    }
+  }
+
+  lookup(tool: string, params: Record<string, any>): Recording | undefined {
+    return this.byParams.get(canonicalJson({ tool, params }))
+      ?? this.byQuery.get(`${tool}\n${queryOf(params)}`);
+  }
+
+  private async collect(dir: string, files: string[]): Promise<void> {
+    let entries: fs.Dirent[];
+    try {
+      entries = await fs.readdir(dir, { withFileTypes: true });
+    } catch {
+      return;
+    }
+    for (const entry of entries) {
+      const fullPath = path.join(dir, entry.name);
+      if (entry.isDirectory()) {
+        await this.collect(fullPath, files);
+      } else if (entry.name === RESULT_FILE) {
+        files.push(fullPath);
+      }
+    }
+  }
+}
+
+async function main(): Promise<void> {
+  const dirs = (process.env.REPLAY_DIR || 'sample_workspace,workspace').split(',').map(d => d.trim()).filter(Boolean);
+  const serverFilter = process.env.REPLAY_SERVER || undefined;
+  const [minLatency, maxLatency] = parseLatency(process.env.REPLAY_LATENCY_MS);
+  const errorRate = Math.min(1, Math.max(0, parseFloat(process.env.REPLAY_ERROR_RATE || '0') || 0));
+  const random = createRandom(parseInt(process.env.REPLAY_SEED || '1', 10) || 1);
+
+  const replayConfigs = new Set(listConfigs().filter(c => c.offline).map(c => c.config_name));
+  const index = new RecordingIndex(serverFilter, replayConfigs);
+  await index.load(dirs);
+  // stdout carries the protocol, so diagnostics go to stderr
+  console.error(`Replay server: ${index.size} recordings from ${dirs.join(', ')}${serverFilter ? ` (server: ${serverFilter})` : ''}`);
+
+  const server = new Server(
+    { name: 'context-bench-replay', version: '1.0.0' },
+    { capabilities: { tools: {} } }
+  );
+
+  server.setRequestHandler(ListToolsRequestSchema, async () => ({
+    tools: Object.entries(REPLAY_TOOLS).map(([name, tool]) => ({
+      name,
+      description: tool.description,
+      inputSchema: { type: 'object' as const, properties: tool.properties },
+    })),
+  }));
+
+  server.setRequestHandler(CallToolRequestSchema, async (request) => {
+    const { name, arguments: args = {} } = request.params;
+
+    const latency = minLatency + random() * (maxLatency - minLatency);
+    if (latency > 0) {
+      await new Promise(resolve => setTimeout(resolve, latency));
+    }
+
+    if (errorRate > 0 && random() < errorRate) {
+      return {
+        content: [{ type: 'text', text: `❌ Error: ${INJECTED_ERROR}` }],
+        isError: true,
+      };
+    }
+
+    const recording = index.lookup(name, args);
+    if (!recording) {
+      return {
+        content: [{ type: 'text', text: `❌ Error: ${NO_RECORDING}${name} with these parameters` }],
+        isError: true,
+      };
+    }
+
+    return {
+      content: [{ type: 'text', text: recording.result }],
+      isError: recording.isError,
+    };
+  });
+
+  await server.connect(new StdioServerTransport());
+}
+
+main().catch((error) => {
+  console.error(`Replay server failed: ${error.message || error}`);
+  process.exit(1);
+});
@@ -4,8 +4,9 @@
 
 import fs from 'fs-extra';
 import path from 'path';
-import { ScenarioReport, SummaryReport, ConfigSummary, ScenarioSummary, TestResult } from './types.js';
-import { PATHS } from './constants.js';
+import { ScenarioReport, SummaryReport, ConfigSummary, ScenarioSummary, TestResult, SpecValidationResult } from './types.js';
+import { DEFAULTS, PATHS } from './constants.js';
+import { Semaphore } from './semaphore.js';
 
 /**
  * Save scenario report to disk
@@ -36,74 +37,228 @@ export function loadScenarioReport(config: string, scenarioId: string, outputDir
 }
 
 /**
- * Generate summary report from all scenario reports
+ * What the summaries need from one scenario report; passing test results are dropped
  */
-export function generateSummaryReport(
-  runId: string,
-  configs: string[],
-  scenarioIds: string[],
-  outputDir?: string
-): SummaryReport {
-  const reportsDir = outputDir || PATHS.REPORTS_DIR;
+export interface ReportDigest {
+  passed: number;
+  total: number;
+  pass_rate: number;
+  api_passed: number;
+  spec_validation?: SpecValidationResult;
+  spec_validation_skipped?: boolean;
+  agent_stats?: ScenarioReport['agent_stats'];
+  mcp_stats?: ScenarioReport['mcp_stats'];
+  total_elapsed_ms: number;
+  failed_tests: Array<{ number: number; test: TestResult }>;  // 1-based test number
+}
+
+/**
+ * Running per-config totals
+ */
+export interface ConfigAccumulator {
+  summary: ConfigSummary;
+  agent_elapsed_ms: number;
+  agent_turns: number;
+  agent_count: number;
+  agent_input_tokens: number;        // Fresh input: uncached plus cache writes
+  agent_cache_read_tokens: number;
+  mcp_calls: number;
+  mcp_elapsed_ms: number;
+  mcp_input_tokens: number;
+  mcp_output_tokens: number;
+  mcp_count: number;
+}
 
-  const summary: SummaryReport = {
-    run_id: runId,
-    timestamp: new Date().toISOString(),
-    total_scenarios: scenarioIds.length,
-    configs: {},
-    scenarios: [],
+function digestReport(report: ScenarioReport): ReportDigest {
+  const failedTests: ReportDigest['failed_tests'] = [];
+  report.test_results.forEach((test, idx) => {
+    if (!test.validation.pass) {
+      failedTests.push({ number: idx + 1, test: { ...test, output: undefined } });
+    }
+  });
+
+  return {
+    passed: report.passed,
+    total: report.total,
+    pass_rate: report.pass_rate,
+    api_passed: report.test_results.length - failedTests.length,
+    spec_validation: report.spec_validation,
+    spec_validation_skipped: report.spec_validation_skipped,
+    agent_stats: report.agent_stats,
+    mcp_stats: report.mcp_stats,
+    total_elapsed_ms: report.total_elapsed_ms,
+    failed_tests: failedTests,
   };
+}
 
-  // Aggregate by config
-  for (const config of configs) {
-    const configSummary: ConfigSummary = {
-      passed_scenarios: 0,
-      total_scenarios: 0,
-      pass_rate: 0,
-      total_test_cases: 0,
-      passed_test_cases: 0,
-    };
+function emptyAccumulator(): ConfigAccumulator {
+  return {
+    summary: { passed_scenarios: 0, total_scenarios: 0, pass_rate: 0, total_test_cases: 0, passed_test_cases: 0 },
+    agent_elapsed_ms: 0,
+    agent_turns: 0,
+    agent_count: 0,
+    agent_input_tokens: 0,
+    agent_cache_read_tokens: 0,
+    mcp_calls: 0,
+    mcp_elapsed_ms: 0,
+    mcp_input_tokens: 0,
+    mcp_output_tokens: 0,
+    mcp_count: 0,
+  };
+}
 
-    for (const scenarioId of scenarioIds) {
-      const report = loadScenarioReport(config, scenarioId, outputDir);
-      if (report) {
-        configSummary.total_scenarios++;
-        configSummary.total_test_cases += report.total;
-        configSummary.passed_test_cases += report.passed;
+/**
+ * Incremental summary of a run
+ * Reports are folded in as workers finish (add) and the rest are read from
+ * disk once, concurrently (loadMissing), so the summary and markdown reports
+ * never re-read a scenario report.
+ */
+export class SummaryAggregator {
+  private digests: Map<string, Map<string, ReportDigest>> = new Map();  // config -> scenario -> digest
+  private accumulators: Map<string, ConfigAccumulator> = new Map();
+
+  constructor(
+    readonly runId: string,
+    readonly configs: string[],
+    readonly scenarioIds: string[]
+  ) {
+    for (const config of configs) {
+      this.digests.set(config, new Map());
+      this.accumulators.set(config, emptyAccumulator());
+    }
+  }
 
-        if (report.pass_rate === 1.0) {
-          configSummary.passed_scenarios++;
-        }
-      }
+  /**
+   * Fold in a finished scenario; a newer report for the same scenario replaces the old one
+   */
+  add(report: ScenarioReport): void {
+    const digests = this.digests.get(report.config);
+    if (!digests) {
+      return;
     }
 
-    if (configSummary.total_scenarios > 0) {
-      configSummary.pass_rate = configSummary.passed_scenarios / configSummary.total_scenarios;
+    const previous = digests.get(report.scenario_id);
+    if (previous) {
+      this.apply(report.config, previous, -1);
     }
+    const digest = digestReport(report);
+    digests.set(report.scenario_id, digest);
+    this.apply(report.config, digest, 1);
+  }
 
-    summary.configs[config] = configSummary;
+  has(config: string, scenarioId: string): boolean {
+    return this.digests.get(config)?.has(scenarioId) ?? false;
   }
 
-  // Aggregate by scenario
-  for (const scenarioId of scenarioIds) {
-    const scenarioSummary: ScenarioSummary = {
-      scenario_id: scenarioId,
+  getReport(config: string, scenarioId: string): ReportDigest | undefined {
+    return this.digests.get(config)?.get(scenarioId);
+  }
+
+  getAccumulator(config: string): ConfigAccumulator {
+    return this.accumulators.get(config) ?? emptyAccumulator();
+  }
+
+  /**
+   * Read the reports that were not added live (earlier or resumed runs, crashed workers)
+   * Returns the number of reports loaded
+   */
+  async loadMissing(outputDir?: string): Promise<number> {
+    const reportsDir = outputDir || PATHS.REPORTS_DIR;
+    const slots = new Semaphore(DEFAULTS.REPORT_READ_CONCURRENCY);
+    let loaded = 0;
+
+    const reads = this.configs.flatMap(config => this.scenarioIds
+      .filter(scenarioId => !this.has(config, scenarioId))
+      .map(scenarioId => slots.run(async () => {
+        const reportPath = path.join(reportsDir, config, `${scenarioId}.json`);
+        const report = await fs.readJson(reportPath).catch(() => null) as ScenarioReport | null;
+        // The scenario may have finished live while the read was in flight
+        if (report && !this.has(config, scenarioId)) {
+          this.add({ ...report, config, scenario_id: scenarioId });
+          loaded++;
+        }
+      })));
+
+    await Promise.all(reads);
+    return loaded;
+  }
+
+  /**
+   * Current summary; cheap enough to call after every result
+   */
+  getSummary(): SummaryReport {
+    const summary: SummaryReport = {
+      run_id: this.runId,
+      timestamp: new Date().toISOString(),
+      total_scenarios: this.scenarioIds.length,
+      configs: {},
+      scenarios: [],
     };
 
-    for (const config of configs) {
-      const report = loadScenarioReport(config, scenarioId, outputDir);
-      if (report) {
-        scenarioSummary[config] = {
-          passed: report.passed,
-          total: report.total,
-        };
+    for (const config of this.configs) {
+      summary.configs[config] = { ...this.getAccumulator(config).summary };
+    }
+
+    for (const scenarioId of this.scenarioIds) {
+      const scenarioSummary: ScenarioSummary = {
+        scenario_id: scenarioId,
+      };
+      for (const config of this.configs) {
+        const digest = this.getReport(config, scenarioId);
+        if (digest) {
+          scenarioSummary[config] = {
+            passed: digest.passed,
+            total: digest.total,
+          };
+        }
       }
+      summary.scenarios.push(scenarioSummary);
     }
 
-    summary.scenarios.push(scenarioSummary);
+    return summary;
+  }
+
+  private apply(config: string, digest: ReportDigest, sign: 1 | -1): void {
+    const acc = this.accumulators.get(config)!;
+    const stats = acc.summary;
+
+    stats.total_scenarios += sign;
+    stats.total_test_cases += sign * digest.total;
+    stats.passed_test_cases += sign * digest.passed;
+    if (digest.pass_rate === 1.0) {
+      stats.passed_scenarios += sign;
+    }
+    stats.pass_rate = stats.total_scenarios > 0 ? stats.passed_scenarios / stats.total_scenarios : 0;
+
+    if (digest.agent_stats) {
+      acc.agent_elapsed_ms += sign * digest.agent_stats.elapsed_ms;
+      acc.agent_turns += sign * digest.agent_stats.turns;
+      acc.agent_count += sign;
+      acc.agent_input_tokens += sign * ((digest.agent_stats.input_tokens ?? 0) + (digest.agent_stats.cache_creation_input_tokens ?? 0));
+      acc.agent_cache_read_tokens += sign * (digest.agent_stats.cache_read_input_tokens ?? 0);
+    }
+    if (digest.mcp_stats) {
+      acc.mcp_calls += sign * digest.mcp_stats.total_calls;
+      acc.mcp_elapsed_ms += sign * digest.mcp_stats.total_elapsed_ms;
+      acc.mcp_input_tokens += sign * digest.mcp_stats.total_input_tokens;
+      acc.mcp_output_tokens += sign * digest.mcp_stats.total_output_tokens;
+      acc.mcp_count += sign;
+    }
   }
+}
 
-  return summary;
+/**
+ * Generate summary report from all scenario reports
+ */
+export async function generateSummaryReport(
+  runId: string,
+  configs: string[],
+  scenarioIds: string[],
+  outputDir?: string
+): Promise<SummaryReport> {
+  const aggregator = new SummaryAggregator(runId, configs, scenarioIds);
+  await aggregator.loadMissing(outputDir);
+  return aggregator.getSummary();
 }
 
 /**
@@ -127,9 +282,23 @@ export function printScenarioReport(report: ScenarioReport) {
   console.log(`Results: ${report.passed}/${report.total} passed (${(report.pass_rate * 100).toFixed(1)}%)`);
   console.log(`Report: reports/${report.config}/${report.scenario_id}.json`);
   console.log(`Elapsed: ${(report.total_elapsed_ms / 1000).toFixed(1)}s`);
+  if (report.agent_stats?.input_tokens !== undefined) {
+    console.log(`Agent input tokens: ${formatAgentInputTokens(report.agent_stats)}`);
+  }
   console.log('━'.repeat(80) + '\n');
 }
 
+/**
+ * Fresh vs cache-read input tokens, e.g. "12000 fresh (800 cache write), 48000 cache read (80.0%)"
+ */
+function formatAgentInputTokens(stats: NonNullable<ScenarioReport['agent_stats']>): string {
+  const cacheWrite = stats.cache_creation_input_tokens ?? 0;
+  const cacheRead = stats.cache_read_input_tokens ?? 0;
+  const fresh = (stats.input_tokens ?? 0) + cacheWrite;
+  const share = fresh + cacheRead > 0 ? ((cacheRead / (fresh + cacheRead)) * 100).toFixed(1) : '0.0';
+  return `${fresh} fresh (${cacheWrite} cache write), ${cacheRead} cache read (${share}%)`;
+}
+
 /**
  * Print summary report to console
  */
@@ -215,6 +384,9 @@ function generateTestResultMarkdown(report: ScenarioReport): string {
     lines.push(`- **Turns**: ${report.agent_stats.turns}`);
     lines.push(`- **Tool Calls**: ${report.agent_stats.tool_calls}`);
     lines.push(`- **Agent Elapsed**: ${(report.agent_stats.elapsed_ms / 1000).toFixed(1)}s`);
+    if (report.agent_stats.input_tokens !== undefined) {
+      lines.push(`- **Input Tokens**: ${formatAgentInputTokens(report.agent_stats)}`);
+    }
     lines.push('');
   }
 
@@ -349,10 +521,22 @@ function generateFinalResultMarkdown(report: ScenarioReport): string {
   if (report.build_time_ms) {
     lines.push(`- **Build Time**: ${(report.build_time_ms / 1000).toFixed(2)}s`);
   }
+  if (report.build_breakdown) {
+    const b = report.build_breakdown;
+    lines.push(`  - Queue wait: ${(b.queue_wait_ms / 1000).toFixed(2)}s`);
+    lines.push(`  - Base image: ${(b.base_image_ms / 1000).toFixed(2)}s (${b.base_image_cached ? 'reused' : 'built'} \`${b.base_image}\`)`);
+    lines.push(`  - Scenario image: ${(b.image_build_ms / 1000).toFixed(2)}s`);
+    for (const step of b.steps) {
+      lines.push(`    - \`${step.step}\`: ${step.cached ? 'cached' : `${(step.duration_ms / 1000).toFixed(2)}s`}`);
+    }
+  }
   if (report.agent_stats) {
     lines.push(`- **Agent Execution Time**: ${(report.agent_stats.elapsed_ms / 1000).toFixed(2)}s`);
     lines.push(`- **Agent Turns**: ${report.agent_stats.turns}`);
     lines.push(`- **Agent Tool Calls**: ${report.agent_stats.tool_calls}`);
+    if (report.agent_stats.input_tokens !== undefined) {
+      lines.push(`- **Agent Input Tokens**: ${formatAgentInputTokens(report.agent_stats)}`);
+    }
   }
   if (report.mcp_stats) {
     lines.push(`- **MCP Total Calls**: ${report.mcp_stats.total_calls}`);
@@ -360,6 +544,10 @@ function generateFinalResultMarkdown(report: ScenarioReport): string {
     lines.push(`- **MCP Total Input Tokens**: ${report.mcp_stats.total_input_tokens}`);
     lines.push(`- **MCP Total Output Tokens**: ${report.mcp_stats.total_output_tokens}`);
   }
+  if (report.oneshot_stats) {
+    lines.push(`- **MCP Tool**: ${report.oneshot_stats.mcp_server_used}/${report.oneshot_stats.mcp_tool_used}`);
+    lines.push(`- **MCP Tool Time**: ${report.oneshot_stats.cache_hit ? 'cache hit' : `${(report.oneshot_stats.elapsed_ms / 1000).toFixed(2)}s`}`);
+  }
   lines.push('');
 
   // Test Results Summary
@@ -608,10 +796,9 @@ export function saveFinalResultMarkdown(report: ScenarioReport, workspaceDir: st
  */
 export function generateBenchmarkSummaryMarkdown(
   summary: SummaryReport,
-  outputDir?: string
+  aggregator: SummaryAggregator
 ): string {
   const lines: string[] = [];
-  const reportsDir = outputDir || PATHS.REPORTS_DIR;
 
   // Header
   lines.push('# 🎯 Benchmark Results');
@@ -651,8 +838,8 @@ export function generateBenchmarkSummaryMarkdown(
   // Config Performance Comparison Table
   lines.push('## 🔧 Configuration Performance');
   lines.push('');
-  lines.push('| Config | Scenarios | Pass Rate | Test Cases | Agent Avg Time | MCP Avg Calls | MCP Avg Time | MCP Avg In | MCP Avg Out |');
-  lines.push('|--------|-----------|-----------|------------|----------------|---------------|--------------|------------|-------------|');
+  lines.push('| Config | Scenarios | Pass Rate | Test Cases | Agent Avg Time | Agent Cache Read | MCP Avg Calls | MCP Avg Time | MCP Avg In | MCP Avg Out |');
+  lines.push('|--------|-----------|-----------|------------|----------------|------------------|---------------|--------------|------------|-------------|');
 
   for (const config of configNames) {
     const stats = summary.configs[config];
@@ -661,38 +848,18 @@ export function generateBenchmarkSummaryMarkdown(
       ? ((stats.passed_test_cases / stats.total_test_cases) * 100).toFixed(1)
       : '0';
 
-    // Calculate average agent time and MCP stats
-    let totalAgentTime = 0;
-    let totalMcpCalls = 0;
-    let totalMcpTime = 0;
-    let totalMcpInputTokens = 0;
-    let totalMcpOutputTokens = 0;
-    let scenarioCount = 0;
-    let mcpScenarioCount = 0;
-
-    for (const scenarioSum of summary.scenarios) {
-      const report = loadScenarioReport(config, scenarioSum.scenario_id, outputDir);
-      if (report?.agent_stats) {
-        totalAgentTime += report.agent_stats.elapsed_ms;
-        scenarioCount++;
-      }
-      if (report?.mcp_stats) {
-        totalMcpCalls += report.mcp_stats.total_calls;
-        totalMcpTime += report.mcp_stats.total_elapsed_ms;
-        totalMcpInputTokens += report.mcp_stats.total_input_tokens;
-        totalMcpOutputTokens += report.mcp_stats.total_output_tokens;
-        mcpScenarioCount++;
-      }
-    }
-
-    const avgTime = scenarioCount > 0 ? (totalAgentTime / scenarioCount / 1000).toFixed(1) : '-';
-    const avgMcpCalls = mcpScenarioCount > 0 ? (totalMcpCalls / mcpScenarioCount).toFixed(1) : '0';
-    const avgMcpTime = mcpScenarioCount > 0 ? (totalMcpTime / mcpScenarioCount / 1000).toFixed(1) : '0';
-    const avgMcpInputTokens = mcpScenarioCount > 0 ? Math.round(totalMcpInputTokens / mcpScenarioCount).toString() : '0';
-    const avgMcpOutputTokens = mcpScenarioCount > 0 ? Math.round(totalMcpOutputTokens / mcpScenarioCount).toString() : '0';
+    // Average agent time and MCP stats from the running totals
+    const acc = aggregator.getAccumulator(config);
+    const avgTime = acc.agent_count > 0 ? (acc.agent_elapsed_ms / acc.agent_count / 1000).toFixed(1) : '-';
+    const agentInput = acc.agent_input_tokens + acc.agent_cache_read_tokens;
+    const cacheRead = agentInput > 0 ? `${((acc.agent_cache_read_tokens / agentInput) * 100).toFixed(1)}%` : '-';
+    const avgMcpCalls = acc.mcp_count > 0 ? (acc.mcp_calls / acc.mcp_count).toFixed(1) : '0';
+    const avgMcpTime = acc.mcp_count > 0 ? (acc.mcp_elapsed_ms / acc.mcp_count / 1000).toFixed(1) : '0';
+    const avgMcpInputTokens = acc.mcp_count > 0 ? Math.round(acc.mcp_input_tokens / acc.mcp_count).toString() : '0';
+    const avgMcpOutputTokens = acc.mcp_count > 0 ? Math.round(acc.mcp_output_tokens / acc.mcp_count).toString() : '0';
 
     const statusIcon = stats.pass_rate >= 0.8 ? '✅' : stats.pass_rate >= 0.5 ? '⚠️' : '❌';
-    lines.push(`| ${statusIcon} **${config}** | ${stats.passed_scenarios}/${stats.total_scenarios} | ${passRate}% | ${stats.passed_test_cases}/${stats.total_test_cases} (${testCaseRate}%) | ${avgTime}s | ${avgMcpCalls} | ${avgMcpTime}s | ${avgMcpInputTokens} | ${avgMcpOutputTokens} |`);
+    lines.push(`| ${statusIcon} **${config}** | ${stats.passed_scenarios}/${stats.total_scenarios} | ${passRate}% | ${stats.passed_test_cases}/${stats.total_test_cases} (${testCaseRate}%) | ${avgTime}s | ${cacheRead} | ${avgMcpCalls} | ${avgMcpTime}s | ${avgMcpInputTokens} | ${avgMcpOutputTokens} |`);
   }
   lines.push('');
 
@@ -732,13 +899,12 @@ export function generateBenchmarkSummaryMarkdown(
         if (data && typeof data === 'object' && 'passed' in data && 'total' in data) {
           const isPassed = data.passed === data.total && data.total > 0;
           if (!isPassed) {
-            const report = loadScenarioReport(config, scenarioId, outputDir);
+            const report = aggregator.getReport(config, scenarioId);
             let errorSummary = `${data.passed}/${data.total} tests passed`;
 
             if (report) {
-              const failedTests = report.test_results.filter(t => !t.validation.pass);
-              if (failedTests.length > 0) {
-                const firstError = failedTests[0];
+              if (report.failed_tests.length > 0) {
+                const firstError = report.failed_tests[0].test;
                 if (firstError.error) {
                   errorSummary = firstError.error.split('\n')[0].substring(0, 60) + '...';
                 } else if (firstError.validation.errors && firstError.validation.errors.length > 0) {
@@ -767,11 +933,9 @@ export function generateBenchmarkSummaryMarkdown(
   for (const config of configNames) {
     let fastest = { id: '-', time: Infinity };
     let slowest = { id: '-', time: 0 };
-    let totalTurns = 0;
-    let turnCount = 0;
 
     for (const scenarioSum of summary.scenarios) {
-      const report = loadScenarioReport(config, scenarioSum.scenario_id, outputDir);
+      const report = aggregator.getReport(config, scenarioSum.scenario_id);
       if (report?.agent_stats) {
         const time = report.agent_stats.elapsed_ms / 1000;
         if (time < fastest.time) {
@@ -780,12 +944,11 @@ export function generateBenchmarkSummaryMarkdown(
         if (time > slowest.time) {
           slowest = { id: scenarioSum.scenario_id, time };
         }
-        totalTurns += report.agent_stats.turns;
-        turnCount++;
       }
     }
 
-    const avgTurns = turnCount > 0 ? (totalTurns / turnCount).toFixed(1) : '-';
+    const acc = aggregator.getAccumulator(config);
+    const avgTurns = acc.agent_count > 0 ? (acc.agent_turns / acc.agent_count).toFixed(1) : '-';
     const fastestStr = fastest.time !== Infinity ? `${fastest.id} (${fastest.time.toFixed(1)}s)` : '-';
     const slowestStr = slowest.time > 0 ? `${slowest.id} (${slowest.time.toFixed(1)}s)` : '-';
 
@@ -808,10 +971,9 @@ export function generateBenchmarkSummaryMarkdown(
 export function generateConfigSummaryMarkdown(
   summary: SummaryReport,
   configName: string,
-  outputDir?: string
+  aggregator: SummaryAggregator
 ): string {
   const lines: string[] = [];
-  const reportsDir = outputDir || PATHS.REPORTS_DIR;
 
   const configStats = summary.configs[configName];
   if (!configStats) {
@@ -856,10 +1018,9 @@ export function generateConfigSummaryMarkdown(
       const isPassed = data.passed === data.total && data.total > 0;
       const statusIcon = isPassed ? '✅' : '❌';
 
-      const report = loadScenarioReport(configName, scenarioId, outputDir);
+      const report = aggregator.getReport(configName, scenarioId);
       if (report) {
-        const apiTestsPassed = report.test_results.filter(t => t.validation.pass).length;
-        const apiStr = `${apiTestsPassed}/${report.total}`;
+        const apiStr = `${report.api_passed}/${report.total}`;
 
         let specStr = '➖';
         if (report.spec_validation_skipped) {
@@ -901,14 +1062,11 @@ export function generateConfigSummaryMarkdown(
 
     for (const scenarioSum of failedScenarios) {
       const scenarioId = scenarioSum.scenario_id;
-      const report = loadScenarioReport(configName, scenarioId, outputDir);
+      const report = aggregator.getReport(configName, scenarioId);
 
       if (report) {
-        const failedTests = report.test_results.filter(t => !t.validation.pass);
-
-        if (failedTests.length > 0) {
-          failedTests.forEach((test, idx) => {
-            const testNum = report.test_results.indexOf(test) + 1;
+        if (report.failed_tests.length > 0) {
+          report.failed_tests.forEach(({ number: testNum, test }) => {
             let errorType = 'API Schema';
             let errorMsg = 'Unknown error';
 
@@ -942,16 +1100,14 @@ export function generateConfigSummaryMarkdown(
 
     for (const scenarioSum of failedScenarios) {
       const scenarioId = scenarioSum.scenario_id;
-      const report = loadScenarioReport(configName, scenarioId, outputDir);
+      const report = aggregator.getReport(configName, scenarioId);
 
       if (report) {
         lines.push(`#### ${scenarioId}`);
         lines.push('');
 
-        const failedTests = report.test_results.filter(t => !t.validation.pass);
-        if (failedTests.length > 0) {
-          failedTests.forEach((test, idx) => {
-            const testNum = report.test_results.indexOf(test) + 1;
+        if (report.failed_tests.length > 0) {
+          report.failed_tests.forEach(({ number: testNum, test }) => {
             lines.push(`**Test ${testNum}:**`);
             lines.push('```');
             if (test.error) {
@@ -998,9 +1154,9 @@ export function generateConfigSummaryMarkdown(
 export function saveBenchmarkSummaryMarkdown(
   summary: SummaryReport,
   runId: string,
-  outputDir?: string
+  aggregator: SummaryAggregator
 ): string {
-  const markdown = generateBenchmarkSummaryMarkdown(summary, outputDir);
+  const markdown = generateBenchmarkSummaryMarkdown(summary, aggregator);
   const workspaceRunDir = path.join('workspace', runId);
   fs.ensureDirSync(workspaceRunDir);
 
@@ -1017,9 +1173,9 @@ export function saveConfigSummaryMarkdown(
   summary: SummaryReport,
   configName: string,
   runId: string,
-  outputDir?: string
+  aggregator: SummaryAggregator
 ): string {
-  const markdown = generateConfigSummaryMarkdown(summary, configName, outputDir);
+  const markdown = generateConfigSummaryMarkdown(summary, configName, aggregator);
   const configWorkspaceDir = path.join('workspace', runId, configName);
   fs.ensureDirSync(configWorkspaceDir);
 
@@ -0,0 +1,187 @@
+/**
+ * Run manifest
+ * Append-only journal (workspace/<runId>/run_manifest.jsonl) with one line per
+ * finished (mode, config, scenario). Each line carries a hash of the inputs
+ * (query, test inputs, oracle file, MCP config) and of the report, so a run can
+ * be resumed after a crash (--resume) or re-run only where inputs changed
+ * since a reference run (--only-changed). Each shard of a sharded run appends
+ * to its own run_manifest.shard-<i>-of-<n>.jsonl; opening a manifest reads all
+ * of the run's journals.
+ */
+
+import fs from 'fs-extra';
+import path from 'path';
+import { RunContext, ScenarioReport, ExecutionMode, MCPConfig, ScenarioSpec } from './types.js';
+import { PATHS } from './constants.js';
+import { hashContent } from './cache.js';
+import { findCatalogScenario } from './scenario-loader.js';
+import { Shard, shardFileName } from './sharding.js';
+
+export type ManifestStatus = 'completed' | 'error';
+
+export interface ManifestEntry {
+  mode: ExecutionMode;
+  config: string;
+  scenario: string;
+  status: ManifestStatus;
+  input_hash: string;
+  result_hash?: string;
+  pass_rate?: number;
+  error?: string;
+  reused_from?: string;   // Run whose result was carried over by --only-changed
+  completed_at: string;
+}
+
+export const RUN_MANIFEST_FILE = 'run_manifest.jsonl';
+
+const MANIFEST_FILE_PATTERN = /^run_manifest(\.shard-\d+-of-\d+)?\.jsonl$/;
+
+/**
+ * Path of a run's manifest (of one shard's journal when sharded)
+ */
+export function getManifestPath(runId: string, shard?: Shard): string {
+  return path.join(PATHS.WORKSPACE_DIR, runId, shardFileName(RUN_MANIFEST_FILE, shard));
+}
+
+/**
+ * Every journal of a run: the unsharded manifest and one per shard
+ */
+function listManifestFiles(runId: string): string[] {
+  const dir = path.join(PATHS.WORKSPACE_DIR, runId);
+  if (!fs.existsSync(dir)) {
+    return [];
+  }
+  return fs.readdirSync(dir)
+    .filter(name => MANIFEST_FILE_PATTERN.test(name))
+    .sort()
+    .map(name => path.join(dir, name));
+}
+
+function entryKey(mode: string, config: string, scenario: string): string {
+  return `${mode}/${config}/${scenario}`;
+}
+
+const oracleHashes: Map<string, string> = new Map();
+
+/**
+ * Hash of everything that determines a scenario's result
+ */
+export function computeInputHash(scenario: ScenarioSpec, config: MCPConfig, mode: ExecutionMode): string {
+  // Scenario specs don't carry the oracle; the catalog resolves it from the package file
+  const oraclePath = findCatalogScenario(scenario.id)?.oraclePath;
+  let oracleHash: string | null = null;
+  if (oraclePath) {
+    oracleHash = oracleHashes.get(oraclePath) ?? null;
+    if (oracleHash === null) {
+      oracleHash = fs.existsSync(oraclePath) ? hashContent(fs.readFileSync(oraclePath, 'utf-8')) : 'missing';
+      oracleHashes.set(oraclePath, oracleHash);
+    }
+  }
+
+  return hashContent({
+    mode,
+    query: scenario.agent_prompt,
+    test_inputs: scenario.test_inputs,
+    env_vars: scenario.env_vars,
+    oracle: oracleHash,
+    config: { mcp_servers: config.mcp_servers },
+  });
+}
+
+export class RunManifest {
+  private entries: Map<string, ManifestEntry> = new Map();
+  private tornTail = false;
+
+  private constructor(readonly runId: string, private readonly file: string) {}
+
+  /**
+   * Open a run's manifest, reading any entries already journaled by any shard
+   * New entries go to the shard's own journal
+   */
+  static open(runId: string, shard?: Shard): RunManifest {
+    const manifest = new RunManifest(runId, getManifestPath(runId, shard));
+    manifest.load();
+    return manifest;
+  }
+
+  static exists(runId: string): boolean {
+    return listManifestFiles(runId).length > 0;
+  }
+
+  private load(): void {
+    const loaded: ManifestEntry[] = [];
+    for (const file of listManifestFiles(this.runId)) {
+      const content = fs.readFileSync(file, 'utf-8');
+      if (file === this.file) {
+        this.tornTail = content.length > 0 && !content.endsWith('\n');
+      }
+      for (const line of content.split('\n')) {
+        if (!line.trim()) continue;
+        try {
+          loaded.push(JSON.parse(line) as ManifestEntry);
+        } catch {
+          // A line torn by a crash mid-append
+        }
+      }
+    }
+
+    // Later entries win; across journals, by completion time
+    loaded.sort((a, b) => a.completed_at.localeCompare(b.completed_at));
+    for (const entry of loaded) {
+      this.entries.set(entryKey(entry.mode, entry.config, entry.scenario), entry);
+    }
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  get(mode: string, config: string, scenario: string): ManifestEntry | undefined {
+    return this.entries.get(entryKey(mode, config, scenario));
+  }
+
+  /**
+   * Completed entry for a context whose inputs are unchanged
+   */
+  findReusable(context: RunContext): ManifestEntry | undefined {
+    const entry = this.get(context.mode, context.config.config_name, context.scenario.id);
+    if (entry?.status !== 'completed') {
+      return undefined;
+    }
+    return entry.input_hash === computeInputHash(context.scenario, context.config, context.mode) ? entry : undefined;
+  }
+
+  /**
+   * Journal a finished scenario (written synchronously so a crash right after keeps it)
+   */
+  record(context: RunContext, report?: ScenarioReport, error?: string): ManifestEntry {
+    const entry: ManifestEntry = {
+      mode: context.mode,
+      config: context.config.config_name,
+      scenario: context.scenario.id,
+      status: report ? 'completed' : 'error',
+      input_hash: computeInputHash(context.scenario, context.config, context.mode),
+      result_hash: report ? hashContent({ ...report, timestamp: undefined }) : undefined,
+      pass_rate: report?.pass_rate,
+      error,
+      completed_at: new Date().toISOString(),
+    };
+    this.append(entry);
+    return entry;
+  }
+
+  /**
+   * Carry over an unchanged result from another run's manifest
+   */
+  recordReused(entry: ManifestEntry, fromRunId: string): void {
+    this.append({ ...entry, reused_from: entry.reused_from ?? fromRunId });
+  }
+
+  private append(entry: ManifestEntry): void {
+    fs.ensureDirSync(path.dirname(this.file));
+    // Start on a fresh line if a crash left a partial one
+    fs.appendFileSync(this.file, (this.tornTail ? '\n' : '') + JSON.stringify(entry) + '\n');
+    this.tornTail = false;
+    this.entries.set(entryKey(entry.mode, entry.config, entry.scenario), entry);
+  }
+}
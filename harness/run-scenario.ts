@@ -13,16 +13,51 @@ import { initWorkspace, cleanWorkspace } from './workspace.js';
 import { runAgent } from './agent-runner.js';
 import { runOneshot } from './oneshot-runner.js';
 import { evaluateResult } from './evaluator.js';
-import { buildImage, startService, stopService, cleanupDocker } from './docker-service.js';
+import { buildImage, startService, stopService, cleanupDocker, BuildBreakdown } from './docker-service.js';
 import { runTests } from './test-runner.js';
+import { ContainerPool, WarmContainer } from './container-pool.js';
 import { saveScenarioReport, saveTestResultMarkdown, saveFinalResultMarkdown } from './report.js';
 import { resolveEnvVars } from './validator.js';
 import { validateScenarioImplementation } from './scenario-validator.js';
+import { Trace, StageTimings, TRACE_FILE, withSpan } from './tracing.js';
+import { withResource } from './scheduler.js';
+
+// Notified when a saved report changes after runScenario returned (background evaluations)
+let reportUpdateListener: ((report: ScenarioReport) => void) | undefined;
+
+/**
+ * Set the listener for reports rewritten after the fact, e.g. the run's summary aggregator
+ */
+export function setReportUpdateListener(listener: ((report: ScenarioReport) => void) | undefined): void {
+  reportUpdateListener = listener;
+}
 
 /**
  * Run a single scenario with a given configuration
+ * Stage timings are traced to <logDir>/trace.json and added to the run's totals.
  */
 export async function runScenario(context: RunContext): Promise<ScenarioReport> {
+  const trace = new Trace(`${context.config.config_name}/${context.scenario.id}`, {
+    run_id: context.runId,
+    mode: context.mode,
+    config: context.config.config_name,
+    scenario: context.scenario.id,
+  });
+
+  try {
+    return await trace.run(() => executeScenario(context));
+  } finally {
+    trace.finish();
+    StageTimings.getInstance().add(trace);
+    try {
+      await trace.save(path.join(context.logDir, TRACE_FILE));
+    } catch {
+      // A missing trace must not fail the scenario
+    }
+  }
+}
+
+async function executeScenario(context: RunContext): Promise<ScenarioReport> {
   const { scenario, config, runId, workspaceDir, logDir, timeout, verbose, keepWorkspace } = context;
 
   // Create logger
@@ -43,6 +78,9 @@ export async function runScenario(context: RunContext): Promise<ScenarioReport>
   logger.info('━'.repeat(80));
 
   let serviceHandle: any = null;
+  const warmPool = ContainerPool.getInstance();
+  let warmContainer: WarmContainer | undefined;
+  let warmDeployFailed = false;
   const imageName = `context-bench-${scenario.id}-${runId}`;
 
   // Helper to show progress in console (non-verbose, non-parallel mode only)
@@ -69,9 +107,11 @@ export async function runScenario(context: RunContext): Promise<ScenarioReport>
     // Step 2: Validate environment variables
     showProgress('[2/8] Validating env');
     logger.info('[2/8] Validating environment variables...');
-    if (!validateScenarioEnv(scenario)) {
-      throw new Error('Missing required environment variables');
-    }
+    await withSpan('validate_env', async () => {
+      if (!validateScenarioEnv(scenario)) {
+        throw new Error('Missing required environment variables');
+      }
+    });
     logger.info('[2/8] Validating environment variables... ✓');
 
     // Step 3: Initialize workspace
@@ -79,14 +119,16 @@ export async function runScenario(context: RunContext): Promise<ScenarioReport>
     logger.info('[3/8] Initializing workspace...');
     logger.marker(LOG_MARKERS.WORKSPACE_INIT_START);
 
-    if (context.mode === 'oneshot') {
-      // Oneshot mode: Just create empty workspace directory
-      fs.ensureDirSync(workspaceDir);
-      logger.info('Created empty workspace for oneshot mode');
-    } else {
-      // Agent mode: Initialize full workspace with scaffold template
-      await initWorkspace(scenario, workspaceDir, logger);
-    }
+    await withSpan('workspace_init', async () => {
+      if (context.mode === 'oneshot') {
+        // Oneshot mode: Just create empty workspace directory
+        fs.ensureDirSync(workspaceDir);
+        logger.info('Created empty workspace for oneshot mode');
+      } else {
+        // Agent mode: Initialize full workspace with scaffold template
+        await initWorkspace(scenario, workspaceDir, logger, context.workspaceMode);
+      }
+    }, { workspace_mode: context.mode === 'agent' ? context.workspaceMode : undefined });
 
     logger.marker(LOG_MARKERS.WORKSPACE_INIT_SUCCESS);
     logger.info('[3/8] Initializing workspace... ✓');
@@ -106,19 +148,21 @@ export async function runScenario(context: RunContext): Promise<ScenarioReport>
     if (context.mode === 'oneshot') {
       showProgress('[5/8] Running oneshot');
       logger.info('[5/8] Running oneshot mode (single MCP tool call)...');
-      oneshotStats = await runOneshot(scenario, config, workspaceDir, logger, timeout, context.sharedMcpManager);
+      oneshotStats = await withResource('mcp', () => withSpan('oneshot', () =>
+        runOneshot(scenario, config, workspaceDir, logger, timeout, context.sharedMcpManager, context.cacheMode)));
       logger.info(`Oneshot: ${oneshotStats.mcp_tool_used} on ${oneshotStats.mcp_server_used}`);
       logger.info('[5/8] Running oneshot... ✓');
     } else {
       showProgress('[5/8] Invoking agent');
       logger.info('[5/8] Invoking agent (this may take a while)...');
-      agentStats = await runAgent(scenario, config, workspaceDir, logger, timeout);
+      agentStats = await withResource('llm', () => withSpan('agent', () => runAgent(scenario, config, workspaceDir, logger, timeout)));
       logger.info(`Agent turns: ${agentStats.turns}, tool calls: ${agentStats.tool_calls}`);
       logger.info('[5/8] Invoking agent... ✓');
     }
 
     // Step 6-7: Build service and run tests (skip for oneshot mode)
     let buildTime = 0;
+    let buildBreakdown: BuildBreakdown | undefined;
     let testResults: any[] = [];
     let scenarioSpecValidation: SpecValidationResult | undefined;
     let specValidationSkipped = false;
@@ -131,20 +175,47 @@ export async function runScenario(context: RunContext): Promise<ScenarioReport>
       specValidationSkipped = true;
     } else {
       // Agent mode: Build and test
-      showProgress('[6/8] Building Docker image');
-      logger.info('[6/8] Building service...');
-      const buildStart = Date.now();
-      await buildImage(workspaceDir, imageName, logger);
-      buildTime = Date.now() - buildStart;
-      logger.info(`Build time: ${(buildTime / 1000).toFixed(1)}s`);
-      logger.info('[6/8] Building service... ✓');
-
-      showProgress('[7/8] Running tests');
-      logger.info('[7/8] Running test cases...');
       const resolvedEnvVars = scenario.env_vars ? resolveEnvVars(scenario.env_vars) : undefined;
-      serviceHandle = await startService(imageName, logger, resolvedEnvVars);
-      testResults = await runTests(scenario, serviceHandle.port, logger);
-      logger.info('[7/8] Running test cases... ✓');
+
+      // Build, container and tests hold a docker pool slot
+      await withResource('docker', async () => {
+        let servicePort: number;
+
+        if (warmPool.isEnabled()) {
+          // Warm pool: compile into an already running container instead of building an image
+          showProgress('[6/8] Deploying to warm container');
+          logger.info('[6/8] Deploying to warm container...');
+          const buildStart = Date.now();
+          const leased = await withSpan('warm_acquire', () => warmPool.acquire(logger));
+          warmContainer = leased;
+          warmDeployFailed = true;
+          buildBreakdown = await withSpan('build', () => warmPool.deploy(leased, workspaceDir, resolvedEnvVars, logger),
+            { warm: true, container: leased.name });
+          buildBreakdown.queue_wait_ms = Date.now() - buildStart - buildBreakdown.image_build_ms;
+          warmDeployFailed = false;
+          buildTime = Date.now() - buildStart;
+          servicePort = warmContainer.port;
+          logger.info(`Deploy time: ${(buildTime / 1000).toFixed(1)}s`);
+          logger.info('[6/8] Deploying to warm container... ✓');
+        } else {
+          showProgress('[6/8] Building Docker image');
+          logger.info('[6/8] Building service...');
+          const buildStart = Date.now();
+          buildBreakdown = await withSpan('build', () => buildImage(workspaceDir, imageName, logger), { warm: false });
+          buildTime = Date.now() - buildStart;
+          logger.info(`Build time: ${(buildTime / 1000).toFixed(1)}s`);
+          logger.info('[6/8] Building service... ✓');
+
+          serviceHandle = await withSpan('container_start', () => startService(imageName, logger, resolvedEnvVars));
+          servicePort = serviceHandle.port;
+        }
+
+        showProgress('[7/8] Running tests');
+        logger.info('[7/8] Running test cases...');
+        testResults = await withSpan('tests', () => runTests(scenario, servicePort, logger),
+          { test_cases: scenario.test_inputs.length });
+        logger.info('[7/8] Running test cases... ✓');
+      });
 
       // Create temporary report for spec validation (agent mode only)
       const tempReport: ScenarioReport = {
@@ -160,6 +231,10 @@ export async function runScenario(context: RunContext): Promise<ScenarioReport>
           turns: agentStats.turns,
           tool_calls: agentStats.tool_calls,
           elapsed_ms: agentStats.elapsed_ms,
+          input_tokens: agentStats.input_tokens,
+          output_tokens: agentStats.output_tokens,
+          cache_creation_input_tokens: agentStats.cache_creation_input_tokens,
+          cache_read_input_tokens: agentStats.cache_read_input_tokens,
         } : undefined,
         mcp_stats: agentStats?.mcp_stats,
         build_time_ms: buildTime,
@@ -174,12 +249,12 @@ export async function runScenario(context: RunContext): Promise<ScenarioReport>
 
       if (apiTestsPassed) {
         logger.info('[7.5/8] Validating implementation against scenario spec...');
-        scenarioSpecValidation = await validateScenarioImplementation(
+        scenarioSpecValidation = await withSpan('spec_validation', () => validateScenarioImplementation(
           scenario,
           workspaceDir,
           apiResultPath,
           logger
-        );
+        ));
         logger.info('[7.5/8] Spec validation complete');
       } else {
         logger.info('[7.5/8] Skipping spec validation (API tests failed)');
@@ -190,10 +265,31 @@ export async function runScenario(context: RunContext): Promise<ScenarioReport>
     // Step 7.6: Evaluate result against oracle (for both modes)
     let evaluationResult: any;
     let evaluationError: { message: string; stack?: string } | undefined;
+    // Early exit: stragglers may complete after the report is saved
+    let savedReport: ScenarioReport | undefined;
+    let lateEvaluation: any;
     try {
       showProgress('[7.6/8] Evaluating result');
       logger.info('[7.6/8] Evaluating result against oracle...');
-      evaluationResult = await evaluateResult(scenario, context.mode, workspaceDir, logger);
+      evaluationResult = await withSpan('evaluation', () => evaluateResult(scenario, context.mode, workspaceDir, logger, {
+        cacheMode: context.evalCacheMode,
+        batchSize: context.evalBatchSize,
+        earlyExit: context.evalEarlyExit,
+        onComplete: (fullEvaluation) => {
+          lateEvaluation = fullEvaluation;
+          if (savedReport) {
+            savedReport.evaluation = fullEvaluation as any;
+            if (context.mode === 'oneshot') {
+              savedReport.passed = fullEvaluation.aggregated.pass ? 1 : 0;
+              savedReport.pass_rate = savedReport.passed;
+            }
+            saveScenarioReport(savedReport);
+            saveFinalResultMarkdown(savedReport, workspaceDir);
+            reportUpdateListener?.(savedReport);
+            logger.info('Report and final result updated with background evaluation results');
+          }
+        },
+      }));
       logger.info(`Evaluation score: ${evaluationResult.aggregated.final_score}/5 (pass: ${evaluationResult.aggregated.pass})`);
       logger.info('[7.6/8] Evaluation complete ✓');
     } catch (error: any) {
@@ -254,31 +350,41 @@ export async function runScenario(context: RunContext): Promise<ScenarioReport>
         turns: agentStats.turns,
         tool_calls: agentStats.tool_calls,
         elapsed_ms: agentStats.elapsed_ms,
+        input_tokens: agentStats.input_tokens,
+        output_tokens: agentStats.output_tokens,
+        cache_creation_input_tokens: agentStats.cache_creation_input_tokens,
+        cache_read_input_tokens: agentStats.cache_read_input_tokens,
       } : undefined,
       oneshot_stats: oneshotStats ? {
         tool_calls: oneshotStats.tool_calls,
         elapsed_ms: oneshotStats.elapsed_ms,
         mcp_tool_used: oneshotStats.mcp_tool_used,
         mcp_server_used: oneshotStats.mcp_server_used,
+        cache_hit: oneshotStats.cache_hit,
       } : undefined,
-      evaluation: evaluationResult,
+      evaluation: lateEvaluation || evaluationResult,
       evaluation_error: evaluationError,
       mcp_stats: agentStats?.mcp_stats,
       build_time_ms: buildTime,
+      build_breakdown: buildBreakdown,
       total_elapsed_ms: Date.now() - startTime,
     };
 
-    const reportPath = saveScenarioReport(report);
+    const reportPath = await withSpan('report', async () => {
+      const saved = saveScenarioReport(report);
+      savedReport = report;
 
-    // Update API test results markdown with final report (agent mode only)
-    if (context.mode === 'agent') {
-      const apiResultPath = saveTestResultMarkdown(report, workspaceDir);
-      logger.info(`API test results saved: ${apiResultPath}`);
-    }
+      // Update API test results markdown with final report (agent mode only)
+      if (context.mode === 'agent') {
+        const apiResultPath = saveTestResultMarkdown(report, workspaceDir);
+        logger.info(`API test results saved: ${apiResultPath}`);
+      }
 
-    // Save comprehensive final result in workspace
-    const finalResultPath = saveFinalResultMarkdown(report, workspaceDir);
-    logger.info(`✅ Final result saved: ${finalResultPath}`);
+      // Save comprehensive final result in workspace
+      const finalResultPath = saveFinalResultMarkdown(report, workspaceDir);
+      logger.info(`✅ Final result saved: ${finalResultPath}`);
+      return saved;
+    });
 
     logger.marker(LOG_MARKERS.REPORT_SUCCESS);
     logger.info(`Report saved: ${reportPath}`);
@@ -315,21 +421,27 @@ export async function runScenario(context: RunContext): Promise<ScenarioReport>
     // Cleanup
     logger.marker(LOG_MARKERS.CLEANUP_START);
 
-    if (serviceHandle) {
-      await stopService(serviceHandle, logger);
-    }
+    await withSpan('cleanup', async () => {
+      if (serviceHandle) {
+        await stopService(serviceHandle, logger);
+      }
 
-    // Cleanup Docker image only in agent mode (oneshot mode doesn't use Docker)
-    if (context.mode === 'agent') {
-      await cleanupDocker(imageName, logger);
-    }
+      if (warmContainer) {
+        await warmPool.release(warmContainer, logger, warmDeployFailed);
+      }
 
-    // Workspace cleanup depends on keepWorkspace option
-    if (!keepWorkspace) {
-      cleanWorkspace(workspaceDir, logger);
-    } else {
-      logger.info(`Workspace preserved: ${workspaceDir}`);
-    }
+      // Cleanup Docker image only in agent mode (oneshot mode doesn't use Docker)
+      if (context.mode === 'agent' && !warmPool.isEnabled()) {
+        await cleanupDocker(imageName, logger);
+      }
+
+      // Workspace cleanup depends on keepWorkspace option
+      if (!keepWorkspace) {
+        cleanWorkspace(workspaceDir, logger);
+      } else {
+        logger.info(`Workspace preserved: ${workspaceDir}`);
+      }
+    });
 
     logger.marker(LOG_MARKERS.CLEANUP_SUCCESS);
   }
@@ -1,5 +1,10 @@
 /**
  * Scenario YAML loader - supports new package-based structure
+ *
+ * Package files are parsed once per process into a catalog: specs keyed by
+ * package id and file alias, a scenario-id index, and oracle paths checked
+ * when the file is parsed. Each access stats the scenarios directory and its
+ * YAML files and re-parses only files whose mtime changed.
  */
 
 import fs from 'fs-extra';
@@ -23,47 +28,180 @@ export function parseScenarioId(input: string): ScenarioIdentifier | null {
   return null;
 }
 
+export interface CatalogScenario {
+  packageId: string;
+  fullId: string;
+  item: ScenarioItem;
+  oraclePath?: string;
+  oracleExists: boolean;
+}
+
+interface CatalogFile {
+  mtimeMs: number;
+  spec?: PackageSpec;
+  error?: string;
+}
+
+export interface ScenarioCatalog {
+  packages: Map<string, PackageSpec>;       // package-id -> spec
+  aliases: Map<string, string>;             // file base name (with and without NN- prefix) -> package-id
+  scenarios: Map<string, CatalogScenario>;  // package-id:scenario-id -> scenario
+  errors: string[];                         // Unparseable files, duplicates and missing oracles
+}
+
+let catalog: ScenarioCatalog | null = null;
+let catalogDirMtimeMs = -1;
+const catalogFiles: Map<string, CatalogFile> = new Map();
+
 /**
- * Load a package specification from YAML file
+ * Parse one package file; invalid files are recorded instead of thrown
  */
-export function loadPackage(packageId: string): PackageSpec {
-  // Try different file name patterns
-  const patterns = [
-    `${packageId}.yaml`,
-    `${packageId.replace(':', '-')}.yaml`,
-  ];
-
-  // Also try numbered patterns (01-package-id.yaml)
-  const files = fs.readdirSync(PATHS.SCENARIOS_DIR).filter(f => f.endsWith('.yaml'));
-  const matchingFile = files.find(f => {
-    const baseName = path.basename(f, '.yaml');
+function parsePackageFile(filePath: string, mtimeMs: number): CatalogFile {
+  try {
+    const spec = yaml.load(fs.readFileSync(filePath, 'utf-8')) as PackageSpec;
+    // Validate it's a package spec (not legacy)
+    if (!spec || !spec['package-id'] || !Array.isArray(spec.scenarios)) {
+      return { mtimeMs, error: `${filePath}: missing required fields` };
+    }
+    return { mtimeMs, spec };
+  } catch (error: any) {
+    return { mtimeMs, error: `${filePath}: ${error.message}` };
+  }
+}
+
+/**
+ * Get the scenario catalog, refreshing files whose mtime changed
+ */
+export function getScenarioCatalog(): ScenarioCatalog {
+  const scenariosDir = PATHS.SCENARIOS_DIR;
+  if (!fs.existsSync(scenariosDir)) {
+    catalogFiles.clear();
+    catalogDirMtimeMs = -1;
+    catalog = { packages: new Map(), aliases: new Map(), scenarios: new Map(), errors: [] };
+    return catalog;
+  }
+
+  let changed = catalog === null;
+  const dirMtimeMs = fs.statSync(scenariosDir).mtimeMs;
+  if (dirMtimeMs !== catalogDirMtimeMs) {
+    // Files were added or removed
+    catalogDirMtimeMs = dirMtimeMs;
+    const names = new Set(fs.readdirSync(scenariosDir).filter(f => f.endsWith('.yaml')));
+    for (const name of catalogFiles.keys()) {
+      if (!names.has(name)) catalogFiles.delete(name);
+    }
+    for (const name of names) {
+      if (!catalogFiles.has(name)) catalogFiles.set(name, { mtimeMs: -1 });
+    }
+    changed = true;
+  }
+
+  for (const [name, entry] of catalogFiles) {
+    const filePath = path.join(scenariosDir, name);
+    let mtimeMs: number;
+    try {
+      mtimeMs = fs.statSync(filePath).mtimeMs;
+    } catch {
+      catalogFiles.delete(name);
+      changed = true;
+      continue;
+    }
+    if (mtimeMs !== entry.mtimeMs) {
+      catalogFiles.set(name, parsePackageFile(filePath, mtimeMs));
+      changed = true;
+    }
+  }
+
+  if (changed) {
+    catalog = buildCatalog();
+  }
+  return catalog!;
+}
+
+function buildCatalog(): ScenarioCatalog {
+  const built: ScenarioCatalog = { packages: new Map(), aliases: new Map(), scenarios: new Map(), errors: [] };
+
+  for (const name of Array.from(catalogFiles.keys()).sort()) {
+    const { spec, error } = catalogFiles.get(name)!;
+    if (!spec) {
+      built.errors.push(error!);
+      continue;
+    }
+
+    const packageId = spec['package-id'];
+    if (built.packages.has(packageId)) {
+      built.errors.push(`${name}: duplicate package-id ${packageId}`);
+      continue;
+    }
+    built.packages.set(packageId, spec);
+
     // Match either "01-package-id" or "package-id"
-    return baseName === packageId || baseName.endsWith(`-${packageId}`) || baseName === packageId.replace(/^\d+-/, '');
-  });
-
-  let packagePath: string;
-  if (matchingFile) {
-    packagePath = path.join(PATHS.SCENARIOS_DIR, matchingFile);
-  } else {
-    // Fallback to direct match
-    packagePath = path.join(PATHS.SCENARIOS_DIR, patterns[0]);
+    const baseName = path.basename(name, '.yaml');
+    built.aliases.set(baseName, packageId);
+    built.aliases.set(baseName.replace(/^\d+-/, ''), packageId);
+
+    for (const item of spec.scenarios) {
+      const fullId = `${packageId}:${item.id}`;
+      if (built.scenarios.has(fullId)) {
+        built.errors.push(`${name}: duplicate scenario id ${fullId}`);
+        continue;
+      }
+      // Oracle paths in the YAML already include the 'scenarios/' prefix
+      const oracleExists = !!item.oracle && fs.existsSync(item.oracle);
+      if (item.oracle && !oracleExists) {
+        built.errors.push(`${fullId}: oracle not found: ${item.oracle}`);
+      }
+      built.scenarios.set(fullId, { packageId, fullId, item, oraclePath: item.oracle || undefined, oracleExists });
+    }
   }
 
-  if (!fs.existsSync(packagePath)) {
-    throw new Error(`Package not found: ${packageId} (tried ${packagePath})`);
+  return built;
+}
+
+/**
+ * Check every package and scenario in one pass; returns the problems found
+ */
+export function validateCatalog(): string[] {
+  const { packages, scenarios, errors } = getScenarioCatalog();
+  const problems = [...errors];
+  for (const scenario of scenarios.values()) {
+    if (!scenario.item.query) {
+      problems.push(`${scenario.fullId}: missing query`);
+    }
+  }
+  if (packages.size === 0) {
+    problems.push(`No package specs found in ${PATHS.SCENARIOS_DIR}`);
   }
+  return problems;
+}
 
-  const content = fs.readFileSync(packagePath, 'utf-8');
-  const spec = yaml.load(content) as PackageSpec;
+/**
+ * Load a package specification from YAML file
+ */
+export function loadPackage(packageId: string): PackageSpec {
+  const { packages, aliases } = getScenarioCatalog();
+  const spec = packages.get(packageId) ?? packages.get(aliases.get(packageId) ?? '');
 
-  // Validate required fields
-  if (!spec['package-id'] || !spec.scenarios || !Array.isArray(spec.scenarios)) {
-    throw new Error(`Invalid package spec: ${packageId} - missing required fields`);
+  if (!spec) {
+    throw new Error(`Package not found: ${packageId} (in ${PATHS.SCENARIOS_DIR})`);
   }
 
   return spec;
 }
 
+/**
+ * Catalog entry for "package-id:scenario-id" (the package may be given by file alias)
+ */
+export function findCatalogScenario(scenarioInput: string): CatalogScenario | undefined {
+  const parsed = parseScenarioId(scenarioInput);
+  if (!parsed) {
+    return undefined;
+  }
+  const { packages, aliases, scenarios } = getScenarioCatalog();
+  const packageId = packages.has(parsed.packageId) ? parsed.packageId : aliases.get(parsed.packageId);
+  return packageId ? scenarios.get(`${packageId}:${parsed.scenarioId}`) : undefined;
+}
+
 /**
  * Load a specific scenario from a package
  */
@@ -75,11 +213,12 @@ export function loadScenario(scenarioInput: string): ScenarioSpec {
   }
 
   const pkg = loadPackage(parsed.packageId);
-  const scenarioItem = pkg.scenarios.find(s => s.id === parsed.scenarioId);
+  const entry = getScenarioCatalog().scenarios.get(`${pkg['package-id']}:${parsed.scenarioId}`);
 
-  if (!scenarioItem) {
+  if (!entry) {
     throw new Error(`Scenario not found: ${parsed.scenarioId} in package ${parsed.packageId}`);
   }
+  const scenarioItem = entry.item;
 
   // Convert PackageSpec + ScenarioItem to ScenarioSpec (legacy format for runner)
   const scenario: ScenarioSpec = {
@@ -111,65 +250,32 @@ export function loadScenario(scenarioInput: string): ScenarioSpec {
  * List all packages
  */
 export function listPackages(): PackageSpec[] {
-  const scenariosDir = PATHS.SCENARIOS_DIR;
-
-  if (!fs.existsSync(scenariosDir)) {
-    return [];
-  }
-
-  const files = fs.readdirSync(scenariosDir).filter(f => f.endsWith('.yaml') && f !== 'INDEX.md');
-  const packages: PackageSpec[] = [];
-
-  for (const file of files) {
-    try {
-      const content = fs.readFileSync(path.join(scenariosDir, file), 'utf-8');
-      const spec = yaml.load(content) as PackageSpec;
-
-      // Validate it's a package spec (not legacy)
-      if (spec['package-id'] && Array.isArray(spec.scenarios)) {
-        packages.push(spec);
-      }
-    } catch (error) {
-      // Skip invalid files
-    }
-  }
-
-  return packages;
+  return Array.from(getScenarioCatalog().packages.values());
 }
 
 /**
  * List all scenarios across all packages
  */
 export function listScenarios(): Array<{ packageId: string; scenario: ScenarioItem; fullId: string }> {
-  const packages = listPackages();
-  const scenarios: Array<{ packageId: string; scenario: ScenarioItem; fullId: string }> = [];
-
-  for (const pkg of packages) {
-    for (const scenario of pkg.scenarios) {
-      scenarios.push({
-        packageId: pkg['package-id'],
-        scenario,
-        fullId: `${pkg['package-id']}:${scenario.id}`,
-      });
-    }
-  }
-
-  return scenarios;
+  return Array.from(getScenarioCatalog().scenarios.values()).map(s => ({
+    packageId: s.packageId,
+    scenario: s.item,
+    fullId: s.fullId,
+  }));
 }
 
 /**
  * Get all package IDs
  */
 export function getPackageIds(): string[] {
-  const packages = listPackages();
-  return packages.map(p => p['package-id']);
+  return Array.from(getScenarioCatalog().packages.keys());
 }
 
 /**
  * Get all scenario IDs in format "package-id:scenario-id"
  */
 export function getScenarioIds(): string[] {
-  return listScenarios().map(s => s.fullId);
+  return Array.from(getScenarioCatalog().scenarios.keys());
 }
 
 /**
@@ -0,0 +1,248 @@
+/**
+ * Cost-aware scheduling for parallel runs
+ * Tasks are ordered longest-expected-first (LPT) from an exponentially weighted
+ * average of past durations per (mode, config, scenario), kept in
+ * .cache/durations.json. Stages that hold an agent/LLM session, a Docker
+ * container or an MCP tool call take a slot in that resource pool, and each
+ * pool has its own concurrency limit (--pool-limits).
+ */
+
+import fs from 'fs-extra';
+import os from 'os';
+import path from 'path';
+import { RunContext, ExecutionMode } from './types.js';
+import { DEFAULTS, PATHS } from './constants.js';
+import { Semaphore } from './semaphore.js';
+
+/**
+ * lpt  - longest expected duration first (default)
+ * fifo - scenario order as given
+ */
+export type ScheduleOrder = 'lpt' | 'fifo';
+
+export const SCHEDULE_ORDERS: ScheduleOrder[] = ['lpt', 'fifo'];
+
+export type ResourcePool = 'llm' | 'docker' | 'mcp';
+
+export const RESOURCE_POOLS: ResourcePool[] = ['llm', 'docker', 'mcp'];
+
+export const DURATIONS_FILE = 'durations.json';
+
+export interface DurationEntry {
+  ewma_ms: number;
+  runs: number;
+  updated_at: string;
+}
+
+export interface DurationEstimate {
+  ms: number;
+  source: 'history' | 'scenario' | 'mode' | 'default';  // What the estimate was derived from
+}
+
+export interface PoolStats {
+  pool: ResourcePool;
+  limit: number;
+  acquired: number;
+  waited: number;       // Acquisitions that had to queue
+  wait_ms: number;
+}
+
+/**
+ * Parse a --schedule flag value
+ */
+export function parseScheduleOrder(value: string | undefined): ScheduleOrder {
+  const order = (value || DEFAULTS.SCHEDULE) as ScheduleOrder;
+  if (!SCHEDULE_ORDERS.includes(order)) {
+    throw new Error(`Invalid --schedule "${value}". Must be one of: ${SCHEDULE_ORDERS.join(', ')}`);
+  }
+  return order;
+}
+
+/**
+ * Parse a --pool-limits flag value, e.g. "llm=6,docker=3,mcp=12"
+ */
+export function parsePoolLimits(value: string): Partial<Record<ResourcePool, number>> {
+  const limits: Partial<Record<ResourcePool, number>> = {};
+  for (const part of value.split(',').map(p => p.trim()).filter(Boolean)) {
+    const match = part.match(/^(\w+)=(\d+)$/);
+    const pool = match?.[1] as ResourcePool;
+    const limit = match ? parseInt(match[2], 10) : NaN;
+    if (!RESOURCE_POOLS.includes(pool) || !(limit > 0)) {
+      throw new Error(`Invalid --pool-limits "${value}". Expected POOL=N pairs with POOL one of: ${RESOURCE_POOLS.join(', ')}`);
+    }
+    limits[pool] = limit;
+  }
+  return limits;
+}
+
+// Pools are unlimited (bounded only by --max-workers) until configured
+const pools: Map<ResourcePool, { slots: Semaphore; stats: PoolStats }> = new Map(
+  RESOURCE_POOLS.map(pool => [pool, {
+    slots: new Semaphore(Infinity),
+    stats: { pool, limit: Infinity, acquired: 0, waited: 0, wait_ms: 0 },
+  }])
+);
+
+/**
+ * Set per-pool concurrency limits (shared by all workers in this process)
+ */
+export function setPoolLimits(limits: Partial<Record<ResourcePool, number>>): void {
+  for (const [pool, limit] of Object.entries(limits) as Array<[ResourcePool, number]>) {
+    const entry = pools.get(pool)!;
+    entry.slots.setLimit(limit);
+    entry.stats.limit = Math.max(1, limit);
+  }
+}
+
+/**
+ * Run a stage while holding a slot in a resource pool
+ */
+export function withResource<T>(pool: ResourcePool, task: () => Promise<T>): Promise<T> {
+  const { slots, stats } = pools.get(pool)!;
+  const queuedAt = Date.now();
+  const mustWait = slots.free === 0;
+  return slots.run(() => {
+    stats.acquired++;
+    if (mustWait) {
+      stats.waited++;
+      stats.wait_ms += Date.now() - queuedAt;
+    }
+    return task();
+  });
+}
+
+/**
+ * Free slots in a pool right now
+ */
+export function poolHasCapacity(pool: ResourcePool): boolean {
+  return pools.get(pool)!.slots.free > 0;
+}
+
+export function getPoolStats(): PoolStats[] {
+  return RESOURCE_POOLS.map(pool => ({ ...pools.get(pool)!.stats }));
+}
+
+/**
+ * The pool a scenario's first long stage runs in
+ */
+export function entryPool(context: RunContext): ResourcePool {
+  return context.mode === 'oneshot' ? 'mcp' : 'llm';
+}
+
+function durationKey(mode: ExecutionMode, config: string, scenario: string): string {
+  return `${mode}/${config}/${scenario}`;
+}
+
+/**
+ * Per-(mode, config, scenario) duration history shared across runs
+ */
+export class DurationHistory {
+  private entries: Record<string, DurationEntry>;
+  private dirty: Set<string> = new Set();
+
+  private constructor(private readonly file: string, entries: Record<string, DurationEntry>) {
+    this.entries = entries;
+  }
+
+  static load(file: string = path.join(PATHS.CACHE_DIR, DURATIONS_FILE)): DurationHistory {
+    return new DurationHistory(file, readEntries(file));
+  }
+
+  get size(): number {
+    return Object.keys(this.entries).length;
+  }
+
+  /**
+   * Expected duration; falls back to the same scenario under other configs,
+   * then to the mode average, then to a fixed default
+   */
+  estimate(context: RunContext): DurationEstimate {
+    const { mode, scenario } = context;
+    const exact = this.entries[durationKey(mode, context.config.config_name, scenario.id)];
+    if (exact) {
+      return { ms: exact.ewma_ms, source: 'history' };
+    }
+
+    const sameScenario: number[] = [];
+    const sameMode: number[] = [];
+    for (const [key, entry] of Object.entries(this.entries)) {
+      const [entryMode, , entryScenario] = key.split('/');
+      if (entryMode !== mode) continue;
+      sameMode.push(entry.ewma_ms);
+      if (entryScenario === scenario.id) sameScenario.push(entry.ewma_ms);
+    }
+    if (sameScenario.length > 0) {
+      return { ms: mean(sameScenario), source: 'scenario' };
+    }
+    if (sameMode.length > 0) {
+      return { ms: mean(sameMode), source: 'mode' };
+    }
+    return {
+      ms: mode === 'oneshot' ? DEFAULTS.ONESHOT_DURATION_ESTIMATE_MS : DEFAULTS.AGENT_DURATION_ESTIMATE_MS,
+      source: 'default',
+    };
+  }
+
+  /**
+   * Fold a finished run's wall time into the average
+   */
+  record(context: RunContext, elapsedMs: number): void {
+    const key = durationKey(context.mode, context.config.config_name, context.scenario.id);
+    const previous = this.entries[key];
+    const alpha = DEFAULTS.DURATION_EWMA_ALPHA;
+    this.entries[key] = {
+      ewma_ms: previous ? Math.round(alpha * elapsedMs + (1 - alpha) * previous.ewma_ms) : elapsedMs,
+      runs: (previous?.runs ?? 0) + 1,
+      updated_at: new Date().toISOString(),
+    };
+    this.dirty.add(key);
+  }
+
+  /**
+   * Write entries recorded here over the file's current contents, so
+   * concurrent runs don't drop each other's updates
+   */
+  async save(): Promise<void> {
+    if (this.dirty.size === 0) {
+      return;
+    }
+    const merged = readEntries(this.file);
+    for (const key of this.dirty) {
+      merged[key] = this.entries[key];
+    }
+    const tmpFile = `${this.file}.${os.hostname()}.${process.pid}.tmp`;
+    await fs.ensureDir(path.dirname(this.file));
+    await fs.writeJson(tmpFile, merged, { spaces: 2 });
+    await fs.rename(tmpFile, this.file);
+    this.entries = merged;
+    this.dirty.clear();
+  }
+}
+
+function readEntries(file: string): Record<string, DurationEntry> {
+  try {
+    return fs.readJsonSync(file) as Record<string, DurationEntry>;
+  } catch {
+    return {};
+  }
+}
+
+function mean(values: number[]): number {
+  return Math.round(values.reduce((sum, v) => sum + v, 0) / values.length);
+}
+
+/**
+ * Makespan of running tasks in the given order on `workers` workers
+ * (each task starts on whichever worker frees up first)
+ */
+export function simulateMakespan(durations: number[], workers: number): number {
+  const finish = new Array(Math.max(1, Math.min(workers, durations.length))).fill(0);
+  for (const duration of durations) {
+    let next = 0;
+    for (let i = 1; i < finish.length; i++) {
+      if (finish[i] < finish[next]) next = i;
+    }
+    finish[next] += duration;
+  }
+  return Math.max(0, ...finish);
+}
@@ -0,0 +1,58 @@
+/**
+ * Counting semaphore for limiting concurrent async work (FIFO)
+ */
+
+export class Semaphore {
+  private active = 0;
+  private waiters: Array<() => void> = [];
+
+  constructor(private limit: number) {}
+
+  /**
+   * Change the limit; extra waiters are admitted immediately if it grew
+   */
+  setLimit(limit: number): void {
+    this.limit = Math.max(1, limit);
+    this.drain();
+  }
+
+  /**
+   * Run a task once a slot is free
+   */
+  async run<T>(task: () => Promise<T>): Promise<T> {
+    await this.acquire();
+    try {
+      return await task();
+    } finally {
+      this.release();
+    }
+  }
+
+  get pending(): number {
+    return this.waiters.length;
+  }
+
+  get free(): number {
+    return Math.max(0, this.limit - this.active);
+  }
+
+  private acquire(): Promise<void> {
+    if (this.active < this.limit) {
+      this.active++;
+      return Promise.resolve();
+    }
+    return new Promise(resolve => this.waiters.push(resolve));
+  }
+
+  private release(): void {
+    this.active--;
+    this.drain();
+  }
+
+  private drain(): void {
+    while (this.active < this.limit && this.waiters.length > 0) {
+      this.active++;
+      this.waiters.shift()!();
+    }
+  }
+}
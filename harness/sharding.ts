@@ -0,0 +1,137 @@
+/**
+ * Sharded runs
+ * The (config, scenario) task list is split round-robin into N shards in the
+ * order the CLI builds it, so every host computes the same split from the same
+ * flags. Each shard writes into the shared run directory; run-level files it
+ * would otherwise overwrite get a shard suffix. A coordinator spawns the shards
+ * as local worker processes, and --merge builds the summary from the reports
+ * once all shards are done. Judge API limits are per process, so the
+ * coordinator gives each shard its share of --eval-concurrency and --eval-rpm.
+ */
+
+import { spawn } from 'child_process';
+import readline from 'readline';
+import path from 'path';
+import chalk from 'chalk';
+
+export interface Shard {
+  index: number;  // 1-based
+  count: number;
+}
+
+export interface ShardExit {
+  shard: Shard;
+  code: number;
+}
+
+export interface ShardEvalLimits {
+  concurrency: number;
+  rpm: number;
+}
+
+/**
+ * Parse a --shard flag value ("i/N", 1 <= i <= N)
+ */
+export function parseShard(value: string): Shard {
+  const match = value.trim().match(/^(\d+)\/(\d+)$/);
+  const index = match ? parseInt(match[1], 10) : NaN;
+  const count = match ? parseInt(match[2], 10) : NaN;
+  if (!(count >= 1 && index >= 1 && index <= count)) {
+    throw new Error(`Invalid --shard "${value}". Expected i/N with 1 <= i <= N`);
+  }
+  return { index, count };
+}
+
+/**
+ * Whether the task at this position of the task list belongs to the shard
+ */
+export function inShard(position: number, shard?: Shard): boolean {
+  return !shard || position % shard.count === shard.index - 1;
+}
+
+export function shardTag(shard: Shard): string {
+  return `shard-${shard.index}-of-${shard.count}`;
+}
+
+/**
+ * Insert the shard tag before a file's extension (stage_timings.json -> stage_timings.shard-1-of-4.json)
+ */
+export function shardFileName(file: string, shard?: Shard): string {
+  if (!shard) {
+    return file;
+  }
+  const ext = path.extname(file);
+  return `${file.slice(0, file.length - ext.length)}.${shardTag(shard)}${ext}`;
+}
+
+/**
+ * A shard's part of a limit all shards share; parts add up to the total
+ * unless there are more shards than the total (every shard gets at least 1)
+ */
+export function shareOfLimit(total: number, shard: Shard): number {
+  const base = Math.floor(total / shard.count);
+  return Math.max(1, base + (shard.index <= total % shard.count ? 1 : 0));
+}
+
+/**
+ * Drop a flag (and its value) from an argument list
+ */
+function stripOption(args: string[], flag: string, takesValue: boolean): string[] {
+  const out: string[] = [];
+  for (let i = 0; i < args.length; i++) {
+    if (args[i] === flag) {
+      if (takesValue) i++;
+      continue;
+    }
+    if (args[i].startsWith(`${flag}=`)) {
+      continue;
+    }
+    out.push(args[i]);
+  }
+  return out;
+}
+
+/**
+ * Re-run this CLI as `count` shard processes with the same flags and run id
+ * (as --resume when resuming), splitting the judge limits between them.
+ * Output lines are prefixed with the shard; resolves once every shard exits
+ */
+export async function runShardWorkers(
+  count: number,
+  runId: string,
+  resume: boolean,
+  evalLimits: ShardEvalLimits
+): Promise<ShardExit[]> {
+  let args = process.argv.slice(2);
+  for (const flag of ['--coordinator', '--run-id', '--resume', '--shard', '--eval-concurrency', '--eval-rpm']) {
+    args = stripOption(args, flag, true);
+  }
+  args = stripOption(args, '--merge', false);
+  const runArgs = resume ? ['--resume', runId] : ['--run-id', runId];
+
+  const workers = Array.from({ length: count }, (_, i) => {
+    const shard: Shard = { index: i + 1, count };
+    const label = chalk.gray(`[${shardTag(shard)}]`);
+    const limitArgs = [
+      '--eval-concurrency', String(shareOfLimit(evalLimits.concurrency, shard)),
+      '--eval-rpm', String(shareOfLimit(evalLimits.rpm, shard)),
+    ];
+    const child = spawn(
+      process.execPath,
+      [...process.execArgv, process.argv[1], ...args, ...runArgs, ...limitArgs, '--shard', `${shard.index}/${count}`],
+      { stdio: ['ignore', 'pipe', 'pipe'], env: process.env }
+    );
+    readline.createInterface({ input: child.stdout! }).on('line', line => console.log(`${label} ${line}`));
+    readline.createInterface({ input: child.stderr! }).on('line', line => console.error(`${label} ${line}`));
+
+    return new Promise<ShardExit>(resolve => {
+      child.on('error', error => {
+        console.error(chalk.red(`${shardTag(shard)} failed to start: ${error.message}`));
+        resolve({ shard, code: -1 });
+      });
+      child.on('close', code => resolve({ shard, code: code ?? -1 }));
+    });
+  });
+
+  return Promise.all(workers);
+}
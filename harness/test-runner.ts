@@ -1,12 +1,25 @@
 /**
  * Test runner for scenario validation
+ * Test cases run concurrently (up to --test-concurrency) over one keep-alive
+ * connection pool per scenario; results are logged in input order.
  */
 
 import axios from 'axios';
+import http from 'http';
 import { ScenarioSpec, TestResult } from './types.js';
 import { validateOutput } from './validator.js';
 import { Logger } from './logger.js';
 import { DEFAULTS } from './constants.js';
+import { Semaphore } from './semaphore.js';
+
+let testConcurrency: number = DEFAULTS.TEST_CONCURRENCY;
+
+/**
+ * Limit concurrent test cases per scenario
+ */
+export function setTestConcurrency(limit: number): void {
+  testConcurrency = Math.max(1, limit);
+}
 
 /**
  * Run all test cases for a scenario
@@ -18,7 +31,8 @@ export async function runTests(
 ): Promise<TestResult[]> {
   logger.marker('>>>>> Running Tests');
 
-  const results: TestResult[] = [];
+  const total = scenario.test_inputs.length;
+  const results: TestResult[] = new Array(total);
   const endpoint = `http://localhost:${port}/run`;
 
   // Get timeout from scenario constraints or use default
@@ -26,40 +40,58 @@ export async function runTests(
     ? scenario.constraints.timeout_sec * 1000
     : DEFAULTS.TEST_TIMEOUT_MS;
 
-  logger.info(`Test timeout: ${timeoutMs / 1000}s`);
-
-  for (let i = 0; i < scenario.test_inputs.length; i++) {
-    const input = scenario.test_inputs[i];
-    const testNum = i + 1;
-
-    logger.marker(`>>>>> Test Case ${testNum}/${scenario.test_inputs.length}`);
-    logger.info(`Input: ${JSON.stringify(input)}`);
-
-    const result = await runTestCase(
-      endpoint,
-      input,
-      scenario.api.output_schema,
-      logger,
-      timeoutMs
-    );
-
-    results.push(result);
-
-    if (result.validation.pass) {
-      logger.marker(`>>>>> Test PASS (${testNum}/${scenario.test_inputs.length})`);
-    } else {
-      logger.marker(`>>>>> Test FAIL (${testNum}/${scenario.test_inputs.length})`);
-      logger.error(`Validation errors: ${JSON.stringify(result.validation.errors)}`);
+  const concurrency = Math.min(testConcurrency, Math.max(1, total));
+  logger.info(`Test timeout: ${timeoutMs / 1000}s, concurrency: ${concurrency}`);
+
+  // Per-scenario pool: sockets are not reused across services on the same port
+  const agent = new http.Agent({ keepAlive: true, maxSockets: concurrency });
+  const slots = new Semaphore(concurrency);
+  let nextToLog = 0;
+
+  // Log finished results in input order as soon as all earlier ones are done
+  const logInOrder = () => {
+    while (nextToLog < total && results[nextToLog]) {
+      const result = results[nextToLog];
+      const testNum = ++nextToLog;
+
+      if (result.validation.pass) {
+        logger.marker(`>>>>> Test PASS (${testNum}/${total})`);
+      } else {
+        logger.marker(`>>>>> Test FAIL (${testNum}/${total})`);
+        logger.error(`Validation errors: ${JSON.stringify(result.validation.errors)}`);
+      }
+
+      // Write test result to JSONL
+      logger.jsonl({
+        test_num: testNum,
+        input: result.input,
+        output: result.output,
+        validation: result.validation,
+        elapsed_ms: result.elapsed_ms,
+      });
     }
+  };
 
-    // Write test result to JSONL
-    logger.jsonl({
-      test_num: testNum,
-      input: result.input,
-      output: result.output,
-      validation: result.validation,
-      elapsed_ms: result.elapsed_ms,
-    });
+  try {
+    await Promise.all(scenario.test_inputs.map((input, i) => slots.run(async () => {
+      const testNum = i + 1;
+
+      logger.marker(`>>>>> Test Case ${testNum}/${total}`);
+      logger.info(`[${testNum}/${total}] Input: ${JSON.stringify(input)}`);
+
+      results[i] = await runTestCase(
+        endpoint,
+        input,
+        scenario.api.output_schema,
+        logger,
+        timeoutMs,
+        agent,
+        `[${testNum}/${total}]`
+      );
+      logInOrder();
+    })));
+  } finally {
+    agent.destroy();
   }
 
   logger.marker('>>>>> All Tests Complete');
@@ -77,13 +109,16 @@ async function runTestCase(
   input: any,
   outputSchema: object,
   logger: Logger,
-  timeoutMs: number
+  timeoutMs: number,
+  agent: http.Agent,
+  tag: string
 ): Promise<TestResult> {
   const startTime = Date.now();
 
   try {
     const response = await axios.post(endpoint, input, {
       timeout: timeoutMs,
+      httpAgent: agent,
       headers: {
         'Content-Type': 'application/json',
       },
@@ -92,8 +127,8 @@ async function runTestCase(
     const output = response.data;
     const elapsed = Date.now() - startTime;
 
-    logger.info(`Output: ${JSON.stringify(output)}`);
-    logger.info(`Elapsed: ${elapsed}ms`);
+    logger.info(`${tag} Output: ${JSON.stringify(output)}`);
+    logger.info(`${tag} Elapsed: ${elapsed}ms`);
 
     // Validate output against schema
     logger.marker('>>>>> Validating Output');
@@ -103,7 +138,7 @@ async function runTestCase(
       logger.marker('>>>>> Validation PASS');
     } else {
       logger.marker('>>>>> Validation FAIL');
-      logger.error(`Validation errors: ${JSON.stringify(validation.errors)}`);
+      logger.error(`${tag} Validation errors: ${JSON.stringify(validation.errors)}`);
     }
 
     return {
@@ -115,12 +150,12 @@ async function runTestCase(
   } catch (error: any) {
     const elapsed = Date.now() - startTime;
 
-    logger.error(`Test case failed: ${error.message}`);
+    logger.error(`${tag} Test case failed: ${error.message}`);
 
     let errorDetails;
     if (error.response) {
-      logger.error(`Response status: ${error.response.status}`);
-      logger.error(`Response data: ${JSON.stringify(error.response.data)}`);
+      logger.error(`${tag} Response status: ${error.response.status}`);
+      logger.error(`${tag} Response data: ${JSON.stringify(error.response.data)}`);
       errorDetails = {
         status: error.response.status,
         data: error.response.data,
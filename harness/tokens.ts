@@ -0,0 +1,95 @@
+/**
+ * Shared token counting
+ * One cl100k_base encoder per process (creating and freeing an encoder per
+ * call dominated MCP stats), plus a bounded memo keyed by content hash so the
+ * same tool result or oracle is only tokenized once.
+ */
+
+import crypto from 'crypto';
+import { get_encoding, Tiktoken } from 'tiktoken';
+
+export const TOKEN_ENCODING = 'cl100k_base';
+
+// Short strings are cheaper to encode than to hash
+const MEMO_MIN_CHARS = 256;
+const MEMO_MAX_ENTRIES = 10000;
+
+let encoder: Tiktoken | null = null;
+const memo: Map<string, number> = new Map();
+
+/**
+ * Process-wide encoder (created on first use)
+ */
+export function getEncoder(): Tiktoken {
+  if (!encoder) {
+    encoder = get_encoding(TOKEN_ENCODING);
+  }
+  return encoder;
+}
+
+/**
+ * Exact token count of a string
+ * Special-token text such as <|endoftext|> inside tool output is counted as
+ * ordinary text instead of throwing.
+ */
+export function countTokens(text: string): number {
+  if (!text) {
+    return 0;
+  }
+  if (text.length < MEMO_MIN_CHARS) {
+    return getEncoder().encode_ordinary(text).length;
+  }
+
+  const key = crypto.createHash('sha1').update(text).digest('hex');
+  const cached = memo.get(key);
+  if (cached !== undefined) {
+    // Refresh recency
+    memo.delete(key);
+    memo.set(key, cached);
+    return cached;
+  }
+
+  const count = getEncoder().encode_ordinary(text).length;
+  memo.set(key, count);
+  if (memo.size > MEMO_MAX_ENTRIES) {
+    memo.delete(memo.keys().next().value!);
+  }
+  return count;
+}
+
+/**
+ * Count many strings at once; duplicates in the batch are encoded once
+ */
+export function countTokensBatch(texts: string[]): number[] {
+  const seen = new Map<string, number>();
+  return texts.map(text => {
+    let count = seen.get(text);
+    if (count === undefined) {
+      count = countTokens(text);
+      seen.set(text, count);
+    }
+    return count;
+  });
+}
+
+/**
+ * Text of an MCP payload: content blocks, plain string or JSON of anything else
+ */
+export function mcpContentToText(data: any): string {
+  if (Array.isArray(data)) {
+    let text = '';
+    for (const block of data) {
+      if (block.type === 'text' && block.text) {
+        text += block.text;
+      }
+    }
+    return text;
+  }
+  if (typeof data === 'string') {
+    return data;
+  }
+  if (data && typeof data === 'object') {
+    return JSON.stringify(data);
+  }
+  return '';
+}
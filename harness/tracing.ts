@@ -0,0 +1,260 @@
+/**
+ * Span-based stage timing
+ * Each scenario run gets a Trace; code anywhere below runScenario records spans
+ * with withSpan() and they nest under whichever span is active in the current
+ * async context, so nothing has to be threaded through call signatures. A
+ * scenario's trace is written as Chrome trace JSON (chrome://tracing, Perfetto)
+ * with OpenTelemetry-style trace/span ids in each event's args, and the
+ * top-level stages of every scenario are summarized per run.
+ */
+
+import { AsyncLocalStorage } from 'async_hooks';
+import { randomBytes } from 'crypto';
+import { performance } from 'perf_hooks';
+import fs from 'fs-extra';
+import path from 'path';
+
+export const TRACE_FILE = 'trace.json';
+export const STAGE_TIMINGS_FILE = 'stage_timings.json';
+
+export type SpanAttributes = Record<string, string | number | boolean | undefined>;
+
+export interface SpanRecord {
+  span_id: string;
+  parent_span_id?: string;
+  name: string;
+  start_us: number;      // Unix epoch, microseconds
+  duration_us: number;
+  attributes?: SpanAttributes;
+  error?: string;
+}
+
+export interface StageTiming {
+  stage: string;
+  count: number;
+  total_ms: number;
+  avg_ms: number;
+  p50_ms: number;
+  p95_ms: number;
+  max_ms: number;
+  share: number;         // Fraction of all scenario time spent in this stage
+}
+
+interface ActiveSpan {
+  trace: Trace;
+  spanId: string;
+}
+
+const storage = new AsyncLocalStorage<ActiveSpan>();
+
+function nowUs(): number {
+  return Math.round((performance.timeOrigin + performance.now()) * 1000);
+}
+
+function newId(bytes: number): string {
+  return randomBytes(bytes).toString('hex');
+}
+
+export class Trace {
+  readonly traceId = newId(16);
+  readonly rootId = newId(8);
+  readonly spans: SpanRecord[] = [];
+  private readonly startUs = nowUs();
+  private endUs: number | null = null;
+
+  constructor(readonly name: string, readonly attributes: SpanAttributes = {}) {}
+
+  /**
+   * Run fn with this trace active; spans opened inside nest under its root
+   */
+  run<T>(fn: () => Promise<T>): Promise<T> {
+    return storage.run({ trace: this, spanId: this.rootId }, fn);
+  }
+
+  /**
+   * Close the trace; spans still open (e.g. background judge calls) are dropped
+   */
+  finish(): void {
+    if (this.endUs === null) {
+      this.endUs = nowUs();
+    }
+  }
+
+  get finished(): boolean {
+    return this.endUs !== null;
+  }
+
+  get durationMs(): number {
+    return ((this.endUs ?? nowUs()) - this.startUs) / 1000;
+  }
+
+  record(span: SpanRecord): void {
+    if (!this.finished) {
+      this.spans.push(span);
+    }
+  }
+
+  /**
+   * Total duration of each top-level stage (spans directly under the root)
+   */
+  stageDurations(): Map<string, number> {
+    const stages = new Map<string, number>();
+    for (const span of this.spans) {
+      if (span.parent_span_id === this.rootId) {
+        stages.set(span.name, (stages.get(span.name) ?? 0) + span.duration_us / 1000);
+      }
+    }
+    return stages;
+  }
+
+  /**
+   * Chrome trace JSON; overlapping sibling spans get their own track (tid)
+   */
+  toChromeTrace(): object {
+    const root: SpanRecord = {
+      span_id: this.rootId,
+      name: this.name,
+      start_us: this.startUs,
+      duration_us: (this.endUs ?? nowUs()) - this.startUs,
+      attributes: this.attributes,
+    };
+    const spans = [root, ...this.spans].sort((a, b) => a.start_us - b.start_us || b.duration_us - a.duration_us);
+
+    // Each track holds a stack of open spans; a span goes on the first track
+    // where it nests inside the innermost open span
+    const tracks: SpanRecord[][] = [];
+    const events: object[] = [];
+    for (const span of spans) {
+      const end = span.start_us + span.duration_us;
+      let tid = tracks.findIndex(stack => {
+        while (stack.length > 0 && stack[stack.length - 1].start_us + stack[stack.length - 1].duration_us <= span.start_us) {
+          stack.pop();
+        }
+        const top = stack[stack.length - 1];
+        return !top || top.start_us + top.duration_us >= end;
+      });
+      if (tid === -1) {
+        tid = tracks.push([]) - 1;
+      }
+      tracks[tid].push(span);
+
+      events.push({
+        name: span.name,
+        cat: 'context-bench',
+        ph: 'X',
+        ts: span.start_us,
+        dur: span.duration_us,
+        pid: 1,
+        tid,
+        args: {
+          trace_id: this.traceId,
+          span_id: span.span_id,
+          parent_span_id: span.parent_span_id,
+          ...span.attributes,
+          ...(span.error ? { error: span.error } : {}),
+        },
+      });
+    }
+
+    return {
+      displayTimeUnit: 'ms',
+      traceEvents: [
+        { name: 'process_name', ph: 'M', pid: 1, args: { name: this.name } },
+        ...events,
+      ],
+    };
+  }
+
+  async save(file: string): Promise<void> {
+    await fs.ensureDir(path.dirname(file));
+    await fs.writeJson(file, this.toChromeTrace());
+  }
+}
+
+/**
+ * Record fn as a span under the active span; runs fn untraced outside a trace
+ */
+export async function withSpan<T>(name: string, fn: () => Promise<T>, attributes?: SpanAttributes): Promise<T> {
+  const parent = storage.getStore();
+  if (!parent || parent.trace.finished) {
+    return fn();
+  }
+
+  const span: SpanRecord = {
+    span_id: newId(8),
+    parent_span_id: parent.spanId,
+    name,
+    start_us: nowUs(),
+    duration_us: 0,
+    attributes,
+  };
+  try {
+    return await storage.run({ trace: parent.trace, spanId: span.span_id }, fn);
+  } catch (error: any) {
+    span.error = error?.message ?? String(error);
+    throw error;
+  } finally {
+    span.duration_us = nowUs() - span.start_us;
+    parent.trace.record(span);
+  }
+}
+
+/**
+ * Trace of the current async context, if any
+ */
+export function currentTrace(): Trace | undefined {
+  return storage.getStore()?.trace;
+}
+
+/**
+ * Per-run accumulator of scenario stage durations
+ */
+export class StageTimings {
+  private static instance: StageTimings;
+  private samples: Map<string, number[]> = new Map();
+  private scenarioMs = 0;
+
+  private constructor() {}
+
+  /**
+   * Get singleton instance
+   */
+  public static getInstance(): StageTimings {
+    if (!StageTimings.instance) {
+      StageTimings.instance = new StageTimings();
+    }
+    return StageTimings.instance;
+  }
+
+  add(trace: Trace): void {
+    this.scenarioMs += trace.durationMs;
+    for (const [stage, ms] of trace.stageDurations()) {
+      const samples = this.samples.get(stage) ?? [];
+      samples.push(ms);
+      this.samples.set(stage, samples);
+    }
+  }
+
+  /**
+   * Stages ordered by total time, largest first
+   */
+  getTimings(): StageTiming[] {
+    const round = (ms: number) => Math.round(ms * 10) / 10;
+    return Array.from(this.samples.entries())
+      .map(([stage, samples]) => {
+        const sorted = [...samples].sort((a, b) => a - b);
+        const total = sorted.reduce((sum, ms) => sum + ms, 0);
+        return {
+          stage,
+          count: sorted.length,
+          total_ms: round(total),
+          avg_ms: round(total / sorted.length),
+          p50_ms: round(sorted[Math.floor((sorted.length - 1) / 2)]),
+          p95_ms: round(sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * 0.95))]),
+          max_ms: round(sorted[sorted.length - 1]),
+          share: this.scenarioMs > 0 ? Math.round((total / this.scenarioMs) * 1000) / 1000 : 0,
+        };
+      })
+      .sort((a, b) => b.total_ms - a.total_ms);
+  }
+}
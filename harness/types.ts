@@ -7,6 +7,8 @@
  */
 export type ExecutionMode = 'oneshot' | 'agent';
 
+export type WorkspaceMode = 'copy' | 'reflink' | 'hardlink' | 'overlay';
+
 /**
  * Package specification (new YAML structure)
  */
@@ -73,6 +75,7 @@ export interface ScenarioIdentifier {
 export interface MCPConfig {
   config_name: string;
   description: string;
+  offline?: boolean;  // Replays recorded results; excluded from --all-configs unless --offline
   mcp_servers: Record<string, MCPServerConfig>;
 }
 
@@ -122,12 +125,17 @@ export interface ScenarioReport {
     turns: number;
     tool_calls: number;
     elapsed_ms: number;
+    input_tokens?: number;                 // Uncached input tokens
+    output_tokens?: number;
+    cache_creation_input_tokens?: number;  // Input tokens written to the prompt cache
+    cache_read_input_tokens?: number;      // Input tokens served from the prompt cache
   };
   oneshot_stats?: {
     tool_calls: number;
     elapsed_ms: number;
     mcp_tool_used?: string;
     mcp_server_used?: string;
+    cache_hit?: boolean;  // Result came from the tool result cache; elapsed_ms is not an MCP latency
   };
   evaluation?: {
     mode: ExecutionMode;
@@ -151,6 +159,14 @@ export interface ScenarioReport {
     total_output_tokens: number;
   };
   build_time_ms?: number;
+  build_breakdown?: {
+    queue_wait_ms: number;
+    base_image: string;
+    base_image_ms: number;
+    base_image_cached: boolean;
+    image_build_ms: number;
+    steps: Array<{ step: string; duration_ms: number; cached: boolean }>;
+  };
   total_elapsed_ms: number;
 }
 
@@ -182,18 +198,39 @@ export interface CLIOptions {
   mode?: ExecutionMode;
   config?: string;
   allConfigs?: boolean;
+  offline?: boolean;
   allPackages?: boolean;
   runId: string;
   maxWorkers?: number;
   timeout?: number;
   keepWorkspace?: boolean;
   verbose?: boolean;
+  logLevel?: string;
   outputDir?: string;
   listPackages?: boolean;
   listScenarios?: boolean;
   listConfigs?: boolean;
   showScenario?: string;
   showPackage?: string;
+  cacheMode?: string;
+  evalCacheMode?: string;
+  evalConcurrency?: string;
+  evalRpm?: string;
+  evalBatchSize?: string;
+  evalEarlyExit?: boolean;
+  mcpPoolSize?: string;
+  portRange?: string;
+  buildParallelism?: string;
+  testConcurrency?: string;
+  warmPool?: string;
+  workspaceMode?: string;
+  schedule?: string;
+  poolLimits?: string;
+  shard?: string;
+  coordinator?: string;
+  merge?: boolean;
+  resume?: string;
+  onlyChanged?: string;
 }
 
 export interface RunContext {
@@ -208,6 +245,11 @@ export interface RunContext {
   keepWorkspace: boolean;
   isParallel?: boolean;
   sharedMcpManager?: any;  // Shared MCP client manager for parallel execution
+  cacheMode?: 'read' | 'write' | 'off';  // MCP tool result cache (oneshot mode)
+  evalCacheMode?: 'read' | 'write' | 'off';  // Evaluation verdict cache
+  evalBatchSize?: number;  // Scenarios per judge request (1 = no batching)
+  evalEarlyExit?: boolean;  // Decide pass/fail once the judge majority is reached
+  workspaceMode?: WorkspaceMode;  // How the scaffold template is materialized (agent mode)
 }
 
 /**
@@ -2,23 +2,46 @@
  * Schema validator using AJV
  */
 
-import Ajv from 'ajv';
+import Ajv, { ValidateFunction } from 'ajv';
 import addFormats from 'ajv-formats';
 import { ValidationResult } from './types.js';
+import { hashContent } from './cache.js';
 
 const ajv = new Ajv({ allErrors: true });
 addFormats(ajv);
 
+// Compiled validators by schema object, and by schema content for equal copies
+const validatorsBySchema: WeakMap<object, ValidateFunction> = new WeakMap();
+const validatorsByHash: Map<string, ValidateFunction> = new Map();
+
+/**
+ * Compiled validator for a schema, compiling each distinct schema once
+ */
+function getValidator(schema: object): ValidateFunction {
+  let validate = validatorsBySchema.get(schema);
+  if (!validate) {
+    const key = hashContent(schema);
+    validate = validatorsByHash.get(key);
+    if (!validate) {
+      validate = ajv.compile(schema);
+      validatorsByHash.set(key, validate);
+    }
+    validatorsBySchema.set(schema, validate);
+  }
+  return validate;
+}
+
 /**
  * Validate output against JSON schema
  */
 export function validateOutput(output: any, schema: object): ValidationResult {
-  const validate = ajv.compile(schema);
+  const validate = getValidator(schema);
   const valid = validate(output);
 
   return {
     pass: valid,
-    errors: validate.errors || [],
+    // The validator is shared, so copy its errors before the next call replaces them
+    errors: validate.errors ? [...validate.errors] : [],
   };
 }
 
@@ -1,13 +1,171 @@
 /**
  * Workspace initialization and management
+ *
+ * The scaffold template is materialized per scenario in one of four modes:
+ *   copy      Plain copy of every file
+ *   reflink   Copy-on-write clones where the filesystem supports them, copies elsewhere
+ *   hardlink  Files under node_modules/ are hardlinked to the template, the rest is
+ *             copied as in reflink mode
+ *   overlay   As hardlink, but package directories under node_modules/ are symlinked whole
+ * Only dependency trees are ever shared: editable paths are enforced by the prompt
+ * alone, so anything else an agent or build step rewrites in place would change the
+ * template for every later scenario.
+ * The template listing is read once per process, and files are created
+ * asynchronously with bounded concurrency.
  */
 
 import fs from 'fs-extra';
 import path from 'path';
-import { ScenarioSpec } from './types.js';
-import { PATHS } from './constants.js';
+import { ScenarioSpec, WorkspaceMode } from './types.js';
+import { DEFAULTS, PATHS } from './constants.js';
 import { resolveEnvVars } from './validator.js';
 import { Logger } from './logger.js';
+import { Semaphore } from './semaphore.js';
+
+export const WORKSPACE_MODES: WorkspaceMode[] = ['copy', 'reflink', 'hardlink', 'overlay'];
+
+// npm rewrites these in place during `npm install`, so they are never shared
+const ALWAYS_COPIED = ['package-lock.json', 'node_modules/.package-lock.json'];
+
+// Dependency trees shared with the template in hardlink/overlay mode (their contents, never the root itself)
+const SHARED_ROOTS = ['node_modules'];
+
+interface TemplateEntry {
+  rel: string;       // Path relative to the template, '/'-separated
+  isDirectory: boolean;
+  isSymlink: boolean;
+}
+
+export interface MaterializeStats {
+  mode: WorkspaceMode;
+  copied: number;
+  linked: number;
+  symlinked: number;
+  duration_ms: number;
+}
+
+let templateEntries: Promise<TemplateEntry[]> | null = null;
+const fileSlots = new Semaphore(DEFAULTS.WORKSPACE_COPY_CONCURRENCY);
+
+/**
+ * Parse a --workspace-mode flag value
+ */
+export function parseWorkspaceMode(value: string | undefined): WorkspaceMode {
+  const mode = (value || DEFAULTS.WORKSPACE_MODE) as WorkspaceMode;
+  if (!WORKSPACE_MODES.includes(mode)) {
+    throw new Error(`Invalid --workspace-mode "${value}". Must be one of: ${WORKSPACE_MODES.join(', ')}`);
+  }
+  return mode;
+}
+
+/**
+ * Template entries in depth-first order (directories before their contents)
+ */
+function listTemplate(): Promise<TemplateEntry[]> {
+  if (!templateEntries) {
+    templateEntries = (async () => {
+      const entries: TemplateEntry[] = [];
+      const walk = async (relDir: string) => {
+        const dirents = await fs.readdir(path.join(PATHS.SCAFFOLD_TEMPLATE_DIR, relDir), { withFileTypes: true });
+        for (const dirent of dirents) {
+          const rel = relDir ? `${relDir}/${dirent.name}` : dirent.name;
+          entries.push({ rel, isDirectory: dirent.isDirectory(), isSymlink: dirent.isSymbolicLink() });
+          if (dirent.isDirectory()) {
+            await walk(rel);
+          }
+        }
+      };
+      await walk('');
+      return entries;
+    })();
+    // Retry the scan on the next call if it failed
+    templateEntries.catch(() => {
+      templateEntries = null;
+    });
+  }
+  return templateEntries;
+}
+
+function normalizePath(p: string): string {
+  return p.replace(/\\/g, '/').replace(/^\.\//, '').replace(/\/+$/, '');
+}
+
+function isUnder(rel: string, root: string): boolean {
+  return rel === root || rel.startsWith(`${root}/`);
+}
+
+/**
+ * Materialize the scaffold template into a workspace directory
+ */
+export async function materializeWorkspace(
+  workspaceDir: string,
+  editablePaths: string[],
+  mode: WorkspaceMode
+): Promise<MaterializeStats> {
+  const start = Date.now();
+  const entries = await listTemplate();
+  const templateRoot = path.resolve(PATHS.SCAFFOLD_TEMPLATE_DIR);
+  const stats: MaterializeStats = { mode, copied: 0, linked: 0, symlinked: 0, duration_ms: 0 };
+
+  const writable = [...editablePaths, ...ALWAYS_COPIED].map(normalizePath);
+  const isWritable = (rel: string) => writable.some(p => isUnder(rel, p));
+  // Directories that contain writable paths must be real directories
+  const holdsWritable = (rel: string) => writable.some(p => isUnder(p, rel));
+  const isShared = (rel: string) => !isWritable(rel)
+    && SHARED_ROOTS.some(root => rel !== root && isUnder(rel, root));
+
+  await fs.remove(workspaceDir);
+  await fs.ensureDir(workspaceDir);
+
+  const copyFlags = mode === 'copy' ? 0 : fs.constants.COPYFILE_FICLONE;
+  const fileTasks: Promise<void>[] = [];
+  let sharedRoot: string | null = null;
+
+  for (const entry of entries) {
+    // Inside a subtree that is already symlinked (overlay)
+    if (sharedRoot && isUnder(entry.rel, sharedRoot)) {
+      continue;
+    }
+    sharedRoot = null;
+
+    const src = path.join(templateRoot, entry.rel);
+    const dst = path.join(workspaceDir, entry.rel);
+
+    if (mode === 'overlay' && entry.isDirectory && isShared(entry.rel) && !holdsWritable(entry.rel)) {
+      sharedRoot = entry.rel;
+      fileTasks.push(fileSlots.run(() => fs.symlink(src, dst)));
+      stats.symlinked++;
+      continue;
+    }
+
+    if (entry.isDirectory) {
+      // Parents come first in the listing, so create directories before their files are scheduled
+      await fs.mkdir(dst);
+      continue;
+    }
+
+    if (entry.isSymlink) {
+      fileTasks.push(fileSlots.run(async () => fs.symlink(await fs.readlink(src), dst)));
+      stats.copied++;
+    } else if ((mode === 'hardlink' || mode === 'overlay') && isShared(entry.rel)) {
+      stats.linked++;
+      fileTasks.push(fileSlots.run(() => fs.link(src, dst).catch(async (error: any) => {
+        // Template and workspace on different devices
+        if (error.code !== 'EXDEV' && error.code !== 'EPERM') throw error;
+        stats.linked--;
+        stats.copied++;
+        await fs.copyFile(src, dst, copyFlags);
+      })));
+    } else {
+      fileTasks.push(fileSlots.run(() => fs.copyFile(src, dst, copyFlags)));
+      stats.copied++;
+    }
+  }
+
+  await Promise.all(fileTasks);
+  stats.duration_ms = Date.now() - start;
+  return stats;
+}
 
 /**
  * Initialize workspace from scaffold template
@@ -15,22 +173,18 @@ import { Logger } from './logger.js';
 export async function initWorkspace(
   scenario: ScenarioSpec,
   workspaceDir: string,
-  logger: Logger
+  logger: Logger,
+  mode: WorkspaceMode = DEFAULTS.WORKSPACE_MODE
 ): Promise<void> {
-  logger.info('Copying scaffold-template to workspace/');
-
-  // Clean workspace
-  if (fs.existsSync(workspaceDir)) {
-    fs.removeSync(workspaceDir);
-  }
+  logger.info(`Materializing scaffold-template into workspace/ (mode: ${mode})`);
 
-  // Copy scaffold template
-  fs.copySync(PATHS.SCAFFOLD_TEMPLATE_DIR, workspaceDir);
+  const stats = await materializeWorkspace(workspaceDir, getEditablePaths(scenario), mode);
+  logger.info(`Workspace files: ${stats.copied} copied, ${stats.linked} hardlinked, ${stats.symlinked} symlinked in ${stats.duration_ms}ms`);
 
   // Set file permissions (logic.ts writable, others read-only if needed)
   const logicPath = path.join(workspaceDir, 'app', 'logic.ts');
-  if (fs.existsSync(logicPath)) {
-    fs.chmodSync(logicPath, 0o644);
+  if (await fs.pathExists(logicPath)) {
+    await fs.chmod(logicPath, 0o644);
   }
 
   // Inject environment variables
@@ -41,7 +195,7 @@ export async function initWorkspace(
       .join('\n');
 
     const envPath = path.join(workspaceDir, '.env');
-    fs.writeFileSync(envPath, envContent);
+    await fs.writeFile(envPath, envContent);
     logger.info(`Environment variables written to ${envPath}`);
   }
 
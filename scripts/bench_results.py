@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Streaming loader for Context Bench oneshot results
+
+Walks workspace/<run-id>/oneshot/<config>/<scenario>/ directories and yields
+one small record per scenario (pass flag, score, Tool Result token count).
+Reasoning strings and tool output are never retained: evaluation JSON is parsed
+one file at a time and each Tool Result section is dropped once counted.
+
+Tokens are counted exactly with tiktoken's cl100k_base (the encoding used by
+harness/tokens.ts) when it is installed, otherwise estimated as ceil(chars / 4).
+"""
+import json
+import math
+import os
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+import numpy as np
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+TOOL_RESULT_MARKER = '## Tool Result'
+EVALUATION_FILE = 'evaluation_oneshot.json'
+ONESHOT_RESULT_FILE = 'oneshot_result.md'
+TOKEN_ENCODING = 'cl100k_base'
+
+_encoder = None
+
+
+class ScenarioResult(NamedTuple):
+    run_id: str
+    config: str
+    scenario: str
+    passed: bool
+    final_score: float
+    tokens: int
+
+
+def _utf16_len(text: str) -> int:
+    """Length in UTF-16 code units, matching JavaScript's String.length"""
+    return len(text.encode('utf-16-le')) // 2
+
+
+def _get_encoder():
+    """Process-wide tiktoken encoder, or None if tiktoken (or its BPE file) is unavailable"""
+    global _encoder
+    if _encoder is None:
+        _encoder = False
+        if tiktoken is not None:
+            try:
+                _encoder = tiktoken.get_encoding(TOKEN_ENCODING)
+            except Exception:
+                pass
+    return _encoder or None
+
+
+def token_counting_method() -> str:
+    """'cl100k_base' when counts are exact, 'estimate' otherwise"""
+    return TOKEN_ENCODING if _get_encoder() is not None else 'estimate'
+
+
+def _read_tool_result(path: str) -> str:
+    """Tool Result section text, extracted like scripts/count-tokens.ts"""
+    with open(path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+        content = f.read()
+    index = content.find(TOOL_RESULT_MARKER)
+    if index == -1:
+        return ''
+    after = content[index + len(TOOL_RESULT_MARKER):]
+    newline = after.find('\n')
+    return after[newline + 1:].strip() if newline != -1 else ''
+
+
+def count_tool_result_tokens(path: str) -> int:
+    """Tokens in the Tool Result section of oneshot_result.md (exact when possible)"""
+    encoder = _get_encoder()
+    if encoder is None:
+        return estimate_tool_result_tokens(path)
+    text = _read_tool_result(path)
+    return len(encoder.encode_ordinary(text)) if text else 0
+
+
+def estimate_tool_result_tokens(path: str) -> int:
+    """
+    Estimate tokens in the Tool Result section of oneshot_result.md.
+
+    ceil(chars / 4) over the trimmed section, without loading the section into memory: leading whitespace is skipped and
+    trailing whitespace is only counted once more content follows it.
+    """
+    chars = 0
+    pending_ws = 0
+    started = False
+    in_section = False
+
+    with open(path, 'r', encoding='utf-8', errors='replace', newline='') as f:
+        for line in f:
+            if not in_section:
+                # Remainder of the marker line is dropped, like .slice(1)
+                in_section = TOOL_RESULT_MARKER in line
+                continue
+
+            segment = line
+            if not started:
+                stripped = segment.lstrip()
+                if not stripped:
+                    continue
+                started = True
+                segment = stripped
+
+            body = segment.rstrip()
+            if body:
+                chars += pending_ws + _utf16_len(body)
+                pending_ws = _utf16_len(segment) - _utf16_len(body)
+            else:
+                pending_ws += _utf16_len(segment)
+
+    if not in_section or chars == 0:
+        return 0
+    return math.ceil(chars / 4)
+
+
+def _read_evaluation(path: str) -> Optional[tuple]:
+    """Return (pass, final_score) from an evaluation file, or None if unreadable"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            aggregated = json.load(f).get('aggregated') or {}
+    except (OSError, ValueError):
+        return None
+    return bool(aggregated.get('pass', False)), float(aggregated.get('final_score', 0) or 0)
+
+
+def iter_run_dirs(paths: Iterable[str]) -> Iterator[str]:
+    """
+    Resolve CLI paths to run directories.
+
+    Each path may be a run directory (contains oneshot/) or a workspace root
+    whose children are run directories.
+    """
+    for root in paths:
+        if os.path.isdir(os.path.join(root, 'oneshot')):
+            yield root
+            continue
+        try:
+            entries = sorted(os.scandir(root), key=lambda e: e.name)
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.is_dir() and os.path.isdir(os.path.join(entry.path, 'oneshot')):
+                yield entry.path
+
+
+def iter_results(run_dirs: Iterable[str]) -> Iterator[ScenarioResult]:
+    """Yield one ScenarioResult per evaluated oneshot scenario directory"""
+    for run_dir in run_dirs:
+        run_id = os.path.basename(os.path.normpath(run_dir))
+        oneshot_dir = os.path.join(run_dir, 'oneshot')
+
+        with os.scandir(oneshot_dir) as configs:
+            config_entries = [e for e in configs if e.is_dir()]
+
+        for config_entry in config_entries:
+            with os.scandir(config_entry.path) as scenarios:
+                scenario_entries = [e for e in scenarios if e.is_dir()]
+
+            for scenario_entry in scenario_entries:
+                evaluation = _read_evaluation(os.path.join(scenario_entry.path, EVALUATION_FILE))
+                if evaluation is None:
+                    continue
+
+                result_path = os.path.join(scenario_entry.path, ONESHOT_RESULT_FILE)
+                try:
+                    tokens = count_tool_result_tokens(result_path)
+                except OSError:
+                    tokens = 0
+
+                yield ScenarioResult(
+                    run_id=run_id,
+                    config=config_entry.name,
+                    scenario=scenario_entry.name,
+                    passed=evaluation[0],
+                    final_score=evaluation[1],
+                    tokens=tokens,
+                )
+
+
+class ResultTable:
+    """Columnar view of scenario results (one NumPy array per field)"""
+
+    def __init__(self, configs: List[str], scenarios: List[str], runs: List[str],
+                 config_idx: np.ndarray, scenario_idx: np.ndarray, run_idx: np.ndarray,
+                 passed: np.ndarray, final_score: np.ndarray, tokens: np.ndarray):
+        self.configs = configs
+        self.scenarios = scenarios
+        self.runs = runs
+        self.config_idx = config_idx
+        self.scenario_idx = scenario_idx
+        self.run_idx = run_idx
+        self.passed = passed
+        self.final_score = final_score
+        self.tokens = tokens
+
+    def __len__(self) -> int:
+        return int(self.config_idx.shape[0])
+
+    @classmethod
+    def from_results(cls, results: Iterable[ScenarioResult]) -> 'ResultTable':
+        """Build the table incrementally; strings are interned to integer codes"""
+        lookups: Dict[str, Dict[str, int]] = {'config': {}, 'scenario': {}, 'run': {}}
+        config_col, scenario_col, run_col = array('i'), array('i'), array('i')
+        passed_col, score_col, tokens_col = array('b'), array('d'), array('q')
+
+        def code(kind: str, value: str) -> int:
+            table = lookups[kind]
+            if value not in table:
+                table[value] = len(table)
+            return table[value]
+
+        for r in results:
+            config_col.append(code('config', r.config))
+            scenario_col.append(code('scenario', r.scenario))
+            run_col.append(code('run', r.run_id))
+            passed_col.append(1 if r.passed else 0)
+            score_col.append(r.final_score)
+            tokens_col.append(r.tokens)
+
+        return cls(
+            configs=list(lookups['config']),
+            scenarios=list(lookups['scenario']),
+            runs=list(lookups['run']),
+            config_idx=np.frombuffer(config_col, dtype=np.int32),
+            scenario_idx=np.frombuffer(scenario_col, dtype=np.int32),
+            run_idx=np.frombuffer(run_col, dtype=np.int32),
+            passed=np.frombuffer(passed_col, dtype=np.int8).astype(bool),
+            final_score=np.frombuffer(score_col, dtype=np.float64),
+            tokens=np.frombuffer(tokens_col, dtype=np.int64),
+        )
+
+    def select(self, mask: np.ndarray) -> 'ResultTable':
+        return ResultTable(
+            self.configs, self.scenarios, self.runs,
+            self.config_idx[mask], self.scenario_idx[mask], self.run_idx[mask],
+            self.passed[mask], self.final_score[mask], self.tokens[mask],
+        )
+
+    def latest(self) -> 'ResultTable':
+        """
+        Keep only the most recent result per (config, scenario).
+
+        Run ids are timestamped (run-YYYY-MM-DD-HHMM), so lexical order is
+        chronological.
+        """
+        if len(self) == 0:
+            return self
+        run_rank = np.argsort(np.argsort(np.array(self.runs, dtype=object)))
+        key = self.config_idx.astype(np.int64) * len(self.scenarios) + self.scenario_idx
+        order = np.lexsort((run_rank[self.run_idx], key))
+        sorted_key = key[order]
+        is_last = np.ones(order.shape[0], dtype=bool)
+        is_last[:-1] = sorted_key[1:] != sorted_key[:-1]
+        return self.select(np.sort(order[is_last]))
+
+
+class ConfigSummary(NamedTuple):
+    config: str
+    total: int
+    passed: int
+    avg_tokens: float
+    total_tokens: int
+    avg_score: float
+
+
+def summarize(table: ResultTable) -> List[ConfigSummary]:
+    """Per-config pass counts and token totals, computed with bincount"""
+    n = len(table.configs)
+    if len(table) == 0:
+        return []
+    totals = np.bincount(table.config_idx, minlength=n)
+    passed = np.bincount(table.config_idx, weights=table.passed, minlength=n)
+    tokens = np.bincount(table.config_idx, weights=table.tokens, minlength=n)
+    scores = np.bincount(table.config_idx, weights=table.final_score, minlength=n)
+
+    summaries = []
+    for i, config in enumerate(table.configs):
+        if totals[i] == 0:
+            continue
+        summaries.append(ConfigSummary(
+            config=config,
+            total=int(totals[i]),
+            passed=int(passed[i]),
+            avg_tokens=float(tokens[i] / totals[i]),
+            total_tokens=int(tokens[i]),
+            avg_score=float(scores[i] / totals[i]),
+        ))
+    # Most accurate first, fewer tokens breaking ties
+    summaries.sort(key=lambda s: (-s.passed, s.avg_tokens))
+    return summaries
+
+
+def load_table(paths: Iterable[str], latest_only: bool = True) -> ResultTable:
+    table = ResultTable.from_results(iter_results(iter_run_dirs(paths)))
+    return table.latest() if latest_only else table
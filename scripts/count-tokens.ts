@@ -1,18 +1,11 @@
 /**
  * Token counter for oneshot results
- * Counts tokens in Tool Result sections using Anthropic's API
+ * Counts tokens in Tool Result sections with the harness tokenizer (cl100k_base)
  */
 
-import Anthropic from '@anthropic-ai/sdk';
 import fs from 'fs-extra';
 import path from 'path';
-import dotenv from 'dotenv';
-
-dotenv.config();
-
-const anthropic = new Anthropic({
-  apiKey: process.env.ANTHROPIC_API_KEY,
-});
+import { countTokensBatch, TOKEN_ENCODING } from '../harness/tokens.js';
 
 interface TokenCount {
   scenarioId: string;
@@ -48,17 +41,6 @@ function extractToolResult(content: string): string | null {
   return resultText;
 }
 
-/**
- * Count tokens using Anthropic API
- * Falls back to character-based estimation if API is unavailable
- */
-async function countTokens(text: string): Promise<number> {
-  // Use character-based estimation (roughly 4 chars per token)
-  // This is a good approximation for Claude models
-  const estimatedTokens = Math.ceil(text.length / 4);
-  return estimatedTokens;
-}
-
 /**
  * Process all oneshot results in a config directory
  */
@@ -71,14 +53,14 @@ async function processConfigResults(workspaceDir: string, configName: string): P
   }
 
   const scenarios = await fs.readdir(oneshotDir);
-  const results: TokenCount[] = [];
 
-  for (const scenarioId of scenarios) {
+  // Read every result first, then tokenize the whole config in one batch
+  const loaded = await Promise.all(scenarios.map(async (scenarioId) => {
     const oneshotResultPath = path.join(oneshotDir, scenarioId, 'oneshot_result.md');
 
     if (!await fs.pathExists(oneshotResultPath)) {
       console.warn(`Missing oneshot_result.md for ${scenarioId}`);
-      continue;
+      return null;
     }
 
     const content = await fs.readFile(oneshotResultPath, 'utf-8');
@@ -86,22 +68,20 @@ async function processConfigResults(workspaceDir: string, configName: string): P
 
     if (!toolResult) {
       console.warn(`No Tool Result section found in ${scenarioId}`);
-      continue;
+      return null;
     }
 
-    console.log(`Counting tokens for ${configName}/${scenarioId}...`);
-    const tokenCount = await countTokens(toolResult);
+    return { scenarioId, toolResult };
+  }));
 
-    results.push({
-      scenarioId,
-      tokenCount,
-    });
-
-    // Rate limiting - wait 100ms between requests
-    await new Promise(resolve => setTimeout(resolve, 100));
-  }
+  const found = loaded.filter((r): r is { scenarioId: string; toolResult: string } => r !== null);
+  console.log(`Counting tokens for ${found.length} ${configName} scenario(s) (${TOKEN_ENCODING})...`);
+  const counts = countTokensBatch(found.map(r => r.toolResult));
 
-  return results;
+  return found.map((r, i) => ({
+    scenarioId: r.scenarioId,
+    tokenCount: counts[i],
+  }));
 }
 
 /**
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+Smoke-run Python oracles against a local mock LLM
+
+Executes every Python oracle in its own subprocess (and temporary working
+directory) with OPENAI_BASE_URL pointed at an in-process OpenAI-compatible mock.
+The mock answers Chat Completions and Responses requests deterministically: the
+first turn of a conversation that offers tools gets a call to the first tool
+(arguments generated from its JSON schema), later turns get a canned reply, or
+a schema-shaped JSON object when structured output is requested. Streaming is
+served as SSE chunks.
+
+Reports per oracle whether it still imports and runs, its import time, run
+time and peak RSS. The frameworks the oracles use (agno, autogen, langgraph,
+openai-agents) must be installed for the interpreter given with --python.
+
+Usage:
+    python scripts/oracle_smoke.py                            # every Python oracle
+    python scripts/oracle_smoke.py --only agno:trend-scout --jobs 1
+    python scripts/oracle_smoke.py --python .venv/bin/python --json oracle_smoke.json
+"""
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, NamedTuple, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from scenario_catalog import Scenario, load_catalog  # noqa: E402
+
+DEFAULT_REPLY = 'Mock reply for the oracle smoke run. APPROVE TERMINATE'
+CREATED = 1700000000
+
+# Oracles that can only be import-checked against the mock
+IMPORT_ONLY = {
+    'openai-agents:realtime-agent': 'needs a Realtime websocket endpoint',
+}
+
+# Runs inside the oracle subprocess: times the module's top-level imports
+# separately from the rest of the module, then reports to ORACLE_SMOKE_REPORT
+BOOTSTRAP = r'''
+import ast, json, os, resource, runpy, sys, time, traceback
+
+path = sys.argv[1]
+result = {"phase": "import"}
+
+def finish(code):
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result["peak_rss_kb"] = rss // 1024 if sys.platform == "darwin" else rss
+    with open(os.environ["ORACLE_SMOKE_REPORT"], "w") as f:
+        json.dump(result, f)
+    sys.stdout.flush()
+    os._exit(code)
+
+try:
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    imports = ast.Module(body=[n for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))], type_ignores=[])
+    start = time.perf_counter()
+    exec(compile(imports, path, "exec"), {"__name__": "__oracle_imports__"})
+    result["import_s"] = time.perf_counter() - start
+
+    if not os.environ.get("ORACLE_SMOKE_IMPORT_ONLY"):
+        result["phase"] = "run"
+        sys.argv = [path]
+        start = time.perf_counter()
+        try:
+            runpy.run_path(path, run_name="__main__")
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                raise
+        finally:
+            result["run_s"] = time.perf_counter() - start
+    result["phase"] = "done"
+except BaseException as e:
+    result["error"] = f"{type(e).__name__}: {e}"
+    traceback.print_exc()
+    finish(1)
+finish(0)
+'''
+
+
+class SmokeResult(NamedTuple):
+    scenario_id: str
+    status: str             # ok, import-error, run-error, timeout
+    import_s: Optional[float]
+    run_s: Optional[float]
+    peak_rss_mb: Optional[float]
+    requests: int           # Calls the oracle made to the mock
+    note: str
+    output_tail: str
+
+
+def sample_from_schema(schema: Any, root: Optional[dict] = None, depth: int = 0) -> Any:
+    """Smallest value that satisfies a JSON schema (enough for strict structured outputs)"""
+    root = root if root is not None else schema
+    if not isinstance(schema, dict) or depth > 8:
+        return None
+
+    ref = schema.get('$ref')
+    if isinstance(ref, str) and ref.startswith('#/'):
+        target: Any = root
+        for part in ref[2:].split('/'):
+            target = target.get(part, {}) if isinstance(target, dict) else {}
+        return sample_from_schema(target, root, depth + 1)
+    if 'const' in schema:
+        return schema['const']
+    if schema.get('enum'):
+        return schema['enum'][0]
+    for key in ('anyOf', 'oneOf', 'allOf'):
+        options = [o for o in schema.get(key) or [] if o.get('type') != 'null']
+        if options:
+            return sample_from_schema(options[0], root, depth + 1)
+
+    kind = schema.get('type')
+    if isinstance(kind, list):
+        kind = next((k for k in kind if k != 'null'), 'null')
+    if kind == 'object' or 'properties' in schema:
+        return {name: sample_from_schema(prop, root, depth + 1)
+                for name, prop in (schema.get('properties') or {}).items()}
+    if kind == 'array':
+        return [sample_from_schema(schema.get('items') or {}, root, depth + 1)
+                for _ in range(schema.get('minItems') or 0)]
+    return {'string': 'mock', 'integer': 1, 'number': 1.0, 'boolean': True}.get(kind)
+
+
+def _estimate_tokens(value: Any) -> int:
+    return max(1, len(json.dumps(value)) // 4)
+
+
+class MockLLMServer:
+    """OpenAI-compatible mock serving /v1/chat/completions and /v1/responses"""
+
+    def __init__(self, reply: str = DEFAULT_REPLY):
+        self.reply = reply
+        self.requests: Counter = Counter()  # API key -> request count
+        self._lock = threading.Lock()
+        self._ids = 0
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self._server.server_address[1]}/v1'
+
+    def __enter__(self) -> 'MockLLMServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _next_id(self) -> int:
+        with self._lock:
+            self._ids += 1
+            return self._ids
+
+    def _plan(self, tools: List[dict], tool_result_seen: bool, tool_choice: Any, schema: Optional[dict]):
+        """(tool name, arguments) for a tool call turn, or (None, text) for a final reply"""
+        forced = tool_choice == 'required' or isinstance(tool_choice, dict)
+        if tools and tool_choice != 'none' and (forced or not tool_result_seen):
+            by_name = {t['name']: t for t in tools}
+            name = (tool_choice.get('name') or (tool_choice.get('function') or {}).get('name')) if isinstance(tool_choice, dict) else None
+            tool = by_name.get(name) or tools[0]
+            return tool['name'], json.dumps(sample_from_schema(tool.get('parameters') or {}))
+        if schema:
+            return None, json.dumps(sample_from_schema(schema))
+        return None, self.reply
+
+    def chat_completion(self, body: dict):
+        """Response body, or a list of SSE chunks when streaming"""
+        messages = body.get('messages') or []
+        tools = [t['function'] for t in body.get('tools') or [] if t.get('type') == 'function']
+        response_format = body.get('response_format') or {}
+        schema = (response_format.get('json_schema') or {}).get('schema') if response_format.get('type') == 'json_schema' else None
+        seen = any(m.get('role') == 'tool' for m in messages)
+        tool_name, content = self._plan(tools, seen, body.get('tool_choice'), schema)
+
+        n = self._next_id()
+        model = body.get('model', 'mock')
+        prompt_tokens, completion_tokens = _estimate_tokens(messages), _estimate_tokens(content)
+        usage = {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+                 'total_tokens': prompt_tokens + completion_tokens}
+        tool_calls = [{'id': f'call_mock_{n}', 'type': 'function',
+                       'function': {'name': tool_name, 'arguments': content}}] if tool_name else None
+        finish_reason = 'tool_calls' if tool_name else 'stop'
+        base = {'id': f'chatcmpl-mock-{n}', 'created': CREATED, 'model': model}
+
+        if not body.get('stream'):
+            message = {'role': 'assistant', 'content': None if tool_name else content}
+            if tool_calls:
+                message['tool_calls'] = tool_calls
+            return {**base, 'object': 'chat.completion', 'usage': usage,
+                    'choices': [{'index': 0, 'message': message, 'finish_reason': finish_reason, 'logprobs': None}]}
+
+        def chunk(delta: dict, finish: Optional[str] = None) -> dict:
+            return {**base, 'object': 'chat.completion.chunk',
+                    'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish, 'logprobs': None}]}
+
+        chunks = [chunk({'role': 'assistant', 'content': ''})]
+        if tool_calls:
+            chunks.append(chunk({'tool_calls': [{'index': 0, **tool_calls[0]}]}))
+        else:
+            chunks.extend(chunk({'content': piece}) for piece in _split(content))
+        chunks.append(chunk({}, finish_reason))
+        if (body.get('stream_options') or {}).get('include_usage'):
+            chunks.append({**base, 'object': 'chat.completion.chunk', 'choices': [], 'usage': usage})
+        return [(None, c) for c in chunks]
+
+    def response(self, body: dict):
+        """Responses API body, or a list of (event, data) SSE events when streaming"""
+        items = body.get('input')
+        items = items if isinstance(items, list) else [{'role': 'user', 'content': items}]
+        tools = [t for t in body.get('tools') or [] if t.get('type') == 'function']
+        text_format = (body.get('text') or {}).get('format') or {}
+        schema = text_format.get('schema') if text_format.get('type') == 'json_schema' else None
+        seen = any(isinstance(i, dict) and i.get('type') == 'function_call_output' for i in items)
+        tool_name, content = self._plan(tools, seen, body.get('tool_choice'), schema)
+
+        n = self._next_id()
+        if tool_name:
+            item = {'type': 'function_call', 'id': f'fc_mock_{n}', 'call_id': f'call_mock_{n}',
+                    'name': tool_name, 'arguments': content, 'status': 'completed'}
+        else:
+            item = {'type': 'message', 'id': f'msg_mock_{n}', 'role': 'assistant', 'status': 'completed',
+                    'content': [{'type': 'output_text', 'text': content, 'annotations': []}]}
+        input_tokens, output_tokens = _estimate_tokens(items), _estimate_tokens(content)
+        response = {
+            'id': f'resp_mock_{n}', 'object': 'response', 'created_at': CREATED, 'status': 'completed',
+            'model': body.get('model', 'mock'), 'output': [item], 'instructions': body.get('instructions'),
+            'tools': body.get('tools') or [], 'tool_choice': body.get('tool_choice') or 'auto',
+            'parallel_tool_calls': True, 'text': {'format': text_format or {'type': 'text'}},
+            'error': None, 'incomplete_details': None, 'metadata': {}, 'truncation': 'disabled',
+            'usage': {'input_tokens': input_tokens, 'output_tokens': output_tokens,
+                      'total_tokens': input_tokens + output_tokens,
+                      'input_tokens_details': {'cached_tokens': 0},
+                      'output_tokens_details': {'reasoning_tokens': 0}},
+        }
+        if not body.get('stream'):
+            return response
+
+        events: List[tuple] = []
+
+        def emit(kind: str, **data):
+            events.append((kind, {'type': kind, 'sequence_number': len(events), **data}))
+
+        in_progress = {**response, 'status': 'in_progress', 'output': [], 'usage': None}
+        emit('response.created', response=in_progress)
+        emit('response.in_progress', response=in_progress)
+        ids = {'item_id': item['id'], 'output_index': 0}
+        if tool_name:
+            emit('response.output_item.added', output_index=0, item={**item, 'arguments': '', 'status': 'in_progress'})
+            emit('response.function_call_arguments.delta', delta=content, **ids)
+            emit('response.function_call_arguments.done', arguments=content, **ids)
+        else:
+            part = {'type': 'output_text', 'text': '', 'annotations': []}
+            emit('response.output_item.added', output_index=0, item={**item, 'content': [], 'status': 'in_progress'})
+            emit('response.content_part.added', content_index=0, part=part, **ids)
+            for piece in _split(content):
+                emit('response.output_text.delta', content_index=0, delta=piece, logprobs=[], **ids)
+            emit('response.output_text.done', content_index=0, text=content, logprobs=[], **ids)
+            emit('response.content_part.done', content_index=0, part={**part, 'text': content}, **ids)
+        emit('response.output_item.done', output_index=0, item=item)
+        emit('response.completed', response=response)
+        return events
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, status: int, payload: dict):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b'{}')
+                except ValueError:
+                    return self._send_json(400, {'error': {'message': 'Invalid JSON body', 'type': 'invalid_request_error'}})
+
+                key = (self.headers.get('Authorization') or '').replace('Bearer ', '', 1)
+                with mock._lock:
+                    mock.requests[key] += 1
+
+                path = self.path.split('?', 1)[0].rstrip('/')
+                if path.endswith('/chat/completions'):
+                    result = mock.chat_completion(body)
+                elif path.endswith('/responses'):
+                    result = mock.response(body)
+                else:
+                    return self._send_json(404, {'error': {'message': f'Mock has no {path}', 'type': 'not_found'}})
+
+                if isinstance(result, dict):
+                    return self._send_json(200, result)
+
+                # Streaming: SSE without Content-Length, connection closed at the end
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Connection', 'close')
+                self.end_headers()
+                for event, data in result:
+                    prefix = f'event: {event}\n' if event else ''
+                    self.wfile.write(f'{prefix}data: {json.dumps(data)}\n\n'.encode('utf-8'))
+                if path.endswith('/chat/completions'):
+                    self.wfile.write(b'data: [DONE]\n\n')
+                self.wfile.flush()
+                self.close_connection = True
+
+        return Handler
+
+
+def _split(text: str, pieces: int = 3) -> List[str]:
+    size = max(1, -(-len(text) // pieces))
+    return [text[i:i + size] for i in range(0, len(text), size)] or ['']
+
+
+def run_oracle(scenario: Scenario, server: MockLLMServer, python: str, timeout: float) -> SmokeResult:
+    """Run one oracle in a fresh working directory and collect its timings"""
+    # A per-oracle API key lets the shared mock count each oracle's requests
+    api_key = 'mock-' + hashlib.sha256(scenario.full_id.encode()).hexdigest()[:12]
+    import_only = scenario.full_id in IMPORT_ONLY
+
+    with tempfile.TemporaryDirectory(prefix='oracle-smoke-') as cwd:
+        report_path = os.path.join(cwd, '.oracle_smoke.json')
+        env = {
+            **os.environ,
+            'OPENAI_API_KEY': api_key,
+            'OPENAI_BASE_URL': server.base_url,
+            'OPENAI_API_BASE': server.base_url,
+            'OPENAI_AGENTS_DISABLE_TRACING': '1',
+            'PYTHONUNBUFFERED': '1',
+            'ORACLE_SMOKE_REPORT': report_path,
+        }
+        if import_only:
+            env['ORACLE_SMOKE_IMPORT_ONLY'] = '1'
+
+        process = subprocess.Popen(
+            [python, '-c', BOOTSTRAP, scenario.oracle_path],
+            cwd=cwd, env=env, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+        )
+        timed_out = False
+        try:
+            # Human-in-the-loop oracles read approvals from stdin
+            output, _ = process.communicate(input=b'yes\n' * 20, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            output, _ = process.communicate()
+            timed_out = True
+
+        try:
+            with open(report_path, 'r', encoding='utf-8') as f:
+                report = json.load(f)
+        except (OSError, ValueError):
+            report = {}
+
+    if timed_out:
+        status = 'timeout'
+    elif report.get('phase') == 'done' and process.returncode == 0:
+        status = 'ok'
+    elif report.get('phase') == 'import' or not report:
+        status = 'import-error'
+    else:
+        status = 'run-error'
+
+    rss_kb = report.get('peak_rss_kb')
+    return SmokeResult(
+        scenario_id=scenario.full_id,
+        status=status,
+        import_s=report.get('import_s'),
+        run_s=report.get('run_s'),
+        peak_rss_mb=rss_kb / 1024 if rss_kb else None,
+        requests=server.requests.get(api_key, 0),
+        note=report.get('error') or (f'import only: {IMPORT_ONLY[scenario.full_id]}' if import_only else ''),
+        output_tail='\n'.join(output.decode('utf-8', errors='replace').rstrip().splitlines()[-15:]),
+    )
+
+
+def python_oracles(only: Optional[List[str]] = None) -> List[Scenario]:
+    catalog = load_catalog()
+    for error in catalog.errors:
+        print(f'Warning: {error}', file=sys.stderr)
+    scenarios = [
+        s for s in catalog.scenarios.values()
+        if catalog.packages[s.package_id].get('language') == 'python'
+        and s.oracle_exists and s.oracle_path.endswith('.py')
+    ]
+    if only:
+        unknown = set(only) - {s.full_id for s in scenarios}
+        if unknown:
+            raise KeyError(f"No Python oracle for: {', '.join(sorted(unknown))}")
+        scenarios = [s for s in scenarios if s.full_id in only]
+    return scenarios
+
+
+def _fmt(value: Optional[float], spec: str, unit: str) -> str:
+    return format(value, spec) + unit if value is not None else '-'
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Smoke-run Python oracles against a local mock LLM')
+    parser.add_argument('--only', action='append', metavar='ID', help='Run only this package-id:scenario-id (repeatable)')
+    parser.add_argument('--jobs', type=int, default=min(8, os.cpu_count() or 1), help='Oracles run in parallel')
+    parser.add_argument('--timeout', type=float, default=120, help='Seconds before an oracle is killed (default: 120)')
+    parser.add_argument('--python', default=sys.executable, help='Interpreter with the oracle frameworks installed')
+    parser.add_argument('--reply', default=DEFAULT_REPLY, help='Canned text the mock returns')
+    parser.add_argument('--json', metavar='PATH', help='Also write results as JSON')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    try:
+        scenarios = python_oracles(args.only)
+    except KeyError as e:
+        print(f'Error: {e.args[0]}', file=sys.stderr)
+        return 1
+
+    print(f'Running {len(scenarios)} Python oracle(s) with {max(1, args.jobs)} job(s)\n')
+    start = time.perf_counter()
+    with MockLLMServer(args.reply) as server, ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = list(pool.map(lambda s: run_oracle(s, server, args.python, args.timeout), scenarios))
+    elapsed = time.perf_counter() - start
+
+    print(f"{'Oracle':<36} {'Status':<13} {'Import':>8} {'Run':>8} {'Peak RSS':>10} {'LLM calls':>10}")
+    for r in results:
+        print(f'{r.scenario_id:<36} {r.status:<13} {_fmt(r.import_s, ".2f", "s"):>8} {_fmt(r.run_s, ".2f", "s"):>8} '
+              f'{_fmt(r.peak_rss_mb, ".0f", " MB"):>10} {r.requests:>10}')
+
+    failures = [r for r in results if r.status != 'ok']
+    for r in results:
+        if r.note and r.status == 'ok':
+            print(f'\n{r.scenario_id}: {r.note}')
+    for r in failures:
+        print(f'\n--- {r.scenario_id} ({r.status}) {r.note}\n{r.output_tail}')
+
+    print(f'\n{len(results) - len(failures)}/{len(results)} oracles ok in {elapsed:.1f}s')
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump([r._asdict() for r in results], f, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
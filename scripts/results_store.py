@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+SQLite results store for cross-run analytics
+
+Ingests oneshot scenario directories (workspace/<run-id>/oneshot/<config>/<scenario>/)
+into one SQLite database: aggregated verdicts, per-model verdicts, Tool Result
+token counts and elapsed time (left empty for cached tool results, so latency
+averages only cover live MCP calls). Ingestion is incremental: a scenario is re-read
+only when its evaluation file changed or the token counting method differs.
+
+Usage:
+    python scripts/results_store.py ingest sample_workspace workspace
+    python scripts/results_store.py trend --config deepcon
+    python scripts/results_store.py models
+"""
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_results import (  # noqa: E402
+    EVALUATION_FILE, ONESHOT_RESULT_FILE, ResultTable, ScenarioResult,
+    count_tool_result_tokens, iter_run_dirs, token_counting_method,
+)
+
+DEFAULT_DB = os.path.join('.cache', 'results.sqlite')
+FINAL_RESULT_FILE = 'final_result.md'
+SCHEMA_VERSION = 1
+
+_ELAPSED_RE = re.compile(r'\*\*Total Elapsed Time\*\*: ([\d.]+)s')
+_FIELD_RE = re.compile(r'^\*\*(MCP Server|Tool Called|Cache Hit)\*\*: (.+)$', re.MULTILINE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id                INTEGER PRIMARY KEY,
+    run_id            TEXT NOT NULL,
+    mode              TEXT NOT NULL,
+    config            TEXT NOT NULL,
+    scenario          TEXT NOT NULL,
+    passed            INTEGER NOT NULL,
+    final_score       REAL NOT NULL,
+    average_score     REAL,
+    completeness_rate REAL,
+    relevance_rate    REAL,
+    consensus         INTEGER,
+    tokens            INTEGER NOT NULL,
+    token_method      TEXT NOT NULL,
+    elapsed_ms        REAL,
+    mcp_server        TEXT,
+    tool              TEXT,
+    cache_hit         INTEGER,
+    evaluated_at      TEXT,
+    source_mtime_ns   INTEGER NOT NULL,
+    UNIQUE (run_id, mode, config, scenario)
+);
+CREATE INDEX IF NOT EXISTS results_config_run ON results (config, run_id);
+CREATE INDEX IF NOT EXISTS results_scenario ON results (scenario, config);
+
+CREATE TABLE IF NOT EXISTS verdicts (
+    result_id     INTEGER NOT NULL REFERENCES results (id) ON DELETE CASCADE,
+    model         TEXT NOT NULL,
+    completeness  INTEGER,
+    relevance     INTEGER,
+    overall_score REAL,
+    confidence    TEXT,
+    PRIMARY KEY (result_id, model)
+);
+CREATE INDEX IF NOT EXISTS verdicts_model ON verdicts (model);
+"""
+
+
+class IngestStats(NamedTuple):
+    added: int
+    updated: int
+    unchanged: int
+
+
+class TrendPoint(NamedTuple):
+    run_id: str
+    config: str
+    total: int
+    passed: int
+    avg_score: float
+    avg_tokens: float
+
+
+class ModelStats(NamedTuple):
+    model: str
+    verdicts: int
+    completeness_rate: float
+    relevance_rate: float
+    avg_score: float
+
+
+def _read_text(path: str) -> str:
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            return f.read()
+    except OSError:
+        return ''
+
+
+def _iter_scenario_dirs(run_dirs: Iterable[str]) -> Iterator[Tuple[str, str, str, str]]:
+    """Yield (run_id, config, scenario, path) for every oneshot scenario directory"""
+    for run_dir in run_dirs:
+        run_id = os.path.basename(os.path.normpath(run_dir))
+        oneshot_dir = os.path.join(run_dir, 'oneshot')
+        with os.scandir(oneshot_dir) as configs:
+            config_entries = sorted((e for e in configs if e.is_dir()), key=lambda e: e.name)
+        for config_entry in config_entries:
+            with os.scandir(config_entry.path) as scenarios:
+                scenario_entries = sorted((e for e in scenarios if e.is_dir()), key=lambda e: e.name)
+            for scenario_entry in scenario_entries:
+                yield run_id, config_entry.name, scenario_entry.name, scenario_entry.path
+
+
+class ResultsStore:
+    """Incrementally maintained SQLite database of oneshot results"""
+
+    def __init__(self, path: str = DEFAULT_DB):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA foreign_keys = ON')
+        self.conn.execute('PRAGMA journal_mode = WAL')
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise RuntimeError(f'{path} has schema version {version}, expected {SCHEMA_VERSION}')
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> 'ResultsStore':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def ingest(self, paths: Iterable[str]) -> IngestStats:
+        """Add or refresh every evaluated scenario under the given runs or workspace roots"""
+        method = token_counting_method()
+        known = {
+            (run_id, config, scenario): (row_id, mtime_ns, token_method)
+            for row_id, run_id, config, scenario, mtime_ns, token_method in self.conn.execute(
+                "SELECT id, run_id, config, scenario, source_mtime_ns, token_method FROM results WHERE mode = 'oneshot'"
+            )
+        }
+        added = updated = unchanged = 0
+
+        with self.conn:
+            for run_id, config, scenario, path in _iter_scenario_dirs(iter_run_dirs(paths)):
+                evaluation_path = os.path.join(path, EVALUATION_FILE)
+                try:
+                    mtime_ns = os.stat(evaluation_path).st_mtime_ns
+                except OSError:
+                    continue
+
+                previous = known.get((run_id, config, scenario))
+                if previous and previous[1] == mtime_ns and previous[2] == method:
+                    unchanged += 1
+                    continue
+
+                try:
+                    with open(evaluation_path, 'r', encoding='utf-8') as f:
+                        evaluation = json.load(f)
+                except (OSError, ValueError):
+                    continue
+
+                if previous:
+                    self.conn.execute('DELETE FROM results WHERE id = ?', (previous[0],))
+                    updated += 1
+                else:
+                    added += 1
+                self._insert(run_id, config, scenario, path, evaluation, mtime_ns, method)
+
+        return IngestStats(added, updated, unchanged)
+
+    def _insert(self, run_id: str, config: str, scenario: str, path: str,
+                evaluation: dict, mtime_ns: int, method: str):
+        aggregated = evaluation.get('aggregated') or {}
+        result_path = os.path.join(path, ONESHOT_RESULT_FILE)
+        try:
+            tokens = count_tool_result_tokens(result_path)
+        except OSError:
+            tokens = 0
+
+        # Only the header of oneshot_result.md is needed for server and tool
+        header = _read_text(result_path)[:2000]
+        fields = dict(_FIELD_RE.findall(header))
+        cache_hit = fields.get('Cache Hit', '').strip() == 'yes'
+        elapsed = None if cache_hit else _ELAPSED_RE.search(_read_text(os.path.join(path, FINAL_RESULT_FILE)))
+
+        cursor = self.conn.execute(
+            """INSERT INTO results (run_id, mode, config, scenario, passed, final_score, average_score,
+                                    completeness_rate, relevance_rate, consensus, tokens, token_method,
+                                    elapsed_ms, mcp_server, tool, cache_hit, evaluated_at, source_mtime_ns)
+               VALUES (?, 'oneshot', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                run_id, config, scenario,
+                1 if aggregated.get('pass') else 0,
+                float(aggregated.get('final_score', 0) or 0),
+                aggregated.get('average_score'),
+                aggregated.get('completeness_rate'),
+                aggregated.get('relevance_rate'),
+                None if evaluation.get('consensus') is None else int(bool(evaluation.get('consensus'))),
+                tokens, method,
+                float(elapsed.group(1)) * 1000 if elapsed else None,
+                fields.get('MCP Server', '').strip() or None,
+                fields.get('Tool Called', '').strip() or None,
+                1 if cache_hit else 0,
+                evaluation.get('timestamp'),
+                mtime_ns,
+            ),
+        )
+        self.conn.executemany(
+            """INSERT OR REPLACE INTO verdicts (result_id, model, completeness, relevance, overall_score, confidence)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    cursor.lastrowid, m.get('model'),
+                    None if m.get('completeness') is None else int(bool(m['completeness'])),
+                    None if m.get('relevance') is None else int(bool(m['relevance'])),
+                    m.get('overall_score'),
+                    m.get('confidence'),
+                )
+                for m in evaluation.get('models') or [] if m.get('model')
+            ],
+        )
+
+    def load_table(self, latest_only: bool = True, runs: Optional[List[str]] = None) -> ResultTable:
+        """
+        Results as a ResultTable, like bench_results.load_table.
+
+        With latest_only, the newest run per (config, scenario) wins; run ids
+        are timestamped, so the greatest run_id is the newest.
+        """
+        where, params = "WHERE mode = 'oneshot'", []
+        if runs:
+            where += f" AND run_id IN ({','.join('?' * len(runs))})"
+            params.extend(runs)
+        if latest_only:
+            query = f"""
+                SELECT run_id, config, scenario, passed, final_score, tokens FROM (
+                    SELECT *, ROW_NUMBER() OVER (PARTITION BY config, scenario ORDER BY run_id DESC) AS rn
+                    FROM results {where}
+                ) WHERE rn = 1 ORDER BY config, scenario"""
+        else:
+            query = f'SELECT run_id, config, scenario, passed, final_score, tokens FROM results {where} ORDER BY run_id, config, scenario'
+
+        return ResultTable.from_results(
+            ScenarioResult(run_id, config, scenario, bool(passed), final_score, tokens)
+            for run_id, config, scenario, passed, final_score, tokens in self.conn.execute(query, params)
+        )
+
+    def trend(self, config: Optional[str] = None) -> List[TrendPoint]:
+        """Pass counts, scores and tokens per (run, config), oldest run first"""
+        where, params = "WHERE mode = 'oneshot'", []
+        if config:
+            where += ' AND config = ?'
+            params.append(config)
+        rows = self.conn.execute(
+            f"""SELECT run_id, config, COUNT(*), SUM(passed), AVG(final_score), AVG(tokens)
+                FROM results {where} GROUP BY run_id, config ORDER BY run_id, config""",
+            params,
+        )
+        return [TrendPoint(*row) for row in rows]
+
+    def model_stats(self) -> List[ModelStats]:
+        """How often each judge model marked results complete and relevant"""
+        rows = self.conn.execute(
+            """SELECT model, COUNT(*), AVG(completeness), AVG(relevance), AVG(overall_score)
+               FROM verdicts GROUP BY model ORDER BY model"""
+        )
+        return [ModelStats(model, n, comp or 0.0, rel or 0.0, score or 0.0) for model, n, comp, rel, score in rows]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Context Bench results store')
+    parser.add_argument('--db', default=DEFAULT_DB, help=f'SQLite database path (default: {DEFAULT_DB})')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    ingest = sub.add_parser('ingest', help='Add new or changed results from run directories')
+    ingest.add_argument('paths', nargs='*', default=['workspace'],
+                        help='Run directories or workspace roots (default: workspace)')
+
+    trend = sub.add_parser('trend', help='Pass rate per run and config')
+    trend.add_argument('--config', help='Only this config')
+
+    sub.add_parser('models', help='Per-model judge statistics')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    with ResultsStore(args.db) as store:
+        if args.command == 'ingest':
+            stats = store.ingest(args.paths)
+            print(f'{args.db}: {stats.added} added, {stats.updated} updated, {stats.unchanged} unchanged')
+        elif args.command == 'trend':
+            for p in store.trend(args.config):
+                print(f'{p.run_id:<22} {p.config:<14} {p.passed:>3}/{p.total:<3} score {p.avg_score:4.2f}  avg {int(p.avg_tokens + 0.5):>8,} tokens')
+        elif args.command == 'models':
+            for m in store.model_stats():
+                print(f'{m.model:<32} {m.verdicts:>5} verdicts  complete {m.completeness_rate:6.1%}  relevant {m.relevance_rate:6.1%}  score {m.avg_score:4.2f}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Scenario catalog for Python tooling
+
+Reads the same scenarios/*.yaml package files as harness/scenario-loader.ts
+and resolves each scenario's oracle file. Parsed files are cached per process
+and re-read only when their mtime changes.
+
+Usage:
+    python scripts/scenario_catalog.py                        # list scenarios and oracle status
+    python scripts/scenario_catalog.py --validate             # exit 1 if any package or oracle is broken
+    python scripts/scenario_catalog.py --oracle agno:trend-scout
+"""
+import argparse
+import os
+import sys
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import yaml
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCENARIOS_DIR = os.path.join(REPO_ROOT, 'scenarios')
+
+
+class Scenario(NamedTuple):
+    full_id: str
+    package_id: str
+    query: str
+    oracle: Optional[str]       # Path as written in the YAML (relative to the repo root)
+    oracle_path: Optional[str]  # Absolute path
+    oracle_exists: bool
+    sources: List[str]
+
+
+class Catalog(NamedTuple):
+    packages: Dict[str, dict]
+    scenarios: Dict[str, Scenario]
+    errors: List[str]
+
+
+# file path -> (mtime_ns, spec or None, error or None)
+_parsed: Dict[str, Tuple[int, Optional[dict], Optional[str]]] = {}
+
+
+def _parse_package(path: str) -> Tuple[Optional[dict], Optional[str]]:
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _parsed.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1], cached[2]
+
+    spec, error = None, None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+        if isinstance(data, dict) and data.get('package-id') and isinstance(data.get('scenarios'), list):
+            spec = data
+        else:
+            error = f'{path}: missing required fields'
+    except (OSError, yaml.YAMLError) as e:
+        error = f'{path}: {e}'
+
+    _parsed[path] = (mtime_ns, spec, error)
+    return spec, error
+
+
+def load_catalog(scenarios_dir: str = SCENARIOS_DIR) -> Catalog:
+    """Packages keyed by id, scenarios keyed by 'package-id:scenario-id', and problems found"""
+    root = os.path.dirname(os.path.abspath(scenarios_dir))
+    packages: Dict[str, dict] = {}
+    scenarios: Dict[str, Scenario] = {}
+    errors: List[str] = []
+
+    if not os.path.isdir(scenarios_dir):
+        return Catalog(packages, scenarios, [f'Scenarios directory not found: {scenarios_dir}'])
+
+    for name in sorted(os.listdir(scenarios_dir)):
+        if not name.endswith('.yaml'):
+            continue
+        spec, error = _parse_package(os.path.join(scenarios_dir, name))
+        if spec is None:
+            errors.append(error)
+            continue
+
+        package_id = spec['package-id']
+        if package_id in packages:
+            errors.append(f'{name}: duplicate package-id {package_id}')
+            continue
+        packages[package_id] = spec
+
+        for item in spec['scenarios']:
+            full_id = f"{package_id}:{item.get('id')}"
+            if full_id in scenarios:
+                errors.append(f'{name}: duplicate scenario id {full_id}')
+                continue
+            oracle = item.get('oracle') or None
+            oracle_path = os.path.join(root, oracle) if oracle else None
+            oracle_exists = bool(oracle_path) and os.path.isfile(oracle_path)
+            if oracle and not oracle_exists:
+                errors.append(f'{full_id}: oracle not found: {oracle}')
+            if not item.get('query'):
+                errors.append(f'{full_id}: missing query')
+            scenarios[full_id] = Scenario(
+                full_id=full_id,
+                package_id=package_id,
+                query=item.get('query') or '',
+                oracle=oracle,
+                oracle_path=oracle_path,
+                oracle_exists=oracle_exists,
+                sources=list(item.get('sources') or []),
+            )
+
+    if not packages:
+        errors.append(f'No package specs found in {scenarios_dir}')
+    return Catalog(packages, scenarios, errors)
+
+
+def read_oracle(full_id: str, catalog: Optional[Catalog] = None) -> str:
+    """Oracle source for a scenario; raises KeyError or FileNotFoundError"""
+    catalog = catalog or load_catalog()
+    scenario = catalog.scenarios[full_id]
+    if not scenario.oracle_exists:
+        raise FileNotFoundError(f'No oracle for {full_id}: {scenario.oracle or "not declared"}')
+    with open(scenario.oracle_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='List and validate Context Bench scenarios')
+    parser.add_argument('--scenarios-dir', default=SCENARIOS_DIR, help='Scenario package directory')
+    parser.add_argument('--validate', action='store_true', help='Exit with status 1 if any problem is found')
+    parser.add_argument('--oracle', metavar='ID', help='Print the oracle file of package-id:scenario-id')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    catalog = load_catalog(args.scenarios_dir)
+
+    if args.oracle:
+        try:
+            print(read_oracle(args.oracle, catalog), end='')
+        except (KeyError, FileNotFoundError) as e:
+            print(f'Error: {e}', file=sys.stderr)
+            return 1
+        return 0
+
+    if not args.validate:
+        for scenario in catalog.scenarios.values():
+            status = 'ok' if scenario.oracle_exists else 'missing oracle'
+            print(f'{scenario.full_id:40s} {scenario.oracle or "-":45s} {status}')
+        print(f'\n{len(catalog.scenarios)} scenarios in {len(catalog.packages)} packages')
+
+    for error in catalog.errors:
+        print(f'Warning: {error}', file=sys.stderr)
+    if args.validate:
+        print(f'{len(catalog.scenarios)} scenarios checked, {len(catalog.errors)} problems')
+        return 1 if catalog.errors else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
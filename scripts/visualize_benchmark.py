@@ -1,10 +1,28 @@
 #!/usr/bin/env python3
 """
 Visualize Context Bench benchmark statistics
+
+Reads oneshot results from one or more run directories (or a workspace root
+containing runs) and renders accuracy / token usage charts. When a scenario
+appears in several runs for the same config, the latest run wins.
+
+Usage:
+    python scripts/visualize_benchmark.py workspace/
+    python scripts/visualize_benchmark.py sample_workspace/run-2025-11-06-1628 sample_workspace/run-2025-11-06-1632
+    python scripts/visualize_benchmark.py workspace/ --db .cache/results.sqlite
 """
+import argparse
+import sys
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
-from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_results import load_table, summarize, token_counting_method  # noqa: E402
+from results_store import ResultsStore  # noqa: E402
 
 # Set clean white theme style
 plt.style.use('default')
@@ -19,173 +37,228 @@ plt.rcParams['axes.labelcolor'] = '#000000'
 plt.rcParams['xtick.color'] = '#000000'
 plt.rcParams['ytick.color'] = '#000000'
 
-# Data from README
-servers = ['Deepcon', 'Context7', 'NIA', 'Exa', 'Baseline']
-scenarios_passed = [18, 13, 11, 5, 0]
-total_scenarios = 20
-
-# Token usage data (excluding baseline)
-server_tokens = ['Context7', 'Exa', 'Deepcon', 'NIA']
-avg_tokens = [5626, 4753, 2365, 1873]
-total_tokens = [112515, 95065, 47290, 37457]
-
-# Calculate accuracy percentages
-accuracy_pct = [(passed / total_scenarios) * 100 for passed in scenarios_passed]
-
-# Create output directory
-output_dir = Path('visualizations')
-output_dir.mkdir(exist_ok=True)
-
-# Clean professional color palette
-colors = ['#10b981', '#3b82f6', '#8b5cf6', '#ef4444', '#6b7280']  # Professional colors
-
-# ============================================================================
-# Chart 1: Accuracy Comparison (Scenarios Passed)
-# ============================================================================
-fig, ax = plt.subplots(figsize=(10, 6))
-fig.patch.set_facecolor('#ffffff')
-ax.set_facecolor('#ffffff')
-
-bars = ax.barh(servers, scenarios_passed, color=colors, edgecolor='#333333', linewidth=1.2, alpha=0.85)
-
-# Add value labels on bars
-for i, (bar, pct) in enumerate(zip(bars, accuracy_pct)):
-    width = bar.get_width()
-    ax.text(width + 0.3, bar.get_y() + bar.get_height()/2,
-            f'{int(width)}/20 ({pct:.0f}%)',
-            ha='left', va='center', fontweight='bold', fontsize=11,
-            color='#000000')
-
-ax.set_xlabel('Scenarios Passed (out of 20)', fontsize=12, fontweight='bold')
-ax.set_title('MCP Server Accuracy Comparison\nAI Framework Integration Scenarios',
-             fontsize=14, fontweight='bold', pad=20)
-ax.set_xlim(0, 22)
-ax.grid(axis='x', alpha=0.3, linewidth=0.8)
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-ax.spines['left'].set_color('#333333')
-ax.spines['bottom'].set_color('#333333')
-
-plt.tight_layout()
-plt.savefig(output_dir / 'accuracy_comparison.png', dpi=300, bbox_inches='tight', facecolor='#ffffff')
-print(f"✓ Generated: {output_dir / 'accuracy_comparison.png'}")
-
-# ============================================================================
-# Chart 2: Token Usage Comparison
-# ============================================================================
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-fig.patch.set_facecolor('#ffffff')
-
-# Average tokens per scenario
-colors_tokens = ['#3b82f6', '#ef4444', '#10b981', '#8b5cf6']
-ax1.set_facecolor('#ffffff')
-bars1 = ax1.barh(server_tokens, avg_tokens, color=colors_tokens, edgecolor='#333333', linewidth=1.2, alpha=0.85)
-
-for bar in bars1:
-    width = bar.get_width()
-    ax1.text(width + 100, bar.get_y() + bar.get_height()/2,
-            f'{int(width):,}',
-            ha='left', va='center', fontweight='bold', fontsize=10)
-
-ax1.set_xlabel('Average Tokens per Scenario', fontsize=11, fontweight='bold')
-ax1.set_title('Average Token Usage', fontsize=12, fontweight='bold')
-ax1.grid(axis='x', alpha=0.3, linewidth=0.8)
-ax1.spines['top'].set_visible(False)
-ax1.spines['right'].set_visible(False)
-ax1.spines['left'].set_color('#333333')
-ax1.spines['bottom'].set_color('#333333')
-
-# Total tokens
-ax2.set_facecolor('#ffffff')
-bars2 = ax2.barh(server_tokens, total_tokens, color=colors_tokens, edgecolor='#333333', linewidth=1.2, alpha=0.85)
-
-for bar in bars2:
-    width = bar.get_width()
-    ax2.text(width + 2000, bar.get_y() + bar.get_height()/2,
-            f'{int(width):,}',
-            ha='left', va='center', fontweight='bold', fontsize=10)
-
-ax2.set_xlabel('Total Tokens (20 scenarios)', fontsize=11, fontweight='bold')
-ax2.set_title('Total Token Usage', fontsize=12, fontweight='bold')
-ax2.grid(axis='x', alpha=0.3, linewidth=0.8)
-ax2.spines['top'].set_visible(False)
-ax2.spines['right'].set_visible(False)
-ax2.spines['left'].set_color('#333333')
-ax2.spines['bottom'].set_color('#333333')
-
-plt.tight_layout()
-plt.savefig(output_dir / 'token_usage_comparison.png', dpi=300, bbox_inches='tight', facecolor='#ffffff')
-print(f"✓ Generated: {output_dir / 'token_usage_comparison.png'}")
-
-# ============================================================================
-# Chart 3: Efficiency Chart (Accuracy vs Token Usage)
-# ============================================================================
-fig, ax = plt.subplots(figsize=(10, 8))
-fig.patch.set_facecolor('#ffffff')
-ax.set_facecolor('#ffffff')
-
-# Map data for scatter plot (excluding baseline)
-server_efficiency = {
-    'Deepcon': {'passed': 18, 'avg_tokens': 2365},
-    'Context7': {'passed': 13, 'avg_tokens': 5626},
-    'NIA': {'passed': 11, 'avg_tokens': 1873},
-    'Exa': {'passed': 5, 'avg_tokens': 4753}
-}
-
-colors_scatter = {'Deepcon': '#10b981', 'Context7': '#3b82f6',
-                  'NIA': '#8b5cf6', 'Exa': '#ef4444'}
-sizes = [400, 300, 300, 300]
-
-for i, (server, data) in enumerate(server_efficiency.items()):
-    ax.scatter(data['avg_tokens'], data['passed'],
-              s=sizes[i], alpha=0.75, color=colors_scatter[server],
-              edgecolors='#333333', linewidth=2, label=server)
-
-    # Add labels
-    ax.annotate(server,
-               xy=(data['avg_tokens'], data['passed']),
-               xytext=(10, 10), textcoords='offset points',
-               fontsize=11, fontweight='bold',
-               bbox=dict(boxstyle='round,pad=0.5', facecolor=colors_scatter[server],
-                        alpha=0.3, edgecolor='#333333', linewidth=1.2))
-
-# Add quadrant lines
-ax.axhline(y=10, color='#999999', linestyle='--', alpha=0.5, linewidth=1.5)
-ax.axvline(x=3500, color='#999999', linestyle='--', alpha=0.5, linewidth=1.5)
-
-# Annotate quadrants
-ax.text(5500, 17, 'High Accuracy\nHigh Tokens',
-        fontsize=9, alpha=0.6, ha='center', style='italic', color='#666666')
-ax.text(2000, 17, 'High Accuracy\nLow Tokens\n(IDEAL)',
-        fontsize=9, alpha=0.8, ha='center', style='italic', fontweight='bold', color='#10b981')
-ax.text(5500, 7, 'Low Accuracy\nHigh Tokens',
-        fontsize=9, alpha=0.6, ha='center', style='italic', color='#666666')
-ax.text(2000, 7, 'Low Accuracy\nLow Tokens',
-        fontsize=9, alpha=0.6, ha='center', style='italic', color='#666666')
-
-ax.set_xlabel('Average Tokens per Scenario', fontsize=12, fontweight='bold')
-ax.set_ylabel('Scenarios Passed (out of 20)', fontsize=12, fontweight='bold')
-ax.set_title('MCP Server Efficiency: Accuracy vs Token Usage\n(Top-left corner = ideal)',
-             fontsize=14, fontweight='bold', pad=20)
-ax.set_ylim(0, 20)
-ax.set_xlim(1000, 6500)
-ax.grid(True, alpha=0.25, linewidth=0.8)
-ax.spines['top'].set_visible(False)
-ax.spines['right'].set_visible(False)
-ax.spines['left'].set_color('#333333')
-ax.spines['bottom'].set_color('#333333')
-
-legend = ax.legend(loc='lower right', fontsize=11, framealpha=0.95, facecolor='#ffffff', edgecolor='#cccccc')
-
-plt.tight_layout()
-plt.savefig(output_dir / 'efficiency_scatter.png', dpi=300, bbox_inches='tight', facecolor='#ffffff')
-print(f"✓ Generated: {output_dir / 'efficiency_scatter.png'}")
-
-print("\n" + "="*60)
-print("All visualizations generated successfully!")
-print("="*60)
-print(f"\nOutput directory: {output_dir.absolute()}")
-print("\nGenerated files:")
-print("  1. accuracy_comparison.png - Horizontal bar chart of scenarios passed")
-print("  2. token_usage_comparison.png - Token usage metrics")
-print("  3. efficiency_scatter.png - Accuracy vs token efficiency")
+DISPLAY_NAMES = {'nia': 'NIA', 'context7': 'Context7', 'deepcon': 'Deepcon', 'exa': 'Exa', 'baseline': 'Baseline'}
+SERVER_COLORS = {'deepcon': '#10b981', 'context7': '#3b82f6', 'nia': '#8b5cf6', 'exa': '#ef4444', 'baseline': '#6b7280'}
+FALLBACK_COLORS = ['#f59e0b', '#06b6d4', '#ec4899', '#84cc16', '#14b8a6']
+
+
+def display_name(config):
+    return DISPLAY_NAMES.get(config, config.replace('-', ' ').title())
+
+
+def server_colors(configs):
+    colors = []
+    for i, config in enumerate(configs):
+        colors.append(SERVER_COLORS.get(config, FALLBACK_COLORS[i % len(FALLBACK_COLORS)]))
+    return colors
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Visualize Context Bench oneshot results')
+    parser.add_argument('paths', nargs='*', default=['workspace'],
+                        help='Run directories or workspace roots (default: workspace)')
+    parser.add_argument('--output-dir', default='visualizations', help='Directory for generated charts')
+    parser.add_argument('--all-runs', action='store_true',
+                        help='Count every run instead of only the latest result per scenario')
+    parser.add_argument('--db', metavar='PATH',
+                        help='Ingest the paths into this results store and read results from it')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if args.db:
+        with ResultsStore(args.db) as store:
+            stats = store.ingest(args.paths)
+            print(f"{args.db}: {stats.added} added, {stats.updated} updated, {stats.unchanged} unchanged")
+            table = store.load_table(latest_only=not args.all_runs)
+    else:
+        table = load_table(args.paths, latest_only=not args.all_runs)
+    summaries = summarize(table)
+    if not summaries:
+        print(f"No oneshot evaluation results found under: {', '.join(args.paths)}")
+        return 1
+
+    configs = [s.config for s in summaries]
+    servers = [display_name(c) for c in configs]
+    scenarios_passed = np.array([s.passed for s in summaries])
+    scenario_totals = np.array([s.total for s in summaries])
+    total_scenarios = int(scenario_totals.max())
+    avg_tokens = np.array([s.avg_tokens for s in summaries])
+    total_tokens = np.array([s.total_tokens for s in summaries])
+
+    # Configs without MCP context (baseline) carry no tool output
+    has_tokens = total_tokens > 0
+    server_tokens = [s for s, keep in zip(servers, has_tokens) if keep]
+    token_colors = [c for c, keep in zip(server_colors(configs), has_tokens) if keep]
+
+    # Calculate accuracy percentages
+    accuracy_pct = scenarios_passed / scenario_totals * 100
+
+    print(f"Loaded {len(table)} scenario results across {len(table.runs)} run(s) (tokens: {token_counting_method()})")
+    for s in summaries:
+        print(f"  {display_name(s.config):<12} {s.passed:>3}/{s.total:<3} avg {int(s.avg_tokens + 0.5):>8,} tokens  total {s.total_tokens:>10,}")
+
+    # Create output directory
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Clean professional color palette
+    colors = server_colors(configs)
+
+    # ============================================================================
+    # Chart 1: Accuracy Comparison (Scenarios Passed)
+    # ============================================================================
+    fig, ax = plt.subplots(figsize=(10, 6))
+    fig.patch.set_facecolor('#ffffff')
+    ax.set_facecolor('#ffffff')
+
+    bars = ax.barh(servers, scenarios_passed, color=colors, edgecolor='#333333', linewidth=1.2, alpha=0.85)
+
+    # Add value labels on bars
+    for bar, pct, total in zip(bars, accuracy_pct, scenario_totals):
+        width = bar.get_width()
+        ax.text(width + 0.3, bar.get_y() + bar.get_height()/2,
+                f'{int(width)}/{total} ({pct:.0f}%)',
+                ha='left', va='center', fontweight='bold', fontsize=11,
+                color='#000000')
+
+    ax.set_xlabel(f'Scenarios Passed (out of {total_scenarios})', fontsize=12, fontweight='bold')
+    ax.set_title('MCP Server Accuracy Comparison\nAI Framework Integration Scenarios',
+                 fontsize=14, fontweight='bold', pad=20)
+    ax.set_xlim(0, total_scenarios * 1.1)
+    ax.grid(axis='x', alpha=0.3, linewidth=0.8)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['left'].set_color('#333333')
+    ax.spines['bottom'].set_color('#333333')
+
+    plt.tight_layout()
+    plt.savefig(output_dir / 'accuracy_comparison.png', dpi=300, bbox_inches='tight', facecolor='#ffffff')
+    print(f"✓ Generated: {output_dir / 'accuracy_comparison.png'}")
+
+    # ============================================================================
+    # Chart 2: Token Usage Comparison
+    # ============================================================================
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+    fig.patch.set_facecolor('#ffffff')
+
+    # Average tokens per scenario
+    ax1.set_facecolor('#ffffff')
+    bars1 = ax1.barh(server_tokens, avg_tokens[has_tokens], color=token_colors, edgecolor='#333333', linewidth=1.2, alpha=0.85)
+
+    for bar in bars1:
+        width = bar.get_width()
+        ax1.text(width + avg_tokens.max() * 0.02, bar.get_y() + bar.get_height()/2,
+                f'{int(width):,}',
+                ha='left', va='center', fontweight='bold', fontsize=10)
+
+    ax1.set_xlabel('Average Tokens per Scenario', fontsize=11, fontweight='bold')
+    ax1.set_title('Average Token Usage', fontsize=12, fontweight='bold')
+    ax1.grid(axis='x', alpha=0.3, linewidth=0.8)
+    ax1.spines['top'].set_visible(False)
+    ax1.spines['right'].set_visible(False)
+    ax1.spines['left'].set_color('#333333')
+    ax1.spines['bottom'].set_color('#333333')
+
+    # Total tokens
+    ax2.set_facecolor('#ffffff')
+    bars2 = ax2.barh(server_tokens, total_tokens[has_tokens], color=token_colors, edgecolor='#333333', linewidth=1.2, alpha=0.85)
+
+    for bar in bars2:
+        width = bar.get_width()
+        ax2.text(width + total_tokens.max() * 0.02, bar.get_y() + bar.get_height()/2,
+                f'{int(width):,}',
+                ha='left', va='center', fontweight='bold', fontsize=10)
+
+    ax2.set_xlabel(f'Total Tokens ({total_scenarios} scenarios)', fontsize=11, fontweight='bold')
+    ax2.set_title('Total Token Usage', fontsize=12, fontweight='bold')
+    ax2.grid(axis='x', alpha=0.3, linewidth=0.8)
+    ax2.spines['top'].set_visible(False)
+    ax2.spines['right'].set_visible(False)
+    ax2.spines['left'].set_color('#333333')
+    ax2.spines['bottom'].set_color('#333333')
+
+    plt.tight_layout()
+    plt.savefig(output_dir / 'token_usage_comparison.png', dpi=300, bbox_inches='tight', facecolor='#ffffff')
+    print(f"✓ Generated: {output_dir / 'token_usage_comparison.png'}")
+
+    # ============================================================================
+    # Chart 3: Efficiency Chart (Accuracy vs Token Usage)
+    # ============================================================================
+    fig, ax = plt.subplots(figsize=(10, 8))
+    fig.patch.set_facecolor('#ffffff')
+    ax.set_facecolor('#ffffff')
+
+    # Map data for scatter plot (excluding baseline)
+    eff_passed = scenarios_passed[has_tokens]
+    eff_tokens = avg_tokens[has_tokens]
+
+    for i, server in enumerate(server_tokens):
+        # Summaries are sorted by accuracy, so the leader gets the larger marker
+        ax.scatter(eff_tokens[i], eff_passed[i],
+                  s=400 if i == 0 else 300, alpha=0.75, color=token_colors[i],
+                  edgecolors='#333333', linewidth=2, label=server)
+
+        # Add labels
+        ax.annotate(server,
+                   xy=(eff_tokens[i], eff_passed[i]),
+                   xytext=(10, 10), textcoords='offset points',
+                   fontsize=11, fontweight='bold',
+                   bbox=dict(boxstyle='round,pad=0.5', facecolor=token_colors[i],
+                            alpha=0.3, edgecolor='#333333', linewidth=1.2))
+
+    # Add quadrant lines
+    x_max = max(eff_tokens.max() * 1.15, 1) if eff_tokens.size else 1
+    x_min = eff_tokens.min() * 0.5 if eff_tokens.size else 0
+    x_mid = (x_min + x_max) / 2
+    y_mid = total_scenarios / 2
+    ax.axhline(y=y_mid, color='#999999', linestyle='--', alpha=0.5, linewidth=1.5)
+    ax.axvline(x=x_mid, color='#999999', linestyle='--', alpha=0.5, linewidth=1.5)
+
+    x_high = (x_mid + x_max) / 2
+    x_low = (x_min + x_mid) / 2
+    y_high = total_scenarios * 0.85
+    y_low = total_scenarios * 0.35
+
+    # Annotate quadrants
+    ax.text(x_high, y_high, 'High Accuracy\nHigh Tokens',
+            fontsize=9, alpha=0.6, ha='center', style='italic', color='#666666')
+    ax.text(x_low, y_high, 'High Accuracy\nLow Tokens\n(IDEAL)',
+            fontsize=9, alpha=0.8, ha='center', style='italic', fontweight='bold', color='#10b981')
+    ax.text(x_high, y_low, 'Low Accuracy\nHigh Tokens',
+            fontsize=9, alpha=0.6, ha='center', style='italic', color='#666666')
+    ax.text(x_low, y_low, 'Low Accuracy\nLow Tokens',
+            fontsize=9, alpha=0.6, ha='center', style='italic', color='#666666')
+
+    ax.set_xlabel('Average Tokens per Scenario', fontsize=12, fontweight='bold')
+    ax.set_ylabel(f'Scenarios Passed (out of {total_scenarios})', fontsize=12, fontweight='bold')
+    ax.set_title('MCP Server Efficiency: Accuracy vs Token Usage\n(Top-left corner = ideal)',
+                 fontsize=14, fontweight='bold', pad=20)
+    ax.set_ylim(0, total_scenarios)
+    ax.set_xlim(x_min, x_max)
+    ax.grid(True, alpha=0.25, linewidth=0.8)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['left'].set_color('#333333')
+    ax.spines['bottom'].set_color('#333333')
+
+    legend = ax.legend(loc='lower right', fontsize=11, framealpha=0.95, facecolor='#ffffff', edgecolor='#cccccc')
+
+    plt.tight_layout()
+    plt.savefig(output_dir / 'efficiency_scatter.png', dpi=300, bbox_inches='tight', facecolor='#ffffff')
+    print(f"✓ Generated: {output_dir / 'efficiency_scatter.png'}")
+
+    print("\n" + "="*60)
+    print("All visualizations generated successfully!")
+    print("="*60)
+    print(f"\nOutput directory: {output_dir.absolute()}")
+    print("\nGenerated files:")
+    print("  1. accuracy_comparison.png - Horizontal bar chart of scenarios passed")
+    print("  2. token_usage_comparison.png - Token usage metrics")
+    print("  3. efficiency_scatter.png - Accuracy vs token efficiency")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())